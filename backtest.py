@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+
+import sys
+from binance.exceptions import BinanceAPIException, BinanceRequestException
+
+def print_help():
+    print("Usage: backtest.py <arg1> <arg2> [--long-only]")
+    print("Description: This script backtests the RSI, MACD and Bollinger Bands signals of analyze.py over the full stored history of a trading pair.")
+
+if '-h' in sys.argv or '--help' in sys.argv:
+    print_help()
+    sys.exit(0)
+
+try:
+    import time
+    import numpy as np
+    import pandas as pd
+    from trading_tools.analyze import calculate_indicators
+    from klines import sync_klines, klines_frame
+
+    TRADING_FEE_PERCENT = 0.001  # 0.1% trading fee per trade
+
+    LONG = 1
+    NEUTRAL = 0
+    SHORT = -1
+
+    def signal_arrays(df):
+        """Evaluate the analyze_data() rules on every bar at once."""
+        close = df['close'].to_numpy()
+        rsi = df['rsi'].to_numpy()
+        macd = df['macd'].to_numpy()
+        macd_signal = df['macd_signal'].to_numpy()
+
+        # Comparisons against NaN warm-up values are False, so those bars stay NEUTRAL
+        signals = {
+            'RSI': np.where(rsi > 80, SHORT, np.where(rsi < 20, LONG, NEUTRAL)),
+            'MACD': np.where(macd > macd_signal, LONG, np.where(macd < macd_signal, SHORT, NEUTRAL)),
+            'Bollinger Bands': np.where(
+                close > df['bb_high'].to_numpy(), SHORT,
+                np.where(close < df['bb_low'].to_numpy(), LONG, NEUTRAL)
+            )
+        }
+        # Majority of the three rules; a tie counts as NEUTRAL
+        signals['Consensus'] = np.sign(sum(signals.values()))
+        return signals
+
+    def positions_from_signals(signal, long_only=False):
+        """LONG/SHORT set the position; NEUTRAL keeps the previous one."""
+        index = np.arange(len(signal))
+        last_signal = np.maximum.accumulate(np.where(signal != NEUTRAL, index, -1))
+        position = np.where(last_signal >= 0, signal[np.maximum(last_signal, 0)], NEUTRAL)
+        if long_only:
+            position = np.maximum(position, NEUTRAL)
+        return position
+
+    def run_backtest(close, signal, fee=TRADING_FEE_PERCENT, long_only=False):
+        """Trade each signal at its bar's close and report returns, drawdown and trades."""
+        position = positions_from_signals(signal, long_only)
+        previous = np.concatenate([[NEUTRAL], position[:-1]])
+
+        bar_returns = np.zeros(len(close))
+        bar_returns[1:] = close[1:] / close[:-1] - 1
+
+        # The position taken at a bar's close earns the next bar's return
+        turnover = np.abs(position - previous)
+        equity = np.cumprod((1 + previous * bar_returns) * (1 - turnover * fee))
+        drawdown = equity / np.maximum.accumulate(equity) - 1
+
+        return {
+            'Total return %': (equity[-1] - 1) * 100,
+            'Max drawdown %': drawdown.min() * 100,
+            'Trades': int(np.count_nonzero((position != previous) & (position != NEUTRAL))),
+            'Time in market %': np.count_nonzero(position) / len(position) * 100
+        }
+
+    def backtest(df, long_only=False):
+        """Backtest every signal rule over the indicator frame."""
+        close = df['close'].to_numpy()
+        results = {
+            name: run_backtest(close, signal, long_only=long_only)
+            for name, signal in signal_arrays(df).items()
+        }
+        results['Buy & hold'] = run_backtest(close, np.full(len(close), LONG))
+        table = pd.DataFrame(results).T
+        table['Trades'] = table['Trades'].astype(int)
+        return table
+
+    def main(symbol, interval, long_only):
+        stored, open_candles = sync_klines(symbol, interval)
+        df = klines_frame(stored)
+
+        start = time.perf_counter()
+        df = calculate_indicators(df)
+        results = backtest(df, long_only)
+        elapsed = time.perf_counter() - start
+
+        print(f"Backtest of {symbol} on {interval} timeframe: {len(df)} candles "
+              f"from {df['timestamp'].iloc[0]} to {df['timestamp'].iloc[-1]}")
+        print(results.to_string(float_format=lambda value: f"{value:.2f}"))
+        print(f"Computed in {elapsed:.3f} s")
+
+    if __name__ == "__main__":
+        args = [arg for arg in sys.argv[1:] if arg != '--long-only']
+        if len(args) != 2:
+            print("Usage: python backtest.py <trading-pair> <interval> [--long-only]")
+            print("Example: python backtest.py BTCUSDT 1h --long-only")
+        else:
+            main(args[0].upper(), args[1], '--long-only' in sys.argv)
+
+except BinanceAPIException as e:
+    print(f"Binance API Exception: {e}")
+except BinanceRequestException as e:
+    print(f"Binance Request Exception: {e}")
+except IndexError:
+    print("Error: Missing command line arguments.")
+    print_help()
+except Exception as e:
+    print(f"An unexpected error occurred: {e}")
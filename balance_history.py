@@ -0,0 +1,129 @@
+"""Append-only balance history for balance.py.
+
+Each sample is one fixed-width equity record (time, total value) plus one
+holding record per asset (time, asset, quantity, value), kept in two flat
+binary files per target currency. Both files are memory-mapped and sorted
+by time, so every query locates its window with a binary search and only
+touches the records inside it.
+"""
+
+import os
+
+import numpy as np
+
+HISTORY_DIR = os.environ.get(
+    'BALANCE_HISTORY_DIR',
+    os.path.join(os.path.expanduser('~'), '.cache', 'trading-tools', 'balance')
+)
+
+EQUITY_DTYPE = np.dtype([('time', 'i8'), ('total', 'f8')])
+HOLDING_DTYPE = np.dtype([('time', 'i8'), ('asset', 'S16'), ('quantity', 'f8'), ('value', 'f8')])
+
+
+def equity_path(target):
+    return os.path.join(HISTORY_DIR, f"equity_{target.upper()}.bin")
+
+
+def holdings_path(target):
+    return os.path.join(HISTORY_DIR, f"holdings_{target.upper()}.bin")
+
+
+def _read(path, dtype):
+    if not os.path.exists(path) or os.path.getsize(path) < dtype.itemsize:
+        return np.empty(0, dtype=dtype)
+    count = os.path.getsize(path) // dtype.itemsize
+    return np.memmap(path, dtype=dtype, mode='r', shape=(count,))
+
+
+def read_equity(target):
+    """Memory-map the equity curve for a target currency."""
+    return _read(equity_path(target), EQUITY_DTYPE)
+
+
+def read_holdings(target):
+    """Memory-map the per-asset history for a target currency."""
+    return _read(holdings_path(target), HOLDING_DTYPE)
+
+
+def append_sample(target, time_ms, assets, quantities, values):
+    """Record one valuation of the account; `time_ms` must not precede the last sample."""
+    os.makedirs(HISTORY_DIR, exist_ok=True)
+    holdings = np.empty(len(assets), dtype=HOLDING_DTYPE)
+    holdings['time'] = time_ms
+    holdings['asset'] = [asset.encode() for asset in assets]
+    holdings['quantity'] = quantities
+    holdings['value'] = values
+    equity = np.array([(time_ms, holdings['value'].sum())], dtype=EQUITY_DTYPE)
+
+    # The equity record goes last, so a sample only counts once it is complete
+    with open(holdings_path(target), 'ab') as f:
+        f.write(holdings.tobytes())
+    with open(equity_path(target), 'ab') as f:
+        f.write(equity.tobytes())
+
+
+def window(records, start=None, end=None):
+    """Slice of time-sorted records with start <= time <= end (ms), without copying."""
+    times = records['time']
+    first = 0 if start is None else np.searchsorted(times, start, side='left')
+    last = len(records) if end is None else np.searchsorted(times, end, side='right')
+    return records[first:last]
+
+
+def change(target, start=None, end=None):
+    """Change of the total value between the first and last sample in the window."""
+    equity = window(read_equity(target), start, end)
+    if len(equity) == 0:
+        return None
+    opening = float(equity['total'][0])
+    closing = float(equity['total'][-1])
+    return {
+        'start_time': int(equity['time'][0]),
+        'end_time': int(equity['time'][-1]),
+        'opening': opening,
+        'closing': closing,
+        'change': closing - opening,
+        'change_percent': (closing - opening) / opening * 100 if opening else float('nan')
+    }
+
+
+def max_drawdown(target, start=None, end=None):
+    """Largest peak-to-trough fall of the total value in the window, in percent."""
+    equity = window(read_equity(target), start, end)
+    if len(equity) == 0:
+        return None
+    totals = np.asarray(equity['total'])
+    peaks = np.maximum.accumulate(totals)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        drawdowns = np.where(peaks > 0, totals / peaks - 1, 0.0)
+    trough = int(np.argmin(drawdowns))
+    peak = int(np.argmax(totals[:trough + 1]))
+    return {
+        'drawdown_percent': float(drawdowns[trough]) * 100,
+        'peak_time': int(equity['time'][peak]),
+        'trough_time': int(equity['time'][trough])
+    }
+
+
+def contribution(target, start=None, end=None):
+    """Per-asset value change between the first and last sample in the window.
+
+    Returns [(asset, opening value, closing value, change)] sorted by change,
+    reading only the holding records of those two samples.
+    """
+    equity = window(read_equity(target), start, end)
+    if len(equity) == 0:
+        return []
+    holdings = read_holdings(target)
+
+    def sample_values(time_ms):
+        rows = window(holdings, time_ms, time_ms)
+        return {asset.decode(): float(value) for asset, value in zip(rows['asset'], rows['value'])}
+
+    opening = sample_values(int(equity['time'][0]))
+    closing = sample_values(int(equity['time'][-1]))
+    rows = [
+        (asset, opening.get(asset, 0.0), closing.get(asset, 0.0), closing.get(asset, 0.0) - opening.get(asset, 0.0))
+        for asset in set(opening) | set(closing)
+    ]
+    return sorted(rows, key=lambda row: row[3], reverse=True)
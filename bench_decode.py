@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+
+import sys
+
+def print_help():
+    print("Usage: bench_decode.py [--responses N] [--rows N]")
+    print("Description: This script measures kline response decoding: the former JSON/DataFrame/astype path against klines.decode_klines.")
+
+if '-h' in sys.argv or '--help' in sys.argv:
+    print_help()
+    sys.exit(0)
+
+try:
+    import json
+    import time
+    import random
+    import argparse
+    import numpy as np
+    import pandas as pd
+    from klines import KLINE_COLUMNS, decode_klines, klines_frame
+
+    def make_payload(rows, start=1_700_000_000_000, step=60_000):
+        """Build a /api/v3/klines body shaped like the real one."""
+        price = 30000.0
+        data = []
+        for i in range(rows):
+            open_price = price
+            price *= 1 + random.gauss(0, 0.001)
+            data.append([
+                start + i * step, f"{open_price:.8f}", f"{max(open_price, price) * 1.0005:.8f}",
+                f"{min(open_price, price) * 0.9995:.8f}", f"{price:.8f}", f"{random.uniform(1, 100):.8f}",
+                start + (i + 1) * step - 1, f"{random.uniform(1e4, 1e6):.8f}", random.randint(10, 5000),
+                f"{random.uniform(0, 50):.8f}", f"{random.uniform(1e3, 5e5):.8f}", "0"
+            ])
+        return json.dumps(data, separators=(',', ':')).encode()
+
+    def decode_dataframe(payload):
+        """The decoding path analyze.py and ichimoku.py used before the kline store."""
+        df = pd.DataFrame(json.loads(payload), columns=KLINE_COLUMNS)
+        df['timestamp'] = pd.to_datetime(df['timestamp'], unit='ms')
+        float_columns = ['open', 'high', 'low', 'close', 'volume', 'quote_asset_volume',
+                         'taker_buy_base_asset_volume', 'taker_buy_quote_asset_volume']
+        df[float_columns] = df[float_columns].astype(float)
+        return df
+
+    def decode_arrays(payload):
+        return klines_frame(decode_klines(payload))
+
+    def measure(decode, payloads, repeat):
+        best = float('inf')
+        for _ in range(repeat):
+            start = time.perf_counter()
+            for payload in payloads:
+                decode(payload)
+            best = min(best, time.perf_counter() - start)
+        return best
+
+    def main():
+        parser = argparse.ArgumentParser(description="Kline decoding micro-benchmark")
+        parser.add_argument('--responses', type=int, default=200, help='Responses decoded per run')
+        parser.add_argument('--rows', type=int, default=1000, help='Candles per response')
+        parser.add_argument('--repeat', type=int, default=5, help='Runs per path; the best is reported')
+        args = parser.parse_args()
+
+        random.seed(0)
+        payloads = [make_payload(args.rows) for _ in range(args.responses)]
+
+        # Both paths must agree before their speed means anything
+        expected = decode_dataframe(payloads[0])
+        actual = decode_arrays(payloads[0])
+        for column in actual.columns:
+            if not np.array_equal(expected[column].to_numpy(), actual[column].to_numpy()):
+                raise ValueError(f"Decoders disagree on column {column}")
+
+        candles = args.responses * args.rows
+        baseline = measure(decode_dataframe, payloads, args.repeat)
+        fast = measure(decode_arrays, payloads, args.repeat)
+        decode_only = measure(decode_klines, payloads, args.repeat)
+
+        print(f"Decoding {args.responses} responses x {args.rows} candles")
+        print(f"json + DataFrame + astype: {baseline:.3f} s ({candles / baseline:,.0f} candles/s)")
+        print(f"decode_klines + frame:     {fast:.3f} s ({candles / fast:,.0f} candles/s), {baseline / fast:.1f}x faster")
+        print(f"decode_klines only:        {decode_only:.3f} s ({candles / decode_only:,.0f} candles/s), {baseline / decode_only:.1f}x faster")
+
+    if __name__ == "__main__":
+        main()
+
+except ValueError as e:
+    print(f"ValueError: {e}")
+except Exception as e:
+    print(f"An unexpected error occurred: {e}")
@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+
+import sys
+
+def print_help():
+    print("Usage: bench_scripts.py [--runs N] [--latency SECONDS] [--only NAME ...] [--json FILE] [--compare FILE]")
+    print("       bench_scripts.py --record")
+    print("Description: This script runs every script path against a local mock Binance server and reports wall time, requests issued, CPU time and peak memory, cold and with warm caches.")
+
+if '-h' in sys.argv or '--help' in sys.argv:
+    print_help()
+    sys.exit(0)
+
+try:
+    import os
+    import json
+    import time
+    import shutil
+    import argparse
+    import tempfile
+    import subprocess
+    import mock_binance
+
+    ROOT = os.path.dirname(os.path.abspath(__file__))
+    CASES = [
+        ('analyze', ['analyze.py', 'BTCUSDT', '1h']),
+        ('analyze scan', ['analyze.py', 'scan', '1h', '--quote', 'USDT']),
+        ('ichimoku', ['ichimoku.py', 'ETHBTC', '4h']),
+        ('ichimoku scan', ['ichimoku.py', 'scan', '4h', '--quote', 'BTC', '--fresh', '5']),
+        ('balance', ['balance.py']),
+        ('breakeven', ['breakeven.py', 'BTCUSDT']),
+        ('breakeven --all', ['breakeven.py', '--all']),
+        ('price', ['price.py', 'BTCUSDT', 'BUY']),
+        ('trade-limit', ['trade-limit.py', 'DOGE/BTC', 'BUY', '0.0000015', '2000']),
+        ('trade-market', ['trade-market.py', 'BNB/USDT', 'SELL']),
+    ]
+    # Klines the cases read; `--record` saves them from the live API into the mock's fixtures
+    RECORDED_KLINES = {
+        '1h': ['BTCUSDT', 'ETHUSDT', 'BNBUSDT', 'DOGEUSDT'],
+        '4h': ['ETHBTC', 'BNBBTC', 'DOGEBTC'],
+    }
+    # The commands run through trading_tools.cli and exit 1 on any reported error;
+    # these prefixes only pick the line that explains the failure
+    ERROR_PREFIXES = ('An unexpected error occurred', 'An error occurred', 'Binance API Exception',
+                      'Binance Request Exception', 'ValueError:', 'Error:', 'Traceback')
+
+    def case_env(server_url, cache_dir, keys_dir):
+        """Environment that sends every request to the mock and keeps every cache under cache_dir."""
+        env = dict(os.environ)
+        env.update({
+            'BINANCE_API_URL': server_url,
+            'KLINE_STORE_DIR': os.path.join(cache_dir, 'klines'),
+            'TRADE_LEDGER_DIR': os.path.join(cache_dir, 'ledger'),
+            'BALANCE_HISTORY_DIR': os.path.join(cache_dir, 'balance'),
+            'SYMBOL_FILTERS_CACHE': os.path.join(cache_dir, 'exchange_info.json'),
+            'RATELIMIT_STATE': os.path.join(cache_dir, 'ratelimit.json'),
+            'FILLS_LOG': os.path.join(cache_dir, 'fills.jsonl'),
+            'ORDERD_SOCKET': os.path.join(cache_dir, 'orderd.sock'),  # Never running, so no daemon
+            'PYTHONPATH': os.pathsep.join(filter(None, [keys_dir, env.get('PYTHONPATH')])),
+        })
+        return env
+
+    def run_once(argv, env, mock):
+        """Run one script to completion; returns wall, CPU and memory figures and the requests it sent."""
+        mock.reset()
+        with tempfile.TemporaryFile() as output:
+            start = time.perf_counter()
+            process = subprocess.Popen([sys.executable] + argv, cwd=ROOT, env=env, stdout=output, stderr=subprocess.STDOUT)
+            _, status, usage = os.wait4(process.pid, 0)
+            wall = time.perf_counter() - start
+            process.returncode = os.waitstatus_to_exitcode(status)
+            output.seek(0)
+            lines = output.read().decode(errors='replace').splitlines()
+
+        error = None
+        if process.returncode != 0:
+            error = next((line for line in lines if line.startswith(ERROR_PREFIXES)), None)
+            error = error or (lines[-1] if lines else f"exit status {process.returncode}")
+        return {
+            'wall_ms': wall * 1000,
+            'cpu_ms': (usage.ru_utime + usage.ru_stime) * 1000,
+            'rss_mb': usage.ru_maxrss / 1024,  # Linux reports kilobytes
+            'requests': mock.stats()['requests'],
+            'error': error
+        }
+
+    def bench_case(argv, server, keys_dir, runs):
+        """One cold run with empty caches, then `runs` warm runs; reports the median warm run."""
+        cache_dir = tempfile.mkdtemp(prefix='bench-cache-')
+        try:
+            env = case_env(server.url, cache_dir, keys_dir)
+            cold = run_once(argv, env, server.mock)
+            warm = sorted((run_once(argv, env, server.mock) for _ in range(runs)), key=lambda run: run['wall_ms'])
+        finally:
+            shutil.rmtree(cache_dir, ignore_errors=True)
+        median = warm[len(warm) // 2]
+        return {
+            'cold_ms': cold['wall_ms'],
+            'cold_requests': cold['requests'],
+            'warm_ms': median['wall_ms'],
+            'warm_requests': median['requests'],
+            'cpu_ms': median['cpu_ms'],
+            'rss_mb': max(run['rss_mb'] for run in [cold] + warm),
+            'error': cold['error'] or next((run['error'] for run in warm if run['error']), None)
+        }
+
+    def change(new, old):
+        return f"{(new - old) / old * 100:+.0f}%" if old else '-'
+
+    def print_results(results, previous=None):
+        print(f"{'Script path':<18}{'Cold':>10}{'Req':>5}{'Warm':>10}{'Req':>5}{'CPU':>10}{'RSS':>9}"
+              + ('  vs previous (warm, req)' if previous else ''))
+        for name, result in results.items():
+            line = (f"{name:<18}{result['cold_ms']:>8.0f}ms{result['cold_requests']:>5}{result['warm_ms']:>8.0f}ms"
+                    f"{result['warm_requests']:>5}{result['cpu_ms']:>8.0f}ms{result['rss_mb']:>7.0f}MB")
+            if previous and name in previous:
+                old = previous[name]
+                line += f"  {change(result['warm_ms'], old['warm_ms']):>6} {change(result['warm_requests'], old['warm_requests']):>6}"
+            if result['error']:
+                line += f"  FAILED: {result['error']}"
+            print(line)
+
+    def main():
+        parser = argparse.ArgumentParser(description="End-to-end script benchmarks against a local mock Binance server")
+        parser.add_argument('--runs', type=int, default=3, help='Warm runs per script path; the median is reported')
+        parser.add_argument('--latency', type=float, default=0.02, help='Seconds the mock adds to every response')
+        parser.add_argument('--jitter', type=float, default=0.0, help='Up to this many random seconds more')
+        parser.add_argument('--only', nargs='+', default=None, metavar='NAME', help='Only these script paths')
+        parser.add_argument('--json', default=None, metavar='FILE', help='Save the results to compare with later')
+        parser.add_argument('--compare', default=None, metavar='FILE', help='Results saved by an earlier --json run')
+        parser.add_argument('--record', action='store_true', help='Record the klines the cases read from the live API and exit')
+        args = parser.parse_args()
+
+        if args.record:
+            for interval, symbols in RECORDED_KLINES.items():
+                mock_binance.record(symbols, [interval])
+            return
+
+        cases = [(name, argv) for name, argv in CASES if not args.only or name in args.only]
+        previous = None
+        if args.compare:
+            with open(args.compare) as f:
+                previous = json.load(f)['results']
+
+        server = mock_binance.start(latency=args.latency, jitter=args.jitter)
+        keys_dir = tempfile.mkdtemp(prefix='bench-keys-')
+        with open(os.path.join(keys_dir, 'keys.py'), 'w') as f:
+            f.write("API_KEY = 'mock'\nAPI_SECRET = 'mock'\n")
+
+        print(f"Mock Binance API on {server.url}, {args.latency * 1000:.0f} ms latency, {args.runs} warm runs per path")
+        results = {}
+        try:
+            for name, argv in cases:
+                results[name] = bench_case(argv, server, keys_dir, args.runs)
+            generated = server.mock.stats()['generated_klines']
+        finally:
+            server.shutdown()
+            shutil.rmtree(keys_dir, ignore_errors=True)
+
+        print_results(results, previous)
+        if generated:
+            print(f"Klines from the mock's random walk, not recorded market data: {', '.join(generated)}")
+            print("Record them with `bench_scripts.py --record` and commit fixtures/mock_binance/klines/.")
+
+        if args.json:
+            with open(args.json, 'w') as f:
+                json.dump({'time': time.time(), 'latency': args.latency, 'runs': args.runs, 'generated_klines': generated,
+                           'results': results}, f, indent=1)
+        if any(result['error'] for result in results.values()):
+            sys.exit(1)
+
+    if __name__ == "__main__":
+        main()
+
+except ValueError as e:
+    print(f"ValueError: {e}")
+except Exception as e:
+    print(f"An unexpected error occurred: {e}")
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+
+import sys
+from binance.exceptions import BinanceAPIException, BinanceRequestException
+
+def print_help():
+    print("Usage: confluence.py <trading-pair> <interval> [<interval> ...] [--candles N]")
+    print("Description: This script runs the analyze.py and ichimoku.py signals on several timeframes of a trading pair, building every timeframe from one download of the finest interval.")
+
+if '-h' in sys.argv or '--help' in sys.argv:
+    print_help()
+    sys.exit(0)
+
+try:
+    import time
+    import argparse
+    import numpy as np
+    import pandas as pd
+    from trading_tools.analyze import calculate_indicators, analyze_data
+    from trading_tools.ichimoku import apply_ichimoku, analyze_ichimoku
+    from klines import sync_klines, backfill_store, klines_frame
+    from resample import interval_length, resample_records
+
+    ICHIMOKU_WINDOWS = (9, 18, 24)
+
+    def load_base(symbol, interval, start_time):
+        """Return stored and open candles of the base interval from start_time (ms) onwards."""
+        stored, open_candles = sync_klines(symbol, interval)
+        if len(stored) == 0 or stored['timestamp'][0] > start_time:
+            backfill_store(symbol, interval, start_time)
+            stored, open_candles = sync_klines(symbol, interval)
+        first = np.searchsorted(stored['timestamp'], start_time)
+        return np.concatenate([stored[first:], open_candles])
+
+    def timeframe_signals(records):
+        df = klines_frame(records)
+        df = calculate_indicators(df)
+        signals = analyze_data(df)
+
+        ichimoku_df = apply_ichimoku(df.set_index('timestamp')[['high', 'low', 'close']].copy(), *ICHIMOKU_WINDOWS)
+        signals['Ichimoku'] = analyze_ichimoku(ichimoku_df)
+        return df.iloc[-1], signals
+
+    def main():
+        parser = argparse.ArgumentParser(description="Multi-timeframe signal confluence")
+        parser.add_argument('symbol', type=str, help='Trading pair symbol (e.g., BTCUSDT)')
+        parser.add_argument('intervals', nargs='+', help='Timeframes to analyse (e.g., 1m 5m 1h 1d)')
+        parser.add_argument('--candles', type=int, default=200, help='Candles analysed per timeframe (default: 200)')
+        args = parser.parse_args()
+
+        symbol = args.symbol.upper()
+        intervals = sorted(set(args.intervals), key=interval_length)
+        base = intervals[0]
+
+        # Only the finest interval is downloaded; it has to cover the longest timeframe's window
+        start_time = int(time.time() * 1000) - (args.candles + 1) * interval_length(intervals[-1])
+        base_records = load_base(symbol, base, start_time)
+
+        rows = []
+        for interval in intervals:
+            latest, signals = timeframe_signals(resample_records(base_records, interval, base))
+            rows.append({'interval': interval, 'close': latest['close'], 'rsi': latest['rsi'], **signals})
+
+        table = pd.DataFrame(rows)
+        print(f"Signals for {symbol} built from {len(base_records)} {base} candles:")
+        print(table.to_string(index=False))
+
+        votes = table.drop(columns=['interval', 'close', 'rsi']).to_numpy().ravel()
+        long_votes = int(np.count_nonzero(votes == "LONG"))
+        short_votes = int(np.count_nonzero(votes == "SHORT"))
+        if long_votes > short_votes:
+            confluence = "LONG"
+        elif short_votes > long_votes:
+            confluence = "SHORT"
+        else:
+            confluence = "NEUTRAL"
+        print(f"\nConfluence: {confluence} ({long_votes} LONG / {short_votes} SHORT of {len(votes)} signals)")
+
+    if __name__ == "__main__":
+        main()
+
+except BinanceAPIException as e:
+    print(f"Binance API Exception: {e}")
+except BinanceRequestException as e:
+    print(f"Binance Request Exception: {e}")
+except IndexError:
+    print("Error: Missing command line arguments.")
+    print_help()
+except ValueError as e:
+    print(f"ValueError: {e}")
+except Exception as e:
+    print(f"An unexpected error occurred: {e}")
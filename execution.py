@@ -0,0 +1,264 @@
+"""Sliced execution of a parent market order: TWAP and iceberg schedules.
+
+TWAP sends `slices` child orders on an asyncio timer with absolute
+deadlines, so a slow child never shifts the rest of the schedule. Iceberg
+sends children of a fixed visible size one after another, with an optional
+pause between them. Before each child the remaining quantity is recomputed
+from the executed quantity of the children so far and rounded to the cached
+market LOT_SIZE rules; whatever is too small to trade on its own is carried
+into the next child.
+
+Orders go through any object with the Client methods order_market and
+get_avg_price. The blocking calls run in a worker thread so the timer keeps
+its schedule. A child that fails (a rejected order, a lost connection)
+is recorded with its error and stops the schedule, so the summary still
+covers everything filled before it. SimulatedExchange is a local stand-in
+with a synthetic order book and trading rules, for trying schedules
+without an account or a network connection.
+"""
+
+import time
+import random
+import asyncio
+import threading
+from decimal import Decimal
+
+
+class ExecutionScheduler:
+    """Work a parent market order as child orders and keep per-child statistics."""
+
+    def __init__(self, client, filters, side, quantity):
+        self.client = client
+        self.filters = filters
+        self.symbol = filters.symbol
+        self.side = side.upper()
+        self.quantity = Decimal(str(quantity))
+        self.executed = Decimal(0)
+        self.quote = Decimal(0)
+        self.arrival_price = None
+        self.children = []
+
+    @property
+    def remaining(self):
+        return self.quantity - self.executed
+
+    def child_quantity(self, target, last=False):
+        """Round a child's target size to the market lot rules; 0 when it cannot be sent yet."""
+        quantity = self.filters.round_quantity(self.remaining if last else min(target, self.remaining), market=True)
+        try:
+            self.filters.validate(quantity, self.arrival_price, market=True)
+        except ValueError:
+            return Decimal(0)
+        return quantity
+
+    async def send_child(self, quantity, scheduled):
+        """Place one child market order and record its latency, fill and slippage."""
+        loop = asyncio.get_running_loop()
+        submitted = loop.time()
+        start = time.perf_counter()
+        try:
+            response = await loop.run_in_executor(
+                None, lambda: self.client.order_market(symbol=self.symbol, side=self.side, quantity=quantity)
+            )
+        except Exception as e:
+            child = {
+                'child': len(self.children) + 1,
+                'quantity': quantity,
+                'executed': Decimal(0),
+                'avg_price': None,
+                'status': 'FAILED',
+                'latency_ms': (time.perf_counter() - start) * 1000,
+                'timer_late_ms': (submitted - scheduled) * 1000,
+                'slippage_bps': None,
+                'error': f"{type(e).__name__}: {e}"
+            }
+            self.children.append(child)
+            return child
+        latency = (time.perf_counter() - start) * 1000
+
+        executed = Decimal(response['executedQty'])
+        quote = Decimal(response['cummulativeQuoteQty'])
+        self.executed += executed
+        self.quote += quote
+        average = quote / executed if executed else None
+        slippage = None
+        if average is not None:
+            direction = 1 if self.side == 'BUY' else -1
+            slippage = float((average - self.arrival_price) / self.arrival_price) * 1e4 * direction
+
+        child = {
+            'child': len(self.children) + 1,
+            'quantity': quantity,
+            'executed': executed,
+            'avg_price': average,
+            'status': response.get('status'),
+            'latency_ms': latency,
+            'timer_late_ms': (submitted - scheduled) * 1000,
+            'slippage_bps': slippage,
+            'error': None
+        }
+        self.children.append(child)
+        return child
+
+    async def load_arrival_price(self):
+        loop = asyncio.get_running_loop()
+        avg_price = await loop.run_in_executor(None, lambda: self.client.get_avg_price(symbol=self.symbol))
+        self.arrival_price = Decimal(avg_price['price'])
+
+    async def twap(self, slices, duration, on_child=None):
+        """Send up to `slices` children evenly spread over `duration` seconds."""
+        await self.load_arrival_price()
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        interval = duration / max(slices - 1, 1)
+        for i in range(slices):
+            scheduled = start + i * interval
+            await asyncio.sleep(max(scheduled - loop.time(), 0))
+            last = i == slices - 1
+            quantity = self.child_quantity(self.remaining / (slices - i), last=last)
+            if quantity > 0:
+                child = await self.send_child(quantity, scheduled)
+                if on_child:
+                    on_child(child)
+                if child['error']:
+                    break  # Stop the schedule; the summary keeps what already filled
+            if self.remaining <= 0:
+                break
+        return self.summary()
+
+    async def iceberg(self, slice_quantity, pause=0.0, on_child=None):
+        """Send children of `slice_quantity` back to back until the parent is done."""
+        await self.load_arrival_price()
+        loop = asyncio.get_running_loop()
+        slice_quantity = Decimal(str(slice_quantity))
+        while self.remaining > 0:
+            scheduled = loop.time()
+            last = self.remaining <= slice_quantity
+            quantity = self.child_quantity(slice_quantity, last=last)
+            if quantity <= 0:
+                break  # Too small to trade on its own
+            child = await self.send_child(quantity, scheduled)
+            if on_child:
+                on_child(child)
+            if child['error']:
+                break  # Stop the schedule; the summary keeps what already filled
+            if child['executed'] == 0:
+                break  # Nothing filled; stop rather than spin
+            if pause and self.remaining > 0:
+                await asyncio.sleep(pause)
+        return self.summary()
+
+    def summary(self):
+        latencies = sorted(child['latency_ms'] for child in self.children)
+        average = self.quote / self.executed if self.executed else None
+        slippage = None
+        if average is not None:
+            direction = 1 if self.side == 'BUY' else -1
+            slippage = float((average - self.arrival_price) / self.arrival_price) * 1e4 * direction
+        return {
+            'children': len(self.children),
+            'executed': self.executed,
+            'unfilled': self.remaining,
+            'avg_price': average,
+            'arrival_price': self.arrival_price,
+            'slippage_bps': slippage,
+            'latency_median_ms': latencies[len(latencies) // 2] if latencies else None,
+            'latency_max_ms': latencies[-1] if latencies else None,
+            'timer_late_max_ms': max((child['timer_late_ms'] for child in self.children), default=None),
+            'failed': next((child for child in self.children if child['error']), None)
+        }
+
+
+class SimulatedExchange:
+    """Local stand-in for the order endpoints with a synthetic order book.
+
+    Each side of the book has `depth` base units every `level_bps` away from
+    the mid price. A market order walks those levels; the liquidity it takes
+    comes back with a half-life of `recovery` seconds, so slicing an order
+    pays less impact than sending it at once. Requests sleep `latency`
+    seconds, and the mid price follows a random walk.
+    """
+
+    def __init__(self, base_asset, quote_asset, price=100.0, balances=None, spread_bps=2.0, level_bps=1.0,
+                 depth=1.0, recovery=2.0, volatility_bps=1.0, latency=0.05, seed=None):
+        self.base_asset = base_asset
+        self.quote_asset = quote_asset
+        self.mid = price
+        self.balances = balances or {base_asset: 10.0, quote_asset: 10.0 * price}
+        self.spread_bps = spread_bps
+        self.level_bps = level_bps
+        self.depth = depth
+        self.recovery = recovery
+        self.volatility_bps = volatility_bps
+        self.latency = latency
+        self.random = random.Random(seed)
+        self.taken = {'BUY': 0.0, 'SELL': 0.0}  # Liquidity taken from each side, recovering over time
+        self.updated = time.monotonic()
+        self.order_id = 0
+        self.lock = threading.Lock()
+
+    def _advance(self):
+        now = time.monotonic()
+        elapsed = now - self.updated
+        self.updated = now
+        decay = 0.5 ** (elapsed / self.recovery)
+        for side in self.taken:
+            self.taken[side] *= decay
+        self.mid *= 1 + self.random.gauss(0, self.volatility_bps / 1e4 * elapsed ** 0.5)
+
+    def symbol_filters(self, step_size='0.00001000', tick_size='0.01000000', min_notional='5.00000000'):
+        """Trading rules of the simulated symbol, built locally rather than from exchange info."""
+        from symbol_filters import SymbolFilters
+
+        return SymbolFilters({
+            'symbol': self.base_asset + self.quote_asset,
+            'status': 'TRADING',
+            'baseAsset': self.base_asset,
+            'quoteAsset': self.quote_asset,
+            'filters': [
+                {'filterType': 'PRICE_FILTER', 'minPrice': tick_size, 'maxPrice': '1000000.00000000', 'tickSize': tick_size},
+                {'filterType': 'LOT_SIZE', 'minQty': step_size, 'maxQty': '9000000.00000000', 'stepSize': step_size},
+                {'filterType': 'NOTIONAL', 'minNotional': min_notional, 'applyMinToMarket': True,
+                 'maxNotional': '9000000.00000000'}
+            ]
+        })
+
+    def get_avg_price(self, symbol):
+        time.sleep(self.latency)
+        with self.lock:
+            self._advance()
+            return {'mins': 5, 'price': f"{self.mid:.8f}"}
+
+    def get_asset_balance(self, asset):
+        time.sleep(self.latency)
+        return {'asset': asset, 'free': f"{self.balances.get(asset, 0.0):.8f}", 'locked': '0.00000000'}
+
+    def order_market(self, symbol, side, quantity):
+        time.sleep(self.latency)
+        quantity = float(quantity)
+        with self.lock:
+            self._advance()
+            direction = 1 if side == 'BUY' else -1
+            position = self.taken[side]
+            left = quantity
+            fills = []
+            quote = 0.0
+            while left > 1e-12:
+                level = int(position // self.depth)
+                available = (level + 1) * self.depth - position
+                take = min(available, left)
+                price = self.mid * (1 + direction * (self.spread_bps / 2 + level * self.level_bps) / 1e4)
+                fills.append({'price': f"{price:.8f}", 'qty': f"{take:.8f}", 'commission': '0', 'commissionAsset': self.quote_asset})
+                quote += price * take
+                position += take
+                left -= take
+            self.taken[side] = position
+
+            self.balances[self.base_asset] = self.balances.get(self.base_asset, 0.0) + direction * quantity
+            self.balances[self.quote_asset] = self.balances.get(self.quote_asset, 0.0) - direction * quote
+            self.order_id += 1
+            return {
+                'symbol': symbol, 'orderId': self.order_id, 'side': side, 'type': 'MARKET', 'status': 'FILLED',
+                'origQty': f"{quantity:.8f}", 'executedQty': f"{quantity:.8f}",
+                'cummulativeQuoteQty': f"{quote:.8f}", 'fills': fills
+            }
@@ -0,0 +1,247 @@
+"""Fill tracking for placed limit orders.
+
+FillTracker follows its orders through executionReport events on the user
+data stream, subscribing before the first order goes out so no event can
+be missed. Polling get_order is the fallback: it starts at POLL_MIN seconds
+and backs off to POLL_MAX while nothing changes, and it only runs at the
+slow rate while the stream is connected.
+
+Each order records its placement-to-ack latency (the REST round trip) and
+its ack-to-fill latency (from the ack until the fill is seen locally). One
+JSON line per finished order goes to LOG_PATH, which report() summarises.
+"""
+
+import os
+import json
+import time
+import asyncio
+from decimal import Decimal
+
+from user_stream import STREAM_URL, follow_user_stream
+
+LOG_PATH = os.environ.get(
+    'FILLS_LOG',
+    os.path.join(os.path.expanduser('~'), '.cache', 'trading-tools', 'fills.jsonl')
+)
+POLL_MIN = 0.2  # Seconds between get_order polls right after a change
+POLL_MAX = 5.0  # Slowest poll interval without the stream
+POLL_STREAM = 15.0  # Poll interval while the stream is connected, as a safety net
+STREAM_CONNECT_TIMEOUT = 3.0  # Seconds to wait for the stream before placing orders anyway
+FINAL_STATUSES = {'FILLED', 'CANCELED', 'REJECTED', 'EXPIRED', 'EXPIRED_IN_MATCH'}
+
+
+class FillTracker:
+    """Place limit orders and follow them until they fill, are cancelled or replaced."""
+
+    def __init__(self, client, url=STREAM_URL, log_path=LOG_PATH, use_stream=True, stream_client=None):
+        self.client = client
+        # The stream's listen-key calls keep running alongside the order calls,
+        # so they get a client of their own when one is given
+        self.stream_client = stream_client or client
+        self.url = url
+        self.log_path = log_path
+        self.use_stream = use_stream
+        self.orders = {}  # orderId -> record
+        self.early_events = {}  # orderId -> executionReports that arrived before the REST ack
+        self.changed = {}  # orderId -> asyncio.Event set on every status change
+        self.stream_connected = asyncio.Event()
+        self.stream_task = None
+
+    async def start(self):
+        """Connect the user data stream, waiting briefly so the first order's events are not missed."""
+        if not self.use_stream:
+            return
+        loop = asyncio.get_running_loop()
+
+        def on_connect():
+            loop.call_soon_threadsafe(self.stream_connected.set)
+
+        def on_event(event):
+            if event.get('e') == 'executionReport':
+                self.on_execution_report(event)
+
+        async def follow():
+            try:
+                await follow_user_stream(self.stream_client, on_connect, on_event, url=self.url)
+            except Exception as e:
+                print(f"User data stream unavailable, polling orders instead: {e}", flush=True)
+            finally:
+                self.stream_connected.clear()
+
+        self.stream_task = asyncio.create_task(follow())
+        try:
+            await asyncio.wait_for(self.stream_connected.wait(), STREAM_CONNECT_TIMEOUT)
+        except asyncio.TimeoutError:
+            print("User data stream not connected yet, polling orders until it is", flush=True)
+
+    async def stop(self):
+        if self.stream_task:
+            self.stream_task.cancel()
+            try:
+                await self.stream_task
+            except asyncio.CancelledError:
+                pass
+
+    def _register(self, response, placed, acked):
+        order_id = response['orderId']
+        record = {
+            'symbol': response['symbol'],
+            'order_id': order_id,
+            'side': response.get('side'),
+            'price': response.get('price'),
+            'quantity': response.get('origQty'),
+            'executed': response.get('executedQty', '0'),
+            'status': response.get('status'),
+            'placed': placed,
+            'acked': acked,
+            'final': None,
+            'seen_by': 'ack',
+            'replaces': None
+        }
+        self.orders[order_id] = record
+        self.changed[order_id] = asyncio.Event()
+        if record['status'] in FINAL_STATUSES:
+            record['final'] = acked
+        for event in self.early_events.pop(order_id, []):
+            self.on_execution_report(event)
+        return record
+
+    def _update(self, order_id, status, executed, seen_by):
+        record = self.orders[order_id]
+        if status == record['status'] and executed == record['executed']:
+            return
+        record['status'] = status
+        record['executed'] = executed
+        if status in FINAL_STATUSES and record['final'] is None:
+            record['final'] = time.time()
+            record['seen_by'] = seen_by
+        self.changed[order_id].set()
+
+    def on_execution_report(self, event):
+        order_id = event['i']
+        if order_id not in self.orders:
+            self.early_events.setdefault(order_id, []).append(event)
+            return
+        self._update(order_id, event['X'], event['z'], 'stream')
+
+    async def _call(self, method, **params):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, lambda: getattr(self.client, method)(**params))
+
+    async def place_limit(self, symbol, side, price, quantity):
+        """Place a limit order and start tracking it."""
+        placed = time.time()
+        response = await self._call('order_limit', symbol=symbol, side=side, price=str(price), quantity=str(quantity))
+        return self._register(response, placed, time.time())
+
+    async def poll(self, order_id):
+        response = await self._call('get_order', symbol=self.orders[order_id]['symbol'], orderId=order_id)
+        self._update(order_id, response['status'], response['executedQty'], 'poll')
+
+    async def wait(self, order_id, timeout=None):
+        """Wait until the order reaches a final status or `timeout` seconds pass; returns its record."""
+        record = self.orders[order_id]
+        changed = self.changed[order_id]
+        deadline = None if timeout is None else time.monotonic() + timeout
+        interval = POLL_MIN
+        while record['status'] not in FINAL_STATUSES:
+            wait = POLL_STREAM if self.stream_connected.is_set() else interval
+            if deadline is not None:
+                wait = min(wait, deadline - time.monotonic())
+                if wait <= 0:
+                    break
+            changed.clear()
+            try:
+                await asyncio.wait_for(changed.wait(), wait)
+                interval = POLL_MIN  # Activity: look again soon
+            except asyncio.TimeoutError:
+                await self.poll(order_id)
+                interval = POLL_MIN if changed.is_set() else min(interval * 2, POLL_MAX)
+        return record
+
+    async def cancel(self, order_id):
+        record = self.orders[order_id]
+        response = await self._call('cancel_order', symbol=record['symbol'], orderId=order_id)
+        self._update(order_id, response['status'], response['executedQty'], 'ack')
+        return record
+
+    async def replace(self, order_id, price):
+        """Cancel the order and place its unfilled quantity at `price` in one request."""
+        record = self.orders[order_id]
+        remaining = Decimal(record['quantity']) - Decimal(record['executed'])
+        placed = time.time()
+        response = await self._call(
+            'cancel_replace_order', symbol=record['symbol'], side=record['side'], type='LIMIT',
+            timeInForce='GTC', cancelReplaceMode='STOP_ON_FAILURE', cancelOrderId=order_id,
+            price=str(price), quantity=f"{remaining.normalize():f}"
+        )
+        acked = time.time()
+        cancelled = response['cancelResponse']
+        self._update(order_id, cancelled['status'], cancelled['executedQty'], 'ack')
+        new_record = self._register(response['newOrderResponse'], placed, acked)
+        new_record['replaces'] = order_id
+        return new_record
+
+    def log(self, record):
+        """Append the latency record of an order to the fills log."""
+        entry = {
+            'time': record['placed'],
+            'symbol': record['symbol'],
+            'order_id': record['order_id'],
+            'side': record['side'],
+            'price': record['price'],
+            'quantity': record['quantity'],
+            'executed': record['executed'],
+            'status': record['status'],
+            'seen_by': record['seen_by'],
+            'replaces': record['replaces'],
+            'place_to_ack_ms': (record['acked'] - record['placed']) * 1000,
+            'ack_to_fill_ms': (record['final'] - record['acked']) * 1000 if record['status'] == 'FILLED' else None
+        }
+        os.makedirs(os.path.dirname(self.log_path), exist_ok=True)
+        with open(self.log_path, 'a') as f:
+            f.write(json.dumps(entry) + '\n')
+        return entry
+
+
+def percentile(values, share):
+    values = sorted(values)
+    return values[min(int(share * len(values)), len(values) - 1)]
+
+
+def report(log_path=LOG_PATH, since=None):
+    """Print order counts and latency percentiles from the fills log."""
+    if not os.path.exists(log_path):
+        print("No orders in the fills log.")
+        return
+    with open(log_path) as f:
+        entries = [json.loads(line) for line in f if line.strip()]
+    if since is not None:
+        entries = [entry for entry in entries if entry['time'] >= since]
+    if not entries:
+        print("No orders in the fills log.")
+        return
+
+    statuses = {}
+    for entry in entries:
+        statuses[entry['status']] = statuses.get(entry['status'], 0) + 1
+    print(f"Orders: {len(entries)} ({', '.join(f'{status} {count}' for status, count in sorted(statuses.items()))})")
+
+    for name in ('place_to_ack_ms', 'ack_to_fill_ms'):
+        values = [entry[name] for entry in entries if entry[name] is not None]
+        if values:
+            print(f"{name}: median {percentile(values, 0.5):.1f}, p90 {percentile(values, 0.9):.1f}, "
+                  f"max {max(values):.1f} over {len(values)} orders")
+    by_stream = sum(1 for entry in entries if entry['seen_by'] == 'stream')
+    by_poll = sum(1 for entry in entries if entry['seen_by'] == 'poll')
+    print(f"Final status seen via stream: {by_stream}, via polling: {by_poll}")
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Order latency report from the fills log")
+    parser.add_argument('--days', type=float, default=None, help='Only orders placed in the last N days')
+    parser.add_argument('--log', default=LOG_PATH)
+    args = parser.parse_args()
+    report(args.log, None if args.days is None else time.time() - args.days * 86400)
@@ -0,0 +1,202 @@
+"""Ichimoku Cloud engine for many window triples and live updates.
+
+The rolling highs and lows behind the conversion line, base line and span B
+are computed once per distinct window in linear time and shared by every
+(window1, window2, window3) triple that uses that window. The values match
+ta.trend.IchimokuIndicator with its default visual=False: span A and span B
+are not shifted forward, and span B accepts partial windows at the start.
+
+For live use, IchimokuEngine keeps one monotonic deque pair per window so a
+new candle updates every triple in O(1) amortised time.
+"""
+
+from collections import deque
+
+import numpy as np
+import pandas as pd
+
+
+def rolling_extremum(values, window, ufunc, min_periods=None):
+    """Sliding-window maximum (ufunc=np.maximum) or minimum (np.minimum) in O(n).
+
+    Uses the van Herk/Gil-Werman scheme: running extrema from the left and
+    from the right within blocks of `window` values combine into the
+    extremum of any window with two lookups. Positions with fewer than
+    `min_periods` values (default: a full window) are NaN.
+    """
+    values = np.asarray(values, dtype=np.float64)
+    n = len(values)
+    if min_periods is None:
+        min_periods = window
+    result = np.full(n, np.nan)
+    if n == 0:
+        return result
+
+    fill = -np.inf if ufunc is np.maximum else np.inf
+    blocks = -(-n // window)
+    padded = np.full(blocks * window, fill)
+    padded[:n] = values
+    padded = padded.reshape(blocks, window)
+    from_left = ufunc.accumulate(padded, axis=1).ravel()
+    from_right = ufunc.accumulate(padded[:, ::-1], axis=1)[:, ::-1].ravel()
+
+    if n >= window:
+        end = np.arange(window - 1, n)
+        result[window - 1:] = ufunc(from_right[end - window + 1], from_left[end])
+
+    # Windows that are not yet full reduce to the running extremum so far
+    partial = min(window - 1, n)
+    result[:partial] = ufunc.accumulate(values[:partial])
+    result[:max(min_periods - 1, 0)] = np.nan
+    return result
+
+
+def average_true_range(high, low, close, window=14):
+    """Wilder ATR matching ta.volatility.AverageTrueRange, without its Python loop."""
+    high = np.asarray(high, dtype=np.float64)
+    low = np.asarray(low, dtype=np.float64)
+    close = np.asarray(close, dtype=np.float64)
+    prior_close = np.concatenate([[np.nan], close[:-1]])
+    true_range = np.fmax(high - low, np.fmax(np.abs(high - prior_close), np.abs(low - prior_close)))
+
+    atr = np.zeros(len(close))
+    if len(close) >= window:
+        smoothed = true_range[window - 1:].copy()
+        smoothed[0] = true_range[:window].mean()
+        atr[window - 1:] = pd.Series(smoothed).ewm(alpha=1 / window, adjust=False).mean().to_numpy()
+    return atr
+
+
+def ichimoku_lines(high, low, close, triples):
+    """Compute the cloud for every (window1, window2, window3) triple in one pass.
+
+    Returns {triple: {'tenkan_sen', 'kijun_sen', 'senkou_span_a', 'senkou_span_b', 'chikou_span'}}.
+    """
+    high = np.asarray(high, dtype=np.float64)
+    low = np.asarray(low, dtype=np.float64)
+    close = np.asarray(close, dtype=np.float64)
+    midpoints = {}
+
+    def midpoint(window, min_periods):
+        key = (window, min_periods)
+        if key not in midpoints:
+            midpoints[key] = 0.5 * (
+                rolling_extremum(high, window, np.maximum, min_periods)
+                + rolling_extremum(low, window, np.minimum, min_periods)
+            )
+        return midpoints[key]
+
+    lines = {}
+    for window1, window2, window3 in triples:
+        tenkan = midpoint(window1, window1)
+        kijun = midpoint(window2, window2)
+        chikou = np.full(len(close), np.nan)
+        if window2 < len(close):
+            chikou[:len(close) - window2] = close[window2:]
+        lines[(window1, window2, window3)] = {
+            'tenkan_sen': tenkan,
+            'kijun_sen': kijun,
+            'senkou_span_a': 0.5 * (tenkan + kijun),
+            'senkou_span_b': midpoint(window3, 0),
+            'chikou_span': chikou
+        }
+    return lines
+
+
+def ichimoku_signals(df):
+    """Evaluate the analyze_ichimoku() rule of ichimoku.py on every bar: 1 LONG, -1 SHORT, 0 NEUTRAL."""
+    close = df['close'].to_numpy()
+    span_a = df['senkou_span_a'].to_numpy()
+    span_b = df['senkou_span_b'].to_numpy()
+    tenkan = df['tenkan_sen'].to_numpy()
+    kijun = df['kijun_sen'].to_numpy()
+    prior_tenkan = np.concatenate([[np.nan], tenkan[:-1]])
+    prior_kijun = np.concatenate([[np.nan], kijun[:-1]])
+
+    above_cloud = (close > span_a) & (close > span_b)
+    below_cloud = (close < span_a) & (close < span_b)
+    crossed_up = (tenkan > kijun) & (prior_tenkan <= prior_kijun)
+    crossed_down = (tenkan < kijun) & (prior_tenkan >= prior_kijun)
+    return np.where(above_cloud & crossed_up, 1, np.where(below_cloud & crossed_down, -1, 0))
+
+
+class RollingExtremum:
+    """Sliding-window high and low over appended candles using monotonic deques."""
+
+    def __init__(self, window):
+        self.window = window
+        self.count = 0
+        self.highs = deque()  # (index, high), highs strictly decreasing
+        self.lows = deque()  # (index, low), lows strictly increasing
+
+    def append(self, high, low):
+        index = self.count
+        while self.highs and self.highs[-1][1] <= high:
+            self.highs.pop()
+        self.highs.append((index, high))
+        while self.lows and self.lows[-1][1] >= low:
+            self.lows.pop()
+        self.lows.append((index, low))
+
+        if self.highs[0][0] <= index - self.window:
+            self.highs.popleft()
+        if self.lows[0][0] <= index - self.window:
+            self.lows.popleft()
+        self.count += 1
+
+    def midpoint(self, partial=False):
+        if self.count == 0 or (self.count < self.window and not partial):
+            return np.nan
+        return 0.5 * (self.highs[0][1] + self.lows[0][1])
+
+
+class IchimokuEngine:
+    """Live Ichimoku Cloud for several window triples, updated one candle at a time."""
+
+    def __init__(self, triples=((9, 18, 24),)):
+        self.triples = [tuple(triple) for triple in triples]
+        windows = {window for triple in self.triples for window in triple}
+        self.extrema = {window: RollingExtremum(window) for window in windows}
+        self.latest = {}
+        self.prior = {}
+
+    def seed(self, high, low, close):
+        """Feed historical candles, oldest first."""
+        for values in zip(high, low, close):
+            self.append(*values)
+        return self
+
+    def append(self, high, low, close):
+        """Add one closed candle and return the latest lines for every triple."""
+        for extremum in self.extrema.values():
+            extremum.append(high, low)
+
+        for window1, window2, window3 in self.triples:
+            tenkan = self.extrema[window1].midpoint()
+            kijun = self.extrema[window2].midpoint()
+            triple = (window1, window2, window3)
+            self.prior[triple] = self.latest.get(triple)
+            self.latest[triple] = {
+                'close': close,
+                'tenkan_sen': tenkan,
+                'kijun_sen': kijun,
+                'senkou_span_a': 0.5 * (tenkan + kijun),
+                'senkou_span_b': self.extrema[window3].midpoint(partial=True)
+            }
+        return self.latest
+
+    def signal(self, triple=None):
+        """Apply the analyze_ichimoku() rule of ichimoku.py to the latest two candles."""
+        triple = tuple(triple) if triple else self.triples[0]
+        latest = self.latest.get(triple)
+        prior = self.prior.get(triple)
+        if latest is None or prior is None:
+            return "NEUTRAL"
+
+        if latest['close'] > latest['senkou_span_a'] and latest['close'] > latest['senkou_span_b']:
+            if latest['tenkan_sen'] > latest['kijun_sen'] and prior['tenkan_sen'] <= prior['kijun_sen']:
+                return "LONG"
+        elif latest['close'] < latest['senkou_span_a'] and latest['close'] < latest['senkou_span_b']:
+            if latest['tenkan_sen'] < latest['kijun_sen'] and prior['tenkan_sen'] >= prior['kijun_sen']:
+                return "SHORT"
+        return "NEUTRAL"
@@ -0,0 +1,196 @@
+"""Incremental RSI, MACD and Bollinger Bands.
+
+Each indicator keeps just enough state to produce the next value from one
+new close, reproducing the `ta` results that calculate_indicators() in
+analyze.py computes over the whole frame. Passing closed=False to update()
+evaluates a still-open candle without committing it, so the same engine can
+follow live ticks and then take the final close once the candle completes.
+"""
+
+import math
+from collections import deque
+
+NAN = float('nan')
+
+
+class EMA:
+    """Exponential moving average following pandas ewm(adjust=False)."""
+
+    def __init__(self, alpha, min_periods):
+        self.alpha = alpha
+        self.min_periods = min_periods
+        self.value = None
+        self.count = 0
+
+    def update(self, x, closed=True):
+        value = x if self.value is None else self.value + self.alpha * (x - self.value)
+        count = self.count + 1
+        if closed:
+            self.value = value
+            self.count = count
+        return value if count >= self.min_periods else NAN
+
+
+class RSI:
+    """Relative Strength Index with Wilder smoothing, as ta.momentum.RSIIndicator."""
+
+    def __init__(self, window=7):
+        self.prev_close = None
+        self.up = EMA(1 / window, window)
+        self.down = EMA(1 / window, window)
+
+    def update(self, close, closed=True):
+        diff = 0.0 if self.prev_close is None else close - self.prev_close
+        up = self.up.update(max(diff, 0.0), closed)
+        down = self.down.update(max(-diff, 0.0), closed)
+        if closed:
+            self.prev_close = close
+
+        if math.isnan(down):
+            return NAN
+        if down == 0:
+            return 100.0
+        return 100 - (100 / (1 + up / down))
+
+
+class MACD:
+    """MACD line, signal line and histogram, as ta.trend.MACD."""
+
+    def __init__(self, window_slow=26, window_fast=12, window_sign=9):
+        self.fast = EMA(2 / (window_fast + 1), window_fast)
+        self.slow = EMA(2 / (window_slow + 1), window_slow)
+        self.signal = EMA(2 / (window_sign + 1), window_sign)
+
+    def update(self, close, closed=True):
+        macd = self.fast.update(close, closed) - self.slow.update(close, closed)
+        if math.isnan(macd):
+            # The signal line starts at the first defined MACD value
+            return NAN, NAN, NAN
+        signal = self.signal.update(macd, closed)
+        return macd, signal, macd - signal
+
+
+class BollingerBands:
+    """Bollinger Bands from a rolling sum and sum of squares, as ta.volatility.BollingerBands."""
+
+    def __init__(self, window=20, window_dev=2):
+        self.window = window
+        self.window_dev = window_dev
+        self.values = deque()
+        self.total = 0.0
+        self.total_sq = 0.0
+        self.updates = 0
+
+    def update(self, close, closed=True):
+        total = self.total + close
+        total_sq = self.total_sq + close * close
+        count = len(self.values) + 1
+        if count > self.window:
+            oldest = self.values[0]
+            total -= oldest
+            total_sq -= oldest * oldest
+            count -= 1
+
+        if closed:
+            self.values.append(close)
+            if len(self.values) > self.window:
+                self.values.popleft()
+            self.updates += 1
+            if self.updates % self.window == 0:
+                # Re-sum once per window so add/subtract rounding cannot accumulate
+                total = math.fsum(self.values)
+                total_sq = math.fsum(v * v for v in self.values)
+            self.total = total
+            self.total_sq = total_sq
+
+        if count < self.window:
+            return NAN, NAN, NAN
+        middle = total / count
+        std = math.sqrt(max(total_sq / count - middle * middle, 0.0))
+        return middle + self.window_dev * std, middle - self.window_dev * std, middle
+
+
+class IndicatorEngine:
+    """RSI, MACD and Bollinger Bands with the parameters used by analyze.py."""
+
+    def __init__(self, rsi_window=7, macd_slow=26, macd_fast=12, macd_sign=9, bb_window=20, bb_dev=2):
+        self.rsi = RSI(rsi_window)
+        self.macd = MACD(macd_slow, macd_fast, macd_sign)
+        self.bollinger = BollingerBands(bb_window, bb_dev)
+
+    def seed(self, closes):
+        """Feed historical closes, oldest first."""
+        for close in closes:
+            self.update(close)
+        return self
+
+    def update(self, close, closed=True):
+        """Return the indicator values after `close`, keyed like calculate_indicators() columns."""
+        macd, macd_signal, macd_diff = self.macd.update(close, closed)
+        bb_high, bb_low, bb_middle = self.bollinger.update(close, closed)
+        return {
+            'close': close,
+            'rsi': self.rsi.update(close, closed),
+            'macd': macd,
+            'macd_signal': macd_signal,
+            'macd_diff': macd_diff,
+            'bb_high': bb_high,
+            'bb_low': bb_low,
+            'bb_middle': bb_middle
+        }
+
+
+def compare_with_ta(closes, **params):
+    """Return the largest absolute difference per column between the engine and `ta`."""
+    import numpy as np
+    import pandas as pd
+    import ta
+
+    engine = IndicatorEngine(**params)
+    engine_df = pd.DataFrame([engine.update(close) for close in closes])
+
+    close = pd.Series(closes, dtype=float)
+    rsi_window = params.get('rsi_window', 7)
+    macd = ta.trend.MACD(
+        close,
+        window_slow=params.get('macd_slow', 26),
+        window_fast=params.get('macd_fast', 12),
+        window_sign=params.get('macd_sign', 9)
+    )
+    bollinger = ta.volatility.BollingerBands(
+        close, window=params.get('bb_window', 20), window_dev=params.get('bb_dev', 2)
+    )
+    ta_df = pd.DataFrame({
+        'rsi': ta.momentum.RSIIndicator(close, window=rsi_window).rsi(),
+        'macd': macd.macd(),
+        'macd_signal': macd.macd_signal(),
+        'macd_diff': macd.macd_diff(),
+        'bb_high': bollinger.bollinger_hband(),
+        'bb_low': bollinger.bollinger_lband(),
+        'bb_middle': bollinger.bollinger_mavg()
+    })
+
+    differences = {}
+    for column in ta_df.columns:
+        expected = ta_df[column].to_numpy()
+        actual = engine_df[column].to_numpy()
+        if not np.array_equal(np.isnan(expected), np.isnan(actual)):
+            differences[column] = float('inf')
+        else:
+            defined = ~np.isnan(expected)
+            differences[column] = float(np.max(np.abs(expected[defined] - actual[defined]), initial=0.0))
+    return differences
+
+
+if __name__ == "__main__":
+    # Cross-check the engine against ta on live data, e.g. indicators.py BTCUSDT 1h
+    import sys
+    from klines import load_klines
+
+    if len(sys.argv) != 3:
+        print("Usage: python indicators.py <trading-pair> <interval>")
+        sys.exit(1)
+
+    df = load_klines(sys.argv[1].upper(), sys.argv[2], limit=1000)
+    for column, difference in compare_with_ta(df['close'].tolist()).items():
+        print(f"{column}: max abs difference {difference:.3e}")
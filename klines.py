@@ -0,0 +1,302 @@
+"""Local kline store shared by analyze.py and ichimoku.py.
+
+Closed candles are kept in one fixed-width binary file per symbol/interval
+and memory-mapped on read. A sync only downloads the candles that closed
+after the last stored close_time; the still-open candle is returned with
+the data but never written to disk.
+"""
+
+import os
+import json
+import time
+import fcntl
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+import rest
+
+STORE_DIR = os.environ.get(
+    'KLINE_STORE_DIR',
+    os.path.join(os.path.expanduser('~'), '.cache', 'trading-tools', 'klines')
+)
+MAX_LIMIT = 1000  # Largest page /api/v3/klines will return
+BACKFILL_WORKERS = 8  # Pages fetched in parallel; rest.get keeps them inside the weight limit
+
+INTERVAL_MS = {
+    '1s': 1000,
+    '1m': 60_000,
+    '3m': 3 * 60_000,
+    '5m': 5 * 60_000,
+    '15m': 15 * 60_000,
+    '30m': 30 * 60_000,
+    '1h': 3_600_000,
+    '2h': 2 * 3_600_000,
+    '4h': 4 * 3_600_000,
+    '6h': 6 * 3_600_000,
+    '8h': 8 * 3_600_000,
+    '12h': 12 * 3_600_000,
+    '1d': 86_400_000,
+    '3d': 3 * 86_400_000,
+    '1w': 7 * 86_400_000,
+}
+
+KLINE_COLUMNS = [
+    'timestamp', 'open', 'high', 'low', 'close', 'volume',
+    'close_time', 'quote_asset_volume', 'number_of_trades',
+    'taker_buy_base_asset_volume', 'taker_buy_quote_asset_volume', 'ignore'
+]
+
+# On-disk record layout; the trailing 'ignore' column is not stored
+KLINE_DTYPE = np.dtype([
+    ('timestamp', '<i8'),
+    ('open', '<f8'),
+    ('high', '<f8'),
+    ('low', '<f8'),
+    ('close', '<f8'),
+    ('volume', '<f8'),
+    ('close_time', '<i8'),
+    ('quote_asset_volume', '<f8'),
+    ('number_of_trades', '<i8'),
+    ('taker_buy_base_asset_volume', '<f8'),
+    ('taker_buy_quote_asset_volume', '<f8'),
+])
+
+
+def store_path(symbol, interval):
+    """Return the store file for a symbol/interval pair."""
+    # '1M' (month) and '1m' (minute) would collide on case-insensitive filesystems
+    interval_name = interval.replace('M', 'mo')
+    return os.path.join(STORE_DIR, f"{symbol.upper()}_{interval_name}.klines")
+
+
+def fetch_klines(symbol, interval, start_time=None, end_time=None, limit=None):
+    """Fetch candles from the Binance REST API as KLINE_DTYPE records."""
+    params = {
+        'symbol': symbol,
+        'interval': interval
+    }
+    if start_time is not None:
+        params['startTime'] = int(start_time)
+    if end_time is not None:
+        params['endTime'] = int(end_time)
+    if limit is not None:
+        params['limit'] = int(limit)
+
+    return decode_klines(rest.get_raw('/api/v3/klines', params=params))
+
+
+def interval_ms(interval):
+    """Return the fixed length of an interval in milliseconds."""
+    if interval not in INTERVAL_MS:
+        raise ValueError(f"Unsupported interval for paging: {interval}")
+    return INTERVAL_MS[interval]
+
+
+def decode_klines(payload):
+    """Decode a raw /api/v3/klines response body into KLINE_DTYPE records.
+
+    The body is a JSON list of 12-field rows whose prices are quoted strings.
+    Dropping the brackets and quotes leaves one flat comma-separated list of
+    numbers that NumPy parses in C, so no per-field Python objects are built.
+    Times and counts are below 2**53 and survive the float64 pass exactly.
+    """
+    if payload.lstrip()[:1] == b'{':
+        rest.raise_for_error('/api/v3/klines', json.loads(payload))
+    flat = payload.translate(None, b'[]" \n')
+    if not flat:
+        return np.empty(0, dtype=KLINE_DTYPE)
+
+    values = np.fromstring(flat, dtype=np.float64, sep=',').reshape(-1, len(KLINE_COLUMNS))
+    records = np.empty(len(values), dtype=KLINE_DTYPE)
+    for index, name in enumerate(KLINE_COLUMNS):
+        if name in KLINE_DTYPE.names:
+            records[name] = values[:, index]
+    return records
+
+
+def read_store(symbol, interval):
+    """Memory-map the stored closed candles for a symbol/interval pair."""
+    path = store_path(symbol, interval)
+    if not os.path.exists(path) or os.path.getsize(path) < KLINE_DTYPE.itemsize:
+        return np.empty(0, dtype=KLINE_DTYPE)
+    count = os.path.getsize(path) // KLINE_DTYPE.itemsize
+    return np.memmap(path, dtype=KLINE_DTYPE, mode='r', shape=(count,))
+
+
+def write_store(symbol, interval, records):
+    """Replace the stored candles for a symbol/interval pair."""
+    path = store_path(symbol, interval)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(np.ascontiguousarray(records, dtype=KLINE_DTYPE).tobytes())
+    os.replace(tmp_path, path)
+
+
+def append_store(symbol, interval, records):
+    """Append closed candles to the store for a symbol/interval pair; call under store_lock.
+
+    A partial record left by an interrupted write is cut off first, so the
+    new candles start on a record boundary.
+    """
+    if len(records) == 0:
+        return
+    with open(store_path(symbol, interval), 'ab') as f:
+        size = f.seek(0, os.SEEK_END)
+        if size % KLINE_DTYPE.itemsize:
+            f.truncate(size - size % KLINE_DTYPE.itemsize)
+        f.write(np.ascontiguousarray(records, dtype=KLINE_DTYPE).tobytes())
+
+
+def history_start(symbol, interval):
+    """Open time (ms) of the symbol's first candle when the store is known to reach it, else None."""
+    try:
+        with open(store_path(symbol, interval) + '.first') as f:
+            return int(f.read())
+    except (OSError, ValueError):
+        return None
+
+
+def mark_history_start(symbol, interval, open_time):
+    """Record that no candle exists before `open_time`, so syncs stop asking for older ones."""
+    with open(store_path(symbol, interval) + '.first', 'w') as f:
+        f.write(str(int(open_time)))
+
+
+@contextmanager
+def store_lock(symbol, interval):
+    """Serialise syncs of the same symbol/interval across processes."""
+    os.makedirs(STORE_DIR, exist_ok=True)
+    with open(store_path(symbol, interval) + '.lock', 'w') as lock_file:
+        fcntl.flock(lock_file, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+
+def sync_klines(symbol, interval, limit=500):
+    """Bring the store up to date and return (stored, open_candles).
+
+    An empty store is seeded with the latest `limit` candles. Afterwards only
+    candles newer than the last stored close_time are requested, plus older
+    ones while the store holds fewer than `limit` and the symbol's first
+    candle has not been reached. The last row of the newest page may still be
+    open, so it is returned separately and fetched again on the next sync.
+    """
+    symbol = symbol.upper()
+    with store_lock(symbol, interval):
+        stored = read_store(symbol, interval)
+
+        if len(stored) == 0:
+            records = fetch_klines(symbol, interval, limit=min(limit, MAX_LIMIT))
+            append_store(symbol, interval, records[:-1])
+            if 1 < len(records) < min(limit, MAX_LIMIT):
+                mark_history_start(symbol, interval, records['timestamp'][0])
+            return read_store(symbol, interval), records[-1:]
+
+        if len(stored) + 1 < limit and history_start(symbol, interval) != stored['timestamp'][0]:
+            # Extend the stored history backwards when a caller needs more of it
+            missing = min(limit - len(stored) - 1, MAX_LIMIT)
+            older = fetch_klines(
+                symbol, interval, end_time=stored['timestamp'][0] - 1, limit=missing
+            )
+            if len(older):
+                write_store(symbol, interval, np.concatenate([older, stored]))
+                stored = read_store(symbol, interval)
+            if len(older) < missing:
+                # The symbol has no older candles; a short history costs no request next time
+                mark_history_start(symbol, interval, stored['timestamp'][0])
+
+        start_time = int(stored['close_time'][-1]) + 1
+        new_records = []
+        while True:
+            records = fetch_klines(symbol, interval, start_time=start_time, limit=MAX_LIMIT)
+            new_records.append(records)
+            if len(records) < MAX_LIMIT:
+                break
+            start_time = int(records['close_time'][-1]) + 1
+
+        records = np.concatenate(new_records)
+        append_store(symbol, interval, records[:-1])
+        return read_store(symbol, interval), records[-1:]
+
+
+def klines_frame(records):
+    """Build a DataFrame with a datetime 'timestamp' column from kline records."""
+    df = pd.DataFrame({name: np.asarray(records[name]) for name in KLINE_DTYPE.names})
+    df['timestamp'] = pd.to_datetime(df['timestamp'], unit='ms')
+    return df
+
+
+def load_klines(symbol, interval, limit=500):
+    """Return the latest `limit` candles, including the open one, as a DataFrame."""
+    stored, open_candles = sync_klines(symbol, interval, limit=limit)
+    records = np.concatenate([stored[max(len(stored) - limit, 0):], open_candles])
+    return klines_frame(records[-limit:])
+
+
+def backfill_records(symbol, interval, start_time, end_time=None, max_workers=BACKFILL_WORKERS):
+    """Fetch all candles opened between start_time and end_time (ms) in parallel pages.
+
+    The range is cut into MAX_LIMIT-candle chunks by startTime/endTime, the
+    chunks are fetched concurrently and the pages are stitched back in time
+    order with duplicate open times removed.
+    """
+    step = interval_ms(interval)
+    if end_time is None:
+        end_time = int(time.time() * 1000)
+
+    # Start paging at the first candle that exists, so ranges before a listing cost one request
+    first = fetch_klines(symbol, interval, start_time=start_time, end_time=end_time, limit=1)
+    if len(first) == 0:
+        return first
+    start_time = int(first['timestamp'][0])
+    chunk = step * MAX_LIMIT
+    ranges = [(start, min(start + chunk - 1, int(end_time))) for start in range(start_time, int(end_time) + 1, chunk)]
+
+    def fetch_page(page_range):
+        return fetch_klines(
+            symbol, interval, start_time=page_range[0], end_time=page_range[1], limit=MAX_LIMIT
+        )
+
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        pages = list(pool.map(fetch_page, ranges))
+
+    records = np.concatenate(pages) if pages else np.empty(0, dtype=KLINE_DTYPE)
+    _, first = np.unique(records['timestamp'], return_index=True)
+    return records[first]
+
+
+def backfill_klines(symbol, interval, start_time, end_time=None, max_workers=BACKFILL_WORKERS):
+    """Return every candle between start_time and end_time (ms) as one DataFrame."""
+    return klines_frame(backfill_records(symbol.upper(), interval, start_time, end_time, max_workers))
+
+
+def backfill_store(symbol, interval, start_time, max_workers=BACKFILL_WORKERS):
+    """Extend the store back to start_time (ms) and return the number of stored candles."""
+    symbol = symbol.upper()
+    with store_lock(symbol, interval):
+        stored = read_store(symbol, interval)
+        end_time = int(stored['timestamp'][0]) - 1 if len(stored) else None
+        records = backfill_records(symbol, interval, start_time, end_time, max_workers)
+        # Only closed candles go to disk; sync_klines picks up the open one
+        records = records[records['close_time'] < int(time.time() * 1000)]
+        if len(records):
+            write_store(symbol, interval, np.concatenate([records, stored]))
+    return len(sync_klines(symbol, interval)[0])
+
+
+if __name__ == "__main__":
+    # Example: klines.py backfill BTCUSDT 1m 2021-01-01
+    import sys
+
+    if len(sys.argv) != 5 or sys.argv[1] != 'backfill':
+        print("Usage: python klines.py backfill <trading-pair> <interval> <start-date>")
+        sys.exit(1)
+
+    start = int(pd.Timestamp(sys.argv[4], tz='UTC').timestamp() * 1000)
+    count = backfill_store(sys.argv[2], sys.argv[3], start)
+    print(f"{count} closed candles stored in {store_path(sys.argv[2], sys.argv[3])}")
@@ -0,0 +1,163 @@
+"""Local per-symbol trade ledger for breakeven.py.
+
+The first sync pages through the whole account trade history for a symbol;
+later syncs ask only for trades after the last stored id, which is a single
+request. Fills are appended to a JSON-lines file and folded as they arrive
+into a small state file holding the open position with both its average
+cost and its FIFO lots, so reading a breakeven never touches the history.
+"""
+
+import os
+import json
+import fcntl
+from contextlib import contextmanager
+from decimal import Decimal, Context, localcontext
+
+LEDGER_DIR = os.environ.get(
+    'TRADE_LEDGER_DIR',
+    os.path.join(os.path.expanduser('~'), '.cache', 'trading-tools', 'trades')
+)
+TRADES_LIMIT = 1000  # Largest page /api/v3/myTrades will return
+TRADING_FEE_PERCENT = Decimal('0.001')  # 0.1% trading fee
+
+# Ledger sums need more digits than the 8 breakeven.py uses for display
+LEDGER_CONTEXT = Context(prec=28)
+
+
+def trades_path(symbol):
+    return os.path.join(LEDGER_DIR, f"{symbol.upper()}.jsonl")
+
+
+def state_path(symbol):
+    return os.path.join(LEDGER_DIR, f"{symbol.upper()}.state.json")
+
+
+def empty_state():
+    return {
+        'last_id': -1,
+        'trade_count': 0,
+        'position': '0',
+        'cost': '0',
+        'lots': [],  # FIFO [quantity, cost] pairs of the open position, oldest first
+        'last_trade': None
+    }
+
+
+def read_state(symbol):
+    """Return the folded ledger state for a symbol without reading its trades."""
+    try:
+        with open(state_path(symbol)) as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return empty_state()
+
+
+def read_trades(symbol):
+    """Return every stored fill for a symbol, oldest first."""
+    try:
+        with open(trades_path(symbol)) as f:
+            return [json.loads(line) for line in f if line.strip()]
+    except FileNotFoundError:
+        return []
+
+
+@contextmanager
+def ledger_lock(symbol):
+    """Serialise syncs of the same symbol across processes."""
+    os.makedirs(LEDGER_DIR, exist_ok=True)
+    with open(state_path(symbol) + '.lock', 'w') as lock_file:
+        fcntl.flock(lock_file, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+
+def apply_trade(state, trade):
+    """Fold one fill into the average-cost and FIFO position state."""
+    with localcontext(LEDGER_CONTEXT):
+        price = Decimal(trade['price'])
+        qty = Decimal(trade['qty'])
+        position = Decimal(state['position'])
+        cost = Decimal(state['cost'])
+        lots = [[Decimal(lot_qty), Decimal(lot_cost)] for lot_qty, lot_cost in state['lots']]
+
+        if trade['isBuyer']:
+            fill_cost = price * qty * (1 + TRADING_FEE_PERCENT)  # Add buy fee
+            position += qty
+            cost += fill_cost
+            lots.append([qty, fill_cost])
+        elif position > 0:
+            # Sells beyond the tracked position (e.g. deposited coins) only close it
+            sold = min(qty, position)
+            cost -= cost * sold / position
+            position -= sold
+
+            remaining = sold
+            while remaining > 0 and lots:
+                lot_qty, lot_cost = lots[0]
+                if lot_qty <= remaining:
+                    remaining -= lot_qty
+                    lots.pop(0)
+                else:
+                    lots[0] = [lot_qty - remaining, lot_cost * (lot_qty - remaining) / lot_qty]
+                    remaining = 0
+
+        state['position'] = str(position)
+        state['cost'] = str(cost if position > 0 else Decimal(0))
+        state['lots'] = [[str(lot_qty), str(lot_cost)] for lot_qty, lot_cost in lots]
+        state['last_id'] = trade['id']
+        state['trade_count'] += 1
+        state['last_trade'] = trade
+    return state
+
+
+def sync_trades(client, symbol):
+    """Fetch trades newer than the ledger, fold them in and return (state, new_trades)."""
+    symbol = symbol.upper()
+    with ledger_lock(symbol):
+        state = read_state(symbol)
+        new_trades = []
+        from_id = state['last_id'] + 1
+        while True:
+            trades = client.get_my_trades(symbol=symbol, fromId=from_id, limit=TRADES_LIMIT)
+            new_trades.extend(trades)
+            if len(trades) < TRADES_LIMIT:
+                break
+            from_id = trades[-1]['id'] + 1
+
+        if new_trades:
+            for trade in new_trades:
+                apply_trade(state, trade)
+            with open(trades_path(symbol), 'a') as f:
+                for trade in new_trades:
+                    f.write(json.dumps(trade) + '\n')
+            tmp_path = f"{state_path(symbol)}.{os.getpid()}.tmp"
+            with open(tmp_path, 'w') as f:
+                json.dump(state, f)
+            os.replace(tmp_path, state_path(symbol))
+    return state, new_trades
+
+
+def position(state):
+    """Return the open position quantity."""
+    return Decimal(state['position'])
+
+
+def average_cost_breakeven(state):
+    """Sell price covering the average cost of the open position and the sell fee."""
+    with localcontext(LEDGER_CONTEXT):
+        quantity = Decimal(state['position'])
+        if quantity <= 0:
+            return None
+        return (Decimal(state['cost']) / quantity) / (1 - TRADING_FEE_PERCENT)
+
+
+def fifo_breakeven(state):
+    """Sell price covering the FIFO cost of the lots still held and the sell fee."""
+    with localcontext(LEDGER_CONTEXT):
+        quantity = sum((Decimal(lot_qty) for lot_qty, _ in state['lots']), Decimal(0))
+        if quantity <= 0:
+            return None
+        cost = sum((Decimal(lot_cost) for _, lot_cost in state['lots']), Decimal(0))
+        return (cost / quantity) / (1 - TRADING_FEE_PERCENT)
@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+
+import sys
+from binance.exceptions import BinanceAPIException, BinanceRequestException
+
+def print_help():
+    print("Usage: live.py <symbol> [<symbol> ...] [--interval 1m,1h] [--url URL] [--record FILE] [--no-seed] [--no-reconnect]")
+    print("       live.py replay <file> [--port 8765] [--delay 0.0]")
+    print("Description: This script follows live kline streams for many trading pairs and prints the analyze.py and ichimoku.py signals each time a candle closes.")
+
+if '-h' in sys.argv or '--help' in sys.argv:
+    print_help()
+    sys.exit(0)
+
+try:
+    import json
+    import asyncio
+    import argparse
+    from collections import deque
+    import pandas as pd
+    import websockets
+    from trading_tools.analyze import analyze_data
+    from ichimoku_engine import IchimokuEngine
+    from indicators import IndicatorEngine
+    from klines import load_klines
+
+    STREAM_URL = 'wss://stream.binance.com:9443/stream'
+    HISTORY = 1000  # Closed candles kept per stream, as many as ichimoku.py analyses
+    ICHIMOKU_WINDOWS = (9, 18, 24)
+    RECONNECT_DELAY = 5
+
+    class KlineStream:
+        """Rolling candle buffer and signal state for one symbol/interval stream."""
+
+        def __init__(self, symbol, interval, history=HISTORY):
+            self.symbol = symbol
+            self.interval = interval
+            self.candles = deque(maxlen=history)
+            self.engine = IndicatorEngine()
+            self.ichimoku = IchimokuEngine([ICHIMOKU_WINDOWS])
+
+        @property
+        def name(self):
+            return f"{self.symbol.lower()}@kline_{self.interval}"
+
+        def seed(self, df):
+            """Load closed candles (oldest first) from a klines frame."""
+            self.candles.clear()
+            self.engine = IndicatorEngine()
+            self.ichimoku = IchimokuEngine([ICHIMOKU_WINDOWS])
+            for row in df.itertuples(index=False):
+                self.add_candle(int(row.timestamp.timestamp() * 1000), row.open, row.high, row.low, row.close, row.volume)
+
+        def add_candle(self, open_time, open_, high, low, close, volume):
+            self.candles.append((open_time, open_, high, low, close, volume))
+            self.ichimoku.append(high, low, close)
+            return self.engine.update(close)
+
+        def on_kline(self, kline):
+            """Apply one kline event; return the signals when it closes a new candle."""
+            if not kline['x'] or (self.candles and kline['t'] <= self.candles[-1][0]):
+                return None
+
+            values = self.add_candle(
+                kline['t'], float(kline['o']), float(kline['h']), float(kline['l']), float(kline['c']), float(kline['v'])
+            )
+            signals = analyze_data(pd.DataFrame([values]))
+            signals['Ichimoku'] = self.ichimoku.signal()
+            return signals
+
+    def seed_streams(streams):
+        for stream in streams.values():
+            # The last row from load_klines is the still-open candle; the stream delivers it on close
+            stream.seed(load_klines(stream.symbol, stream.interval, limit=HISTORY + 1).iloc[:-1])
+
+    def print_signals(stream, kline, signals):
+        close_time = pd.to_datetime(kline['T'], unit='ms')
+        summary = ", ".join(f"{indicator}: {signal}" for indicator, signal in signals.items())
+        print(f"{close_time} {stream.symbol} {stream.interval} close={kline['c']} {summary}", flush=True)
+
+    async def follow(streams, url=STREAM_URL, on_signals=print_signals, seed=True, record=None, reconnect=True):
+        """Subscribe to every stream on one connection and evaluate each closed candle.
+
+        The subscription goes out before the streams are seeded, and messages
+        that arrive meanwhile wait in a queue, so a candle closing during the
+        seed is still delivered; one the seed already holds is skipped.
+        """
+        record_file = open(record, 'a') if record else None
+        try:
+            while True:
+                try:
+                    async with websockets.connect(url) as websocket:
+                        await websocket.send(json.dumps({'method': 'SUBSCRIBE', 'params': list(streams), 'id': 1}))
+                        messages = asyncio.Queue()
+
+                        async def receive():
+                            try:
+                                async for message in websocket:
+                                    messages.put_nowait(message)
+                            finally:
+                                messages.put_nowait(None)
+
+                        receiver = asyncio.create_task(receive())
+                        try:
+                            if seed:
+                                # Re-seeding on every connect fills any candles missed while disconnected
+                                await asyncio.get_running_loop().run_in_executor(None, seed_streams, streams)
+
+                            while (message := await messages.get()) is not None:
+                                if record_file:
+                                    record_file.write(message.rstrip('\n') + '\n')
+                                payload = json.loads(message)
+                                stream = streams.get(payload.get('stream'))
+                                if stream is None:
+                                    continue
+                                kline = payload['data']['k']
+                                signals = stream.on_kline(kline)
+                                if signals is not None:
+                                    on_signals(stream, kline, signals)
+                            await receiver  # Raises when the connection closed with an error
+                        finally:
+                            receiver.cancel()
+                    if not reconnect:
+                        return
+                except (OSError, websockets.ConnectionClosed) as e:
+                    if not reconnect:
+                        raise
+                    print(f"Stream connection lost ({e}), reconnecting in {RECONNECT_DELAY} s", flush=True)
+                    await asyncio.sleep(RECONNECT_DELAY)
+        finally:
+            if record_file:
+                record_file.close()
+
+    async def replay(path, host='127.0.0.1', port=8765, delay=0.0, on_start=None):
+        """Serve recorded stream messages to each client, a local stand-in for the Binance stream.
+
+        Port 0 picks a free port; on_start(port) is called once the server listens.
+        """
+        with open(path) as f:
+            messages = [line.rstrip('\n') for line in f if line.strip()]
+
+        async def handler(websocket):
+            request = json.loads(await websocket.recv())
+            await websocket.send(json.dumps({'result': None, 'id': request.get('id')}))
+            subscribed = set(request.get('params', []))
+            for message in messages:
+                if json.loads(message).get('stream') in subscribed:
+                    await websocket.send(message)
+                    await asyncio.sleep(delay)
+
+        async with websockets.serve(handler, host, port) as server:
+            port = server.sockets[0].getsockname()[1]
+            print(f"Replaying {len(messages)} messages from {path} on ws://{host}:{port}", flush=True)
+            if on_start:
+                on_start(port)
+            await asyncio.Future()
+
+    def main():
+        if len(sys.argv) >= 3 and sys.argv[1] == 'replay':
+            parser = argparse.ArgumentParser(description="Replay recorded kline stream messages")
+            parser.add_argument('file', help='Recording written with --record')
+            parser.add_argument('--port', type=int, default=8765)
+            parser.add_argument('--delay', type=float, default=0.0, help='Seconds between messages')
+            args = parser.parse_args(sys.argv[2:])
+            asyncio.run(replay(args.file, port=args.port, delay=args.delay))
+            return
+
+        parser = argparse.ArgumentParser(description="Live kline stream signals")
+        parser.add_argument('symbols', nargs='+', help='Trading pair symbols (e.g., BTCUSDT ETHUSDT)')
+        parser.add_argument('--interval', default='1m', help='Comma-separated kline intervals (default: 1m)')
+        parser.add_argument('--url', default=STREAM_URL, help='Stream endpoint, e.g. a local replay server')
+        parser.add_argument('--record', default=None, help='Append every received message to this file')
+        parser.add_argument('--no-seed', action='store_true', help='Do not pre-load history from the kline store')
+        parser.add_argument('--no-reconnect', action='store_true', help='Exit when the connection closes (for replays)')
+        args = parser.parse_args()
+
+        streams = {}
+        for symbol in args.symbols:
+            for interval in args.interval.split(','):
+                stream = KlineStream(symbol.upper(), interval)
+                streams[stream.name] = stream
+
+        asyncio.run(follow(
+            streams, url=args.url, seed=not args.no_seed, record=args.record, reconnect=not args.no_reconnect
+        ))
+
+    if __name__ == "__main__":
+        main()
+
+except BinanceAPIException as e:
+    print(f"Binance API Exception: {e}")
+except BinanceRequestException as e:
+    print(f"Binance Request Exception: {e}")
+except IndexError:
+    print("Error: Missing command line arguments.")
+    print_help()
+except KeyboardInterrupt:
+    pass
+except Exception as e:
+    print(f"An unexpected error occurred: {e}")
@@ -0,0 +1,395 @@
+"""Local stand-in for the Binance spot REST API, for offline runs and benchmarks.
+
+Serves exchangeInfo, ticker prices, avgPrice, account and myTrades from the
+JSON fixtures in FIXTURE_DIR. Orders are accepted and kept in memory: MARKET
+orders fill at the ticker price, LIMIT orders rest until cancelled. Klines
+come from a recorded fixture (fixtures/mock_binance/klines/SYMBOL_INTERVAL.json,
+written by --record) shifted so its last candle is the current one, or else
+from a random walk seeded by symbol and interval that ends at the ticker
+price. Either way the answer to the same request is the same on every run.
+
+Every request waits `latency` seconds plus up to `jitter` more before it is
+answered, and is counted per path; GET /mock/stats returns the counts, and
+the klines served from the random walk, and POST /mock/reset clears the
+counts along with the orders. Signatures and API keys
+are not checked.
+
+Point the scripts at it with BINANCE_API_URL=http://127.0.0.1:8765 (see rest.py).
+"""
+
+import os
+import json
+import time
+import random
+import threading
+from urllib.parse import urlsplit, parse_qsl
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from klines import INTERVAL_MS
+from ratelimit import request_weight
+
+FIXTURE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures', 'mock_binance')
+HOST = '127.0.0.1'
+PORT = 8765
+KLINE_HISTORY = 2000  # Candles per symbol and interval, the current open one included
+KLINE_LIMIT_DEFAULT = 500
+KLINE_LIMIT_MAX = 1000
+
+
+def load_fixture(name, fixture_dir=FIXTURE_DIR):
+    with open(os.path.join(fixture_dir, name)) as f:
+        return json.load(f)
+
+
+def kline_row(open_time, interval, open_price, close_price, rng):
+    """One /api/v3/klines row around the given open and close."""
+    high = max(open_price, close_price) * (1 + abs(rng.gauss(0, 0.002)))
+    low = min(open_price, close_price) * (1 - abs(rng.gauss(0, 0.002)))
+    volume = rng.uniform(10, 1000)
+    taker = volume * rng.uniform(0.3, 0.7)
+    average = (open_price + close_price) / 2
+    return [
+        open_time, f"{open_price:.8f}", f"{high:.8f}", f"{low:.8f}", f"{close_price:.8f}", f"{volume:.8f}",
+        open_time + INTERVAL_MS[interval] - 1, f"{volume * average:.8f}", rng.randint(100, 5000),
+        f"{taker:.8f}", f"{taker * average:.8f}", "0"
+    ]
+
+
+def generate_klines(symbol, interval, last_open, last_close, count=KLINE_HISTORY):
+    """A seeded random walk of `count` candles whose last one opens at `last_open` and closes at `last_close`."""
+    rng = random.Random(f"{symbol}:{interval}")
+    step = INTERVAL_MS[interval]
+    volatility = 0.01 * (step / 3_600_000) ** 0.5
+    closes = [last_close]
+    for _ in range(count):
+        closes.append(closes[-1] / (1 + rng.gauss(0, volatility)))
+    closes.reverse()  # closes[0] is the open of the first candle
+    return [
+        kline_row(last_open - (count - 1 - i) * step, interval, closes[i], closes[i + 1], rng)
+        for i in range(count)
+    ]
+
+
+def shift_klines(rows, last_open):
+    """Move recorded candles in time so the last one opens at `last_open`."""
+    shift = last_open - rows[-1][0]
+    return [[row[0] + shift, *row[1:6], row[6] + shift, *row[7:]] for row in rows]
+
+
+class MockError(Exception):
+    """A Binance error response: HTTP status plus the API's code and msg."""
+
+    def __init__(self, status, code, msg):
+        super().__init__(msg)
+        self.status = status
+        self.code = code
+        self.msg = msg
+
+
+class MockBinance:
+    """Fixture data, resting orders and request counts behind the HTTP handler."""
+
+    def __init__(self, fixture_dir=FIXTURE_DIR, latency=0.0, jitter=0.0):
+        self.fixture_dir = fixture_dir
+        self.latency = latency
+        self.jitter = jitter
+        self.exchange_info = load_fixture('exchangeInfo.json', fixture_dir)
+        self.symbols = {info['symbol']: info for info in self.exchange_info['symbols']}
+        self.tickers = {ticker['symbol']: ticker['price'] for ticker in load_fixture('tickers.json', fixture_dir)}
+        self.account = load_fixture('account.json', fixture_dir)
+        self.trades = load_fixture('myTrades.json', fixture_dir)
+        self.klines = {}  # (symbol, interval) -> (last open time, rows)
+        self.generated = set()  # 'SYMBOL interval' served from the random walk for want of a recording
+        self.orders = {}
+        self.next_order_id = 1
+        self.counts = {}
+        self.weight = (0, 0)  # (minute, used weight) for the X-MBX-USED-WEIGHT-1M header
+        self.lock = threading.Lock()
+
+    def count(self, method, path, query):
+        with self.lock:
+            key = f"{method} {path}"
+            self.counts[key] = self.counts.get(key, 0) + 1
+            minute = int(time.time() // 60)
+            used = self.weight[1] if self.weight[0] == minute else 0
+            self.weight = (minute, used + request_weight(method, path, query))
+            return self.weight[1]
+
+    def stats(self):
+        with self.lock:
+            return {
+                'requests': sum(self.counts.values()),
+                'paths': dict(sorted(self.counts.items())),
+                'generated_klines': sorted(self.generated)
+            }
+
+    def reset(self):
+        with self.lock:
+            self.counts = {}
+            self.orders = {}
+            self.weight = (0, 0)
+
+    def delay(self):
+        if self.latency or self.jitter:
+            time.sleep(self.latency + random.uniform(0, self.jitter))
+
+    def symbol(self, params):
+        symbol = params.get('symbol')
+        if symbol not in self.symbols:
+            raise MockError(400, -1121, 'Invalid symbol.')
+        return symbol
+
+    def kline_rows(self, symbol, interval):
+        if interval not in INTERVAL_MS:
+            raise MockError(400, -1120, 'Invalid interval.')
+        step = INTERVAL_MS[interval]
+        last_open = int(time.time() * 1000) // step * step
+        with self.lock:
+            cached = self.klines.get((symbol, interval))
+            if cached is None or cached[0] != last_open:
+                path = os.path.join(self.fixture_dir, 'klines', f"{symbol}_{interval}.json")
+                if os.path.exists(path):
+                    with open(path) as f:
+                        rows = shift_klines(json.load(f), last_open)
+                else:
+                    rows = generate_klines(symbol, interval, last_open, float(self.tickers.get(symbol, 1.0)))
+                    self.generated.add(f"{symbol} {interval}")
+                cached = self.klines[(symbol, interval)] = (last_open, rows)
+        return cached[1]
+
+    def get_klines(self, params):
+        rows = self.kline_rows(self.symbol(params), params.get('interval'))
+        limit = min(int(params.get('limit', KLINE_LIMIT_DEFAULT)), KLINE_LIMIT_MAX)
+        if 'startTime' in params:
+            rows = [row for row in rows if row[0] >= int(params['startTime'])]
+        if 'endTime' in params:
+            rows = [row for row in rows if row[0] <= int(params['endTime'])]
+        return rows[:limit] if 'startTime' in params else rows[-limit:]
+
+    def get_tickers(self, params):
+        if 'symbol' in params:
+            return {'symbol': self.symbol(params), 'price': self.tickers[params['symbol']]}
+        if 'symbols' in params:
+            wanted = json.loads(params['symbols'])
+            return [{'symbol': symbol, 'price': self.tickers[symbol]} for symbol in wanted if symbol in self.tickers]
+        return [{'symbol': symbol, 'price': price} for symbol, price in self.tickers.items()]
+
+    def get_my_trades(self, params):
+        trades = self.trades.get(self.symbol(params), [])
+        from_id = int(params.get('fromId', 0))
+        limit = min(int(params.get('limit', 500)), 1000)
+        return [trade for trade in trades if trade['id'] >= from_id][:limit]
+
+    def place_order(self, params):
+        symbol = self.symbol(params)
+        order_type = params.get('type', 'LIMIT')
+        price = params.get('price') if order_type == 'LIMIT' else self.tickers[symbol]
+        if 'quantity' in params:
+            quantity = params['quantity']
+        else:
+            quantity = f"{float(params['quoteOrderQty']) / float(price):.8f}"
+        filled = order_type == 'MARKET'
+        with self.lock:
+            order_id = self.next_order_id
+            self.next_order_id += 1
+            now = int(time.time() * 1000)
+            order = {
+                'symbol': symbol, 'orderId': order_id, 'orderListId': -1,
+                'clientOrderId': params.get('newClientOrderId', f"mock{order_id}"), 'transactTime': now,
+                'price': price if order_type == 'LIMIT' else '0.00000000', 'origQty': quantity,
+                'executedQty': quantity if filled else '0.00000000',
+                'cummulativeQuoteQty': f"{float(quantity) * float(price):.8f}" if filled else '0.00000000',
+                'status': 'FILLED' if filled else 'NEW', 'timeInForce': params.get('timeInForce', 'GTC'),
+                'type': order_type, 'side': params.get('side'), 'workingTime': now,
+                'selfTradePreventionMode': 'EXPIRE_MAKER'
+            }
+            self.orders[order_id] = order
+        response = dict(order)
+        if filled:
+            response['fills'] = [{'price': price, 'qty': quantity, 'commission': '0.00000000', 'commissionAsset': 'BNB', 'tradeId': order_id}]
+        return response
+
+    def find_order(self, params):
+        order = self.orders.get(int(params.get('orderId', 0)))
+        if order is None or order['symbol'] != params.get('symbol'):
+            raise MockError(400, -2013, 'Order does not exist.')
+        return order
+
+    def cancel_order(self, params):
+        with self.lock:
+            order = self.find_order(params)
+            if order['status'] not in ('NEW', 'PARTIALLY_FILLED'):
+                raise MockError(400, -2011, 'Unknown order sent.')
+            order['status'] = 'CANCELED'
+            return dict(order)
+
+    def open_orders(self, params):
+        with self.lock:
+            return [dict(order) for order in self.orders.values()
+                    if order['status'] in ('NEW', 'PARTIALLY_FILLED') and params.get('symbol') in (None, order['symbol'])]
+
+    def handle(self, method, path, params):
+        """Answer one API request with a JSON-serialisable payload."""
+        if method == 'GET':
+            if path == '/api/v3/ping':
+                return {}
+            if path == '/api/v3/time':
+                return {'serverTime': int(time.time() * 1000)}
+            if path == '/api/v3/exchangeInfo':
+                return self.exchange_info
+            if path == '/api/v3/klines':
+                return self.get_klines(params)
+            if path == '/api/v3/ticker/price':
+                return self.get_tickers(params)
+            if path == '/api/v3/avgPrice':
+                return {'mins': 5, 'price': self.tickers[self.symbol(params)], 'closeTime': int(time.time() * 1000)}
+            if path == '/api/v3/account':
+                return self.account
+            if path == '/api/v3/myTrades':
+                return self.get_my_trades(params)
+            if path == '/api/v3/order':
+                with self.lock:
+                    return dict(self.find_order(params))
+            if path == '/api/v3/openOrders':
+                return self.open_orders(params)
+        elif path == '/api/v3/order':
+            if method == 'POST':
+                return self.place_order(params)
+            if method == 'DELETE':
+                return self.cancel_order(params)
+        elif path == '/api/v3/userDataStream':
+            return {'listenKey': 'mock-listen-key'} if method == 'POST' else {}
+        raise MockError(404, -1000, f"Not served by the mock: {method} {path}")
+
+
+class MockHandler(BaseHTTPRequestHandler):
+    """Routes HTTP requests to the server's MockBinance."""
+
+    protocol_version = 'HTTP/1.1'  # Keep-alive, like the real API
+
+    def respond(self, status, payload, headers=()):
+        body = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        for name, value in headers:
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def dispatch(self, method):
+        mock = self.server.mock
+        url = urlsplit(self.path)
+        length = int(self.headers.get('Content-Length') or 0)
+        body = self.rfile.read(length).decode() if length else ''
+        params = dict(parse_qsl(url.query))
+        params.update(parse_qsl(body))
+
+        if url.path == '/mock/stats':
+            return self.respond(200, mock.stats())
+        if url.path == '/mock/reset':
+            mock.reset()
+            return self.respond(200, {})
+
+        used = mock.count(method, url.path, url.query)
+        mock.delay()
+        try:
+            payload = mock.handle(method, url.path, params)
+        except MockError as e:
+            return self.respond(e.status, {'code': e.code, 'msg': e.msg})
+        except (KeyError, ValueError) as e:
+            return self.respond(400, {'code': -1102, 'msg': f"Mandatory parameter missing or malformed: {e}"})
+        self.respond(200, payload, [('X-MBX-USED-WEIGHT-1M', str(used))])
+
+    def do_GET(self):
+        self.dispatch('GET')
+
+    def do_POST(self):
+        self.dispatch('POST')
+
+    def do_PUT(self):
+        self.dispatch('PUT')
+
+    def do_DELETE(self):
+        self.dispatch('DELETE')
+
+    def log_message(self, format, *args):
+        pass
+
+
+class MockServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address, mock):
+        super().__init__(address, MockHandler)
+        self.mock = mock
+
+    @property
+    def url(self):
+        return f"http://{self.server_address[0]}:{self.server_address[1]}"
+
+
+def start(host=HOST, port=0, **kwargs):
+    """Start a mock server on a background thread; port 0 picks a free port. Returns the server."""
+    server = MockServer((host, port), MockBinance(**kwargs))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def merge_by_symbol(existing, new):
+    """Entries of `existing` with those of `new` replacing the ones for the same symbol."""
+    merged = {entry['symbol']: entry for entry in existing}
+    merged.update((entry['symbol'], entry) for entry in new)
+    return list(merged.values())
+
+
+def record(symbols, intervals, limit=KLINE_LIMIT_MAX, fixture_dir=FIXTURE_DIR):
+    """Save the live exchangeInfo, prices and klines of `symbols` as fixtures.
+
+    The symbols are merged into the existing exchangeInfo and tickers
+    fixtures, so the pairs that account.json and myTrades.json refer to keep
+    resolving. Those two need API keys and are kept as they are.
+    """
+    import rest
+
+    info = rest.get('/api/v3/exchangeInfo', params={'symbols': json.dumps(symbols, separators=(',', ':'))})
+    tickers = rest.get('/api/v3/ticker/price', params={'symbols': json.dumps(symbols, separators=(',', ':'))})
+    if os.path.exists(os.path.join(fixture_dir, 'exchangeInfo.json')):
+        info['symbols'] = merge_by_symbol(load_fixture('exchangeInfo.json', fixture_dir)['symbols'], info['symbols'])
+    if os.path.exists(os.path.join(fixture_dir, 'tickers.json')):
+        tickers = merge_by_symbol(load_fixture('tickers.json', fixture_dir), tickers)
+
+    os.makedirs(os.path.join(fixture_dir, 'klines'), exist_ok=True)
+    with open(os.path.join(fixture_dir, 'exchangeInfo.json'), 'w') as f:
+        json.dump(info, f, indent=1)
+    with open(os.path.join(fixture_dir, 'tickers.json'), 'w') as f:
+        json.dump(tickers, f, indent=1)
+    for symbol in symbols:
+        for interval in intervals:
+            rows = rest.get('/api/v3/klines', params={'symbol': symbol, 'interval': interval, 'limit': limit})
+            with open(os.path.join(fixture_dir, 'klines', f"{symbol}_{interval}.json"), 'w') as f:
+                json.dump(rows, f, separators=(',', ':'))
+            print(f"Recorded {len(rows)} {interval} candles of {symbol}")
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Local mock of the Binance spot REST API")
+    parser.add_argument('--host', default=HOST)
+    parser.add_argument('--port', type=int, default=PORT)
+    parser.add_argument('--latency', type=float, default=0.0, help='Seconds added to every response')
+    parser.add_argument('--jitter', type=float, default=0.0, help='Up to this many random seconds more')
+    parser.add_argument('--record', nargs='+', metavar='SYMBOL', help='Record public fixtures of these symbols from the live API instead of serving')
+    parser.add_argument('--intervals', nargs='+', default=['1h', '4h', '1d'], help='Kline intervals to record')
+    args = parser.parse_args()
+
+    if args.record:
+        record([symbol.upper() for symbol in args.record], args.intervals)
+    else:
+        server = MockServer((args.host, args.port), MockBinance(latency=args.latency, jitter=args.jitter))
+        print(f"Mock Binance API on {server.url}; export BINANCE_API_URL={server.url}", flush=True)
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
@@ -0,0 +1,105 @@
+"""Thin client for the orderd.py daemon.
+
+Speaks the daemon's JSON-lines protocol over its Unix socket with only the
+standard library. DaemonClient mirrors the python-binance Client methods
+the order scripts use, so a script can swap it in for a freshly built
+Client and skip the ping, the TLS handshake and the exchange info lookups.
+"""
+
+import os
+import json
+import socket
+import itertools
+import threading
+from functools import partial
+
+SOCKET_PATH = os.environ.get(
+    'ORDERD_SOCKET',
+    os.path.join(os.path.expanduser('~'), '.cache', 'trading-tools', 'orderd.sock')
+)
+TIMEOUT = 30  # Seconds to wait for the daemon's answer
+
+
+class DaemonError(Exception):
+    """An error raised inside the daemon, e.g. an order rejected by Binance."""
+
+
+class DaemonClient:
+    """Forwards Client method calls (order_limit, get_asset_balance, ...) to the daemon.
+
+    A connection that times out, fails or answers out of turn is closed, and
+    the next call opens a new one, so a late reply can never be read as the
+    answer to a later request.
+    """
+
+    def __init__(self, path=SOCKET_PATH, timeout=TIMEOUT):
+        self.path = path
+        self.timeout = timeout
+        self.sock = None
+        self.reader = None
+        self.ids = itertools.count(1)
+        self.lock = threading.Lock()  # One request on the socket at a time
+        self._connect()
+
+    def _connect(self):
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.settimeout(self.timeout)
+        try:
+            sock.connect(self.path)
+        except OSError:
+            sock.close()
+            raise
+        self.sock = sock
+        self.reader = sock.makefile('r')
+
+    def _disconnect(self):
+        if self.sock is not None:
+            self.reader.close()
+            self.sock.close()
+        self.sock = None
+        self.reader = None
+
+    def call(self, method, **params):
+        with self.lock:
+            if self.sock is None:
+                self._connect()
+            request = {'id': next(self.ids), 'method': method, 'params': params}
+            try:
+                self.sock.sendall((json.dumps(request, default=str) + '\n').encode())
+                line = self.reader.readline()
+            except OSError as e:
+                self._disconnect()
+                raise DaemonError(f"Order daemon did not answer {method} ({e or 'timed out'}); it may still have been carried out")
+            if not line:
+                self._disconnect()
+                raise DaemonError("Order daemon closed the connection")
+            try:
+                response = json.loads(line)
+            except ValueError:
+                self._disconnect()
+                raise DaemonError(f"Order daemon sent an unreadable answer to {method}")
+            if response.get('id') != request['id']:
+                self._disconnect()
+                raise DaemonError(f"Order daemon answered request {response.get('id')} to request {request['id']}")
+        if 'error' in response:
+            raise DaemonError(f"{response['error']['type']}: {response['error']['message']}")
+        return response['result']
+
+    def __getattr__(self, name):
+        if name.startswith('_'):
+            raise AttributeError(name)
+        return partial(self.call, name)
+
+    def close(self):
+        with self.lock:
+            self._disconnect()
+
+
+def connect(path=SOCKET_PATH):
+    """Return a DaemonClient when the daemon is running, otherwise None."""
+    if not os.path.exists(path):
+        return None
+    try:
+        return DaemonClient(path)
+    except OSError:
+        return None
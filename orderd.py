@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+
+import sys
+from binance.exceptions import BinanceAPIException, BinanceRequestException
+
+def print_help():
+    print("Usage: orderd.py [--socket PATH]")
+    print("Description: This script runs a resident order daemon that keeps an authenticated Binance client warm and accepts order requests from trade-limit.py and trade-market.py over a Unix socket.")
+
+if '-h' in sys.argv or '--help' in sys.argv:
+    print_help()
+    sys.exit(0)
+
+try:
+    import os
+    import json
+    import time
+    import signal
+    import argparse
+    import threading
+    import socketserver
+    from binance.client import Client
+    from ratelimit import limit_client
+    from rest import use_base_url
+    from keys import API_KEY, API_SECRET
+    from order_client import SOCKET_PATH, connect
+    from symbol_filters import get_cache
+
+    # Client methods the socket API exposes
+    METHODS = {
+        'order_limit', 'order_market', 'create_order', 'cancel_order', 'get_order', 'get_open_orders',
+        'get_asset_balance', 'get_account', 'get_avg_price', 'get_symbol_ticker', 'get_all_tickers', 'get_my_trades',
+        'cancel_replace_order', 'stream_get_listen_key', 'stream_keepalive'
+    }
+    POOL_SIZE = 10  # Keep-alive connections for concurrent requests
+    KEEPALIVE_INTERVAL = 30  # Seconds between pings that keep the connection pool open
+    TIME_SYNC_INTERVAL = 600  # Seconds between server clock re-syncs
+
+    def sync_time(client):
+        """Set the client's timestamp offset from the server clock, assuming a symmetric round trip."""
+        before = time.time() * 1000
+        server_time = client.get_server_time()['serverTime']
+        after = time.time() * 1000
+        client.timestamp_offset = server_time - (before + after) / 2
+
+    def warm_client():
+        """Build the authenticated client with a pooled session and a synced clock."""
+        client = limit_client(use_base_url(Client(API_KEY, API_SECRET, ping=False)), pool_maxsize=POOL_SIZE)
+        sync_time(client)
+        cache = get_cache()
+        if not cache.filters:
+            cache.refresh()  # Fetch the symbol filters before the first order
+        return client
+
+    def keep_warm(client, stop):
+        """Ping to keep connections open, re-sync the clock and refresh stale symbol filters."""
+        last_sync = time.time()
+        while not stop.wait(KEEPALIVE_INTERVAL):
+            try:
+                if time.time() - last_sync >= TIME_SYNC_INTERVAL:
+                    sync_time(client)
+                    last_sync = time.time()
+                else:
+                    client.ping()
+                cache = get_cache()
+                if time.time() - cache.fetched_at > cache.ttl:
+                    cache.refresh()
+            except Exception as e:
+                print(f"Keep-warm request failed: {e}", flush=True)
+
+    def dispatch(client, method, params):
+        if method == 'ping':
+            return {'timestamp_offset': client.timestamp_offset}
+        if method not in METHODS:
+            raise ValueError(f"Unsupported method: {method}")
+        return getattr(client, method)(**params)
+
+    class OrderHandler(socketserver.StreamRequestHandler):
+        """One connection: JSON request lines in, JSON response lines out."""
+
+        def handle(self):
+            for line in self.rfile:
+                response = {}
+                try:
+                    request = json.loads(line)
+                    response['id'] = request.get('id')
+                    response['result'] = dispatch(self.server.client, request['method'], request.get('params', {}))
+                except Exception as e:
+                    response['error'] = {'type': type(e).__name__, 'message': str(e)}
+                self.wfile.write((json.dumps(response, default=str) + '\n').encode())
+
+    class OrderServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+        daemon_threads = True
+
+    def serve(path=SOCKET_PATH):
+        existing = connect(path)
+        if existing:
+            existing.close()
+            raise ValueError(f"An order daemon is already listening on {path}")
+        if os.path.exists(path):
+            os.remove(path)  # Left behind by a daemon that did not shut down cleanly
+
+        client = warm_client()
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        server = OrderServer(path, OrderHandler)
+        os.chmod(path, 0o600)  # The socket places orders with your keys
+        server.client = client
+
+        # Stop cleanly on SIGTERM too, so the socket file is removed
+        signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+        stop = threading.Event()
+        threading.Thread(target=keep_warm, args=(client, stop), daemon=True).start()
+        print(f"Order daemon listening on {path} (clock offset {client.timestamp_offset:.0f} ms)", flush=True)
+        try:
+            server.serve_forever()
+        finally:
+            stop.set()
+            server.server_close()
+            os.remove(path)
+
+    def main():
+        parser = argparse.ArgumentParser(description="Warm order-execution daemon")
+        parser.add_argument('--socket', default=SOCKET_PATH, help=f'Unix socket path (default: {SOCKET_PATH})')
+        args = parser.parse_args()
+        serve(args.socket)
+
+    if __name__ == "__main__":
+        main()
+
+except BinanceAPIException as e:
+    print(f"Binance API Exception: {e}")
+except BinanceRequestException as e:
+    print(f"Binance Request Exception: {e}")
+except IndexError:
+    print("Error: Missing command line arguments.")
+    print_help()
+except ValueError as e:
+    print(f"ValueError: {e}")
+except KeyboardInterrupt:
+    pass
+except Exception as e:
+    print(f"An unexpected error occurred: {e}")
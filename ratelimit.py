@@ -0,0 +1,197 @@
+"""Request-weight and order-rate budget shared by every script on this machine.
+
+Binance counts request weight per IP in calendar minutes and orders per
+account in 10-second and daily windows. All processes book their requests
+in one small state file under an exclusive fcntl lock, so scripts started
+together by cron queue behind each other instead of overrunning the limit.
+The X-MBX-USED-WEIGHT-1M and X-MBX-ORDER-COUNT-* headers of every response
+correct the local estimate, and a 429 or 418 stops all processes until its
+Retry-After has passed.
+
+RateLimitedAdapter applies the budget to a requests session; install() mounts
+it on rest.py's session or on a python-binance Client's session.
+"""
+
+import os
+import json
+import time
+import fcntl
+import itertools
+from contextlib import contextmanager
+from urllib.parse import urlsplit, parse_qs
+
+from requests.adapters import HTTPAdapter
+
+STATE_PATH = os.environ.get(
+    'RATELIMIT_STATE',
+    os.path.join(os.path.expanduser('~'), '.cache', 'trading-tools', 'ratelimit.json')
+)
+WEIGHT_LIMIT = 6000  # Request weight allowed per minute per IP
+ORDER_LIMIT_10S = 100  # Orders per 10 seconds per account
+ORDER_LIMIT_1D = 200000  # Orders per day per account
+MARGIN = 0.95  # Share of each limit the scripts may use
+MAX_BAN_WAIT = 600  # Seconds; a longer ban raises instead of queueing
+IN_FLIGHT_TIMEOUT = 60  # Seconds after which a booked request without an answer stops counting as in flight
+
+# Weights of the endpoints the scripts use; anything else counts as 1
+ENDPOINT_WEIGHTS = {
+    '/api/v3/exchangeInfo': 20,
+    '/api/v3/account': 20,
+    '/api/v3/myTrades': 20,
+    '/api/v3/avgPrice': 2,
+    '/api/v3/openOrders': 6,  # With a symbol; all symbols cost 80
+    '/api/v3/order': 4,  # GET; placing or cancelling an order costs 1
+    '/api/v3/userDataStream': 2,
+}
+ORDER_PATHS = {'/api/v3/order', '/api/v3/order/oco', '/api/v3/orderList/oco', '/api/v3/order/cancelReplace'}
+
+
+def request_weight(method, path, query):
+    """Estimated weight of one request; the response headers give the exact total."""
+    params = parse_qs(query)
+    if path == '/api/v3/klines':
+        return 2  # Whatever the limit
+    if path == '/api/v3/openOrders' and method == 'GET' and 'symbol' not in params:
+        return 80
+    if path in ('/api/v3/ticker/price', '/api/v3/ticker/bookTicker'):
+        return 2 if 'symbol' in params else 4
+    if path == '/api/v3/ticker/24hr':
+        return 2 if 'symbol' in params else 80
+    if path in ORDER_PATHS and method in ('POST', 'DELETE'):
+        return 1
+    return ENDPOINT_WEIGHTS.get(path, 1)
+
+
+def is_order(method, path):
+    return method == 'POST' and path in ORDER_PATHS
+
+
+class SharedBudget:
+    """Fixed-window weight and order counters in a file shared by all processes."""
+
+    def __init__(self, path=STATE_PATH):
+        self.path = path
+        self.tokens = itertools.count(1)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+
+    @contextmanager
+    def _state(self):
+        """Lock the state file and yield its contents, writing back any changes."""
+        with open(self.path, 'a+') as f:
+            fcntl.flock(f, fcntl.LOCK_EX)
+            try:
+                f.seek(0)
+                try:
+                    state = json.loads(f.read() or '{}')
+                except ValueError:
+                    state = {}
+                now = time.time()
+                for key, window in (('minute', 60), ('ten_seconds', 10), ('day', 86400)):
+                    if state.get(key) != int(now // window):
+                        state[key] = int(now // window)
+                        state[key + '_count'] = 0
+                state.setdefault('banned_until', 0)
+                state['in_flight'] = {
+                    token: entry for token, entry in state.get('in_flight', {}).items()
+                    if now - entry[1] < IN_FLIGHT_TIMEOUT
+                }
+                yield state, now
+                f.seek(0)
+                f.truncate()
+                f.write(json.dumps(state))
+            finally:
+                fcntl.flock(f, fcntl.LOCK_UN)
+
+    def acquire(self, weight=1, order=False):
+        """Book a request, sleeping until every limit it counts against has room.
+
+        Returns a token for update() or release() once the request is answered or has failed.
+        """
+        while True:
+            with self._state() as (state, now):
+                if state['banned_until'] > now:
+                    wait = state['banned_until'] - now
+                elif state['minute_count'] + weight > WEIGHT_LIMIT * MARGIN:
+                    wait = 60 - now % 60
+                elif order and state['ten_seconds_count'] + 1 > ORDER_LIMIT_10S * MARGIN:
+                    wait = 10 - now % 10
+                elif order and state['day_count'] + 1 > ORDER_LIMIT_1D * MARGIN:
+                    wait = 86400 - now % 86400
+                else:
+                    state['minute_count'] += weight
+                    if order:
+                        state['ten_seconds_count'] += 1
+                        state['day_count'] += 1
+                    token = f"{os.getpid()}-{next(self.tokens)}"
+                    state['in_flight'][token] = [weight, now]
+                    return token
+            if wait > MAX_BAN_WAIT:
+                raise ValueError(f"Binance request budget exhausted for another {wait:.0f} s")
+            time.sleep(wait)
+
+    def release(self, token):
+        """Stop counting a request that failed without a response as in flight."""
+        with self._state() as (state, now):
+            state['in_flight'].pop(token, None)
+
+    def update(self, response, token=None):
+        """Fold the usage headers and any 429/418 back-off of a response into the shared state.
+
+        The used-weight header is the exchange's own count, so it replaces the
+        local estimate, plus the requests booked here that it cannot include yet.
+        """
+        headers = {key.lower(): value for key, value in response.headers.items()}
+        with self._state() as (state, now):
+            state['in_flight'].pop(token, None)
+            used = headers.get('x-mbx-used-weight-1m')
+            if used is not None:
+                state['minute_count'] = int(used) + sum(weight for weight, _ in state['in_flight'].values())
+            for key, header in (('ten_seconds', 'x-mbx-order-count-10s'), ('day', 'x-mbx-order-count-1d')):
+                if header in headers:
+                    state[key + '_count'] = max(state[key + '_count'], int(headers[header]))
+            if response.status_code in (429, 418):
+                retry_after = int(headers.get('retry-after', 60 if response.status_code == 418 else 1))
+                state['banned_until'] = max(state['banned_until'], now + retry_after)
+
+
+class RateLimitedAdapter(HTTPAdapter):
+    """HTTPAdapter that books every request in the shared budget before sending it.
+
+    Unsigned requests rejected with 429 are re-sent once the back-off has
+    passed. Signed requests are returned as they are, because their
+    timestamp may be outside recvWindow by then; later requests still wait.
+    """
+
+    def __init__(self, budget=None, **kwargs):
+        super().__init__(**kwargs)
+        self.budget = budget or SharedBudget()
+
+    def send(self, request, **kwargs):
+        url = urlsplit(request.url)
+        weight = request_weight(request.method, url.path, url.query)
+        order = is_order(request.method, url.path)
+        signed = 'signature=' in (url.query or '') or 'signature=' in str(request.body or '')
+        while True:
+            token = self.budget.acquire(weight, order)
+            try:
+                response = super().send(request, **kwargs)
+            except Exception:
+                self.budget.release(token)
+                raise
+            self.budget.update(response, token)
+            if response.status_code != 429 or signed:
+                return response
+
+
+def install(session, pool_maxsize=10):
+    """Route a requests session through the shared budget."""
+    adapter = RateLimitedAdapter(pool_connections=1, pool_maxsize=pool_maxsize)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+
+def limit_client(client, pool_maxsize=10):
+    """Route a python-binance Client built with ping=False through the shared budget."""
+    install(client.session, pool_maxsize)
+    return client
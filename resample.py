@@ -0,0 +1,80 @@
+"""Build higher-timeframe candles locally from one base interval.
+
+Buckets follow Binance's candle boundaries: fixed intervals are aligned to
+the Unix epoch, weeks start on Monday 00:00 UTC and months on the first of
+the month. The last bucket may be incomplete, just like the still-open
+candle the API returns.
+"""
+
+import numpy as np
+
+from klines import KLINE_DTYPE, interval_ms
+
+DAY_MS = 86_400_000
+WEEK_OFFSET = 4 * DAY_MS  # The epoch was a Thursday; Binance weeks open on Monday
+
+SUM_COLUMNS = [
+    'volume', 'quote_asset_volume', 'number_of_trades',
+    'taker_buy_base_asset_volume', 'taker_buy_quote_asset_volume'
+]
+
+
+def interval_length(interval):
+    """Return the interval length in ms, counting a month as 30 days for ordering."""
+    return 30 * DAY_MS if interval == '1M' else interval_ms(interval)
+
+
+def can_resample(interval, base_interval):
+    """Return True when whole `base_interval` candles tile every `interval` candle."""
+    base = interval_ms(base_interval)
+    if interval == '1M':
+        return DAY_MS % base == 0
+    return interval_ms(interval) > base and interval_ms(interval) % base == 0
+
+
+def bucket_bounds(open_times, interval):
+    """Return the (open, close) times of the target candle containing each base candle."""
+    open_times = np.asarray(open_times, dtype=np.int64)
+    if interval == '1M':
+        months = open_times.astype('datetime64[ms]').astype('datetime64[M]')
+        starts = months.astype('datetime64[ms]').astype(np.int64)
+        ends = (months + 1).astype('datetime64[ms]').astype(np.int64)
+        return starts, ends - 1
+
+    step = interval_ms(interval)
+    offset = WEEK_OFFSET if interval == '1w' else 0
+    starts = (open_times - offset) // step * step + offset
+    return starts, starts + step - 1
+
+
+def resample_records(records, interval, base_interval):
+    """Aggregate time-ordered base candles into `interval` candles.
+
+    A leading bucket that the base data only covers partially is dropped, so
+    every returned candle except the newest one is complete.
+    """
+    if interval == base_interval:
+        return records
+    if not can_resample(interval, base_interval):
+        raise ValueError(f"Cannot build {interval} candles from {base_interval} candles")
+    if len(records) == 0:
+        return np.empty(0, dtype=KLINE_DTYPE)
+
+    starts, ends = bucket_bounds(records['timestamp'], interval)
+    first = np.flatnonzero(np.diff(starts)) + 1
+    first = np.concatenate([[0], first])
+    last = np.append(first[1:] - 1, len(records) - 1)
+
+    resampled = np.empty(len(first), dtype=KLINE_DTYPE)
+    resampled['timestamp'] = starts[first]
+    resampled['close_time'] = ends[first]
+    resampled['open'] = records['open'][first]
+    resampled['close'] = records['close'][last]
+    resampled['high'] = np.maximum.reduceat(records['high'], first)
+    resampled['low'] = np.minimum.reduceat(records['low'], first)
+    for column in SUM_COLUMNS:
+        resampled[column] = np.add.reduceat(records[column], first)
+
+    if records['timestamp'][0] != starts[0]:
+        resampled = resampled[1:]
+    return resampled
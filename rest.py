@@ -0,0 +1,50 @@
+"""Shared HTTP session for the public Binance REST endpoints."""
+
+import os
+import json
+import threading
+
+import requests
+
+import ratelimit
+
+# BINANCE_API_URL points every script at another server, e.g. mock_binance.py
+BASE_URL = os.environ.get('BINANCE_API_URL', 'https://api.binance.com').rstrip('/')
+POOL_SIZE = 32  # Keep-alive connections shared by all worker threads
+
+_session = None
+_session_lock = threading.Lock()
+
+
+def get_session():
+    """Return the process-wide pooled session, creating it on first use."""
+    global _session
+    with _session_lock:
+        if _session is None:
+            # Requests wait for room in the weight budget shared with the other scripts
+            _session = ratelimit.install(requests.Session(), pool_maxsize=POOL_SIZE)
+    return _session
+
+
+def use_base_url(client):
+    """Send a python-binance Client's spot API requests to BASE_URL as well."""
+    client.API_URL = f"{BASE_URL}/api"
+    return client
+
+
+def get_raw(path, params=None):
+    """GET a public endpoint and return the undecoded response body."""
+    return get_session().get(f"{BASE_URL}{path}", params=params).content
+
+
+def raise_for_error(path, data):
+    """Raise ValueError when a decoded payload is a Binance error object."""
+    if isinstance(data, dict) and 'code' in data and 'msg' in data:
+        raise ValueError(f"Binance error {data['code']} on {path}: {data['msg']}")
+
+
+def get(path, params=None):
+    """GET a public endpoint and return the decoded JSON payload."""
+    data = json.loads(get_raw(path, params))
+    raise_for_error(path, data)
+    return data
@@ -0,0 +1,40 @@
+"""Concurrent multi-symbol kline loading for the scan modes."""
+
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+import rest
+from klines import load_klines
+
+MAX_WORKERS = 16  # Parallel requests; keeps a 300-symbol scan well inside the weight limit
+
+
+def trading_symbols(quote_asset=None):
+    """Return every TRADING symbol, optionally only those quoted in `quote_asset`."""
+    exchange_info = rest.get('/api/v3/exchangeInfo')
+    return sorted(
+        s['symbol'] for s in exchange_info['symbols']
+        if s['status'] == 'TRADING'
+        and (quote_asset is None or s['quoteAsset'] == quote_asset.upper())
+    )
+
+
+def load_many(symbols, interval, limit=500, max_workers=MAX_WORKERS, process=None):
+    """Load klines for many symbols concurrently.
+
+    Yields (symbol, result, error) as each download finishes so the caller can
+    handle results while the remaining requests are still in flight. The
+    result is the klines DataFrame, or process(symbol, df) when `process` is
+    given; that work then runs on the same worker pool as the downloads.
+    """
+    def load(symbol):
+        df = load_klines(symbol, interval, limit)
+        return df if process is None else process(symbol, df)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        futures = {pool.submit(load, symbol): symbol for symbol in symbols}
+        for future in as_completed(futures):
+            symbol = futures[future]
+            try:
+                yield symbol, future.result(), None
+            except Exception as e:
+                yield symbol, None, e
@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+
+import sys
+from binance.exceptions import BinanceAPIException, BinanceRequestException
+
+def print_help():
+    print("Usage: simulate.py <trading-pair> <time-span> [<window1> <window2> <window3>] [--max-bars N]")
+    print("Description: This script replays every historical Ichimoku signal of ichimoku.py and checks whether its 2x ATR target or 1x ATR stop was hit first.")
+
+if '-h' in sys.argv or '--help' in sys.argv:
+    print_help()
+    sys.exit(0)
+
+try:
+    import time
+    import argparse
+    import numpy as np
+    import pandas as pd
+    from backtest import LONG, SHORT
+    from ichimoku_engine import ichimoku_lines, ichimoku_signals, average_true_range
+    from klines import sync_klines
+
+    TRADING_FEE_PERCENT = 0.001  # 0.1% trading fee per trade
+    BLOCK = 64  # Bars per block in the first-touch search
+
+    def block_table(values):
+        """Sparse table of block maxima: table[k][b] = max of blocks b .. b + 2**k - 1."""
+        blocks = -(-len(values) // BLOCK)
+        padded = np.full(blocks * BLOCK, -np.inf)
+        padded[:len(values)] = values
+        table = [padded.reshape(blocks, BLOCK).max(axis=1)]
+        while 2 ** len(table) <= blocks:
+            span = 2 ** (len(table) - 1)
+            previous = table[-1]
+            table.append(np.maximum(previous[:-span], previous[span:]))
+        return table
+
+    def first_touch(values, table, start, end, level):
+        """First index j in [start, end) with values[j] >= level, or `end` when there is none.
+
+        All arguments after `table` are arrays with one entry per trade. The
+        rest of each starting block is scanned bar by bar, the first block
+        whose maximum reaches the level is found by binary lifting over the
+        sparse table, and that block is then scanned bar by bar. Every step
+        is one NumPy operation across all trades.
+        """
+        n = len(values)
+        result = end.copy()
+        found = np.zeros(len(start), dtype=bool)
+
+        def scan(first, stop):
+            nonlocal found
+            for offset in range(BLOCK):
+                position = first + offset
+                hit = ~found & (position < stop) & (values[np.minimum(position, n - 1)] >= level)
+                result[hit] = position[hit]
+                found |= hit
+
+        # Bars left in the block the trade starts in
+        next_block = start // BLOCK + 1
+        scan(start, np.minimum(next_block * BLOCK, end))
+
+        # Whole blocks: skip every run of blocks whose maximum stays below the level
+        block = next_block.copy()
+        end_block = -(-end // BLOCK)
+        for k in range(len(table) - 1, -1, -1):
+            span = 2 ** k
+            maxima = table[k]
+            can_skip = ~found & (block + span <= end_block)
+            can_skip &= maxima[np.minimum(block, len(maxima) - 1)] < level
+            block = np.where(can_skip, block + span, block)
+
+        scan(block * BLOCK, np.where(block < end_block, end, 0))
+        return result
+
+    def simulate(high, low, close, signal, atr, max_bars=None, fee=TRADING_FEE_PERCENT):
+        """Resolve every LONG/SHORT signal into a target hit, stop hit or open trade.
+
+        Each signal is treated as an independent trade entered at its bar's
+        close with compute_target_and_stop() levels, watched from the next
+        bar on. When target and stop fall inside the same bar the stop is
+        assumed to come first.
+        """
+        n = len(close)
+        entries = np.flatnonzero((signal != 0) & (atr > 0))
+        side = signal[entries]
+        price = close[entries]
+        risk = atr[entries]
+        is_long = side == LONG
+
+        target = np.where(is_long, price + 2 * risk, price - 2 * risk)
+        stop = np.where(is_long, price - risk, price + risk)
+        start = entries + 1
+        end = np.full(len(entries), n) if max_bars is None else np.minimum(start + max_bars, n)
+
+        high_table = block_table(high)
+        low_table = block_table(-low)
+
+        target_bar = np.empty(len(entries), dtype=np.int64)
+        stop_bar = np.empty(len(entries), dtype=np.int64)
+        for sign, mask in ((LONG, is_long), (SHORT, ~is_long)):
+            if not mask.any():
+                continue
+            args = (start[mask], end[mask])
+            if sign == LONG:
+                target_bar[mask] = first_touch(high, high_table, *args, target[mask])
+                stop_bar[mask] = first_touch(-low, low_table, *args, -stop[mask])
+            else:
+                target_bar[mask] = first_touch(-low, low_table, *args, -target[mask])
+                stop_bar[mask] = first_touch(high, high_table, *args, stop[mask])
+
+        outcome = np.where(target_bar < stop_bar, 'target', np.where(stop_bar < end, 'stop', 'open'))
+        exit_bar = np.minimum(target_bar, stop_bar)
+        move = np.where(outcome == 'target', 2 * risk, np.where(outcome == 'stop', -risk, np.nan))
+        return pd.DataFrame({
+            'entry_bar': entries,
+            'side': np.where(is_long, 'LONG', 'SHORT'),
+            'price': price,
+            'target': target,
+            'stop': stop,
+            'outcome': outcome,
+            'bars_held': np.where(outcome == 'open', np.nan, exit_bar - entries),
+            'return_percent': (move / price - 2 * fee) * 100
+        })
+
+    def summarize(trades):
+        resolved = trades[trades['outcome'] != 'open']
+        targets = resolved['outcome'] == 'target'
+        summary = {
+            'Signals': len(trades),
+            'Resolved': len(resolved),
+            'Unresolved': len(trades) - len(resolved),
+            'Target hit rate %': targets.mean() * 100 if len(resolved) else float('nan'),
+            'Expectancy % per trade': resolved['return_percent'].mean(),
+        }
+        holding = resolved.groupby('outcome')['bars_held'].describe(percentiles=[0.1, 0.25, 0.5, 0.75, 0.9])
+        return summary, holding
+
+    def main():
+        parser = argparse.ArgumentParser(description="Ichimoku/ATR target-vs-stop simulator")
+        parser.add_argument('symbol', type=str, help='Trading pair symbol (e.g., BTCUSDT)')
+        parser.add_argument('interval', type=str, help='Kline interval (e.g., 1h)')
+        parser.add_argument('windows', type=int, nargs='*', default=[9, 18, 24], help='window1 window2 window3')
+        parser.add_argument('--max-bars', type=int, default=None, help='Give up on a trade after this many bars')
+        parser.add_argument('--atr-window', type=int, default=14)
+        args = parser.parse_args()
+        if len(args.windows) != 3:
+            parser.error("give all three Ichimoku windows or none")
+
+        stored, open_candles = sync_klines(args.symbol.upper(), args.interval)
+        high = np.asarray(stored['high'])
+        low = np.asarray(stored['low'])
+        close = np.asarray(stored['close'])
+
+        start = time.perf_counter()
+        triple = tuple(args.windows)
+        lines = ichimoku_lines(high, low, close, [triple])[triple]
+        signal = ichimoku_signals(pd.DataFrame({'close': close, **lines}))
+        atr = average_true_range(high, low, close, window=args.atr_window)
+        trades = simulate(high, low, close, signal, atr, max_bars=args.max_bars)
+        summary, holding = summarize(trades)
+        elapsed = time.perf_counter() - start
+
+        print(f"Ichimoku {triple} signals on {args.symbol.upper()} {args.interval}: {len(close)} candles")
+        for name, value in summary.items():
+            print(f"{name}: {value:.2f}" if isinstance(value, float) else f"{name}: {value}")
+        print("\nBars held by outcome:")
+        print(holding.to_string(float_format=lambda value: f"{value:.1f}"))
+        print(f"\nSimulated in {elapsed:.3f} s")
+
+    if __name__ == "__main__":
+        main()
+
+except BinanceAPIException as e:
+    print(f"Binance API Exception: {e}")
+except BinanceRequestException as e:
+    print(f"Binance Request Exception: {e}")
+except IndexError:
+    print("Error: Missing command line arguments.")
+    print_help()
+except Exception as e:
+    print(f"An unexpected error occurred: {e}")
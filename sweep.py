@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+
+import sys
+from binance.exceptions import BinanceAPIException, BinanceRequestException
+
+def print_help():
+    print("Usage: sweep.py <analyze|ichimoku> <trading-pair> <interval> [options]")
+    print("Description: This script backtests a grid of indicator or Ichimoku window settings over the stored history of a trading pair and ranks the results.")
+
+if '-h' in sys.argv or '--help' in sys.argv:
+    print_help()
+    sys.exit(0)
+
+try:
+    import os
+    import time
+    import argparse
+    import itertools
+    from concurrent.futures import ProcessPoolExecutor
+    from multiprocessing import shared_memory
+    import numpy as np
+    import pandas as pd
+    from trading_tools.analyze import calculate_indicators
+    from trading_tools.ichimoku import apply_ichimoku
+    from backtest import run_backtest, signal_arrays
+    from ichimoku_engine import ichimoku_signals
+    from klines import sync_klines
+
+    PRICE_COLUMNS = ['high', 'low', 'close']
+
+    # Worker-side view of the shared price arrays, set up once per process
+    _shared = {}
+
+    def attach_prices(name, length):
+        """Pool initializer: map the parent's shared price block without copying it."""
+        shm = shared_memory.SharedMemory(name=name)
+        prices = np.ndarray((len(PRICE_COLUMNS), length), dtype=np.float64, buffer=shm.buf)
+        _shared['shm'] = shm
+        _shared['prices'] = dict(zip(PRICE_COLUMNS, prices))
+
+    def price_frame():
+        """Return a fresh DataFrame whose price columns are views of the shared block."""
+        return pd.DataFrame(_shared['prices'], copy=False)
+
+    def evaluate_analyze(params, rule, long_only):
+        rsi_window, macd_fast, macd_slow, macd_sign, bb_window, bb_dev = params
+        df = calculate_indicators(
+            price_frame(), rsi_window=rsi_window, macd_slow=macd_slow, macd_fast=macd_fast,
+            macd_sign=macd_sign, bb_window=bb_window, bb_dev=bb_dev
+        )
+        signal = signal_arrays(df)[rule]
+        result = run_backtest(df['close'].to_numpy(), signal, long_only=long_only)
+        return {
+            'rsi': rsi_window, 'macd_fast': macd_fast, 'macd_slow': macd_slow,
+            'macd_sign': macd_sign, 'bb_window': bb_window, 'bb_dev': bb_dev, **result
+        }
+
+    def evaluate_ichimoku(params, rule, long_only):
+        window1, window2, window3 = params
+        df = apply_ichimoku(price_frame(), window1, window2, window3)
+        result = run_backtest(df['close'].to_numpy(), ichimoku_signals(df), long_only=long_only)
+        return {'window1': window1, 'window2': window2, 'window3': window3, **result}
+
+    def run_sweep(df, evaluate, grid, rule=None, long_only=False, workers=None, sort_by='Total return %'):
+        """Evaluate every parameter tuple in `grid` on a process pool and rank the results."""
+        length = len(df)
+        shm = shared_memory.SharedMemory(create=True, size=max(len(PRICE_COLUMNS) * length * 8, 1))
+        try:
+            prices = np.ndarray((len(PRICE_COLUMNS), length), dtype=np.float64, buffer=shm.buf)
+            for row, column in zip(prices, PRICE_COLUMNS):
+                row[:] = df[column].to_numpy(dtype=np.float64)
+
+            with ProcessPoolExecutor(max_workers=workers, initializer=attach_prices, initargs=(shm.name, length)) as pool:
+                results = list(pool.map(
+                    evaluate, grid, itertools.repeat(rule), itertools.repeat(long_only),
+                    chunksize=max(1, len(grid) // (4 * (workers or os.cpu_count() or 1)))
+                ))
+        finally:
+            shm.close()
+            shm.unlink()
+
+        table = pd.DataFrame(results).sort_values(sort_by, ascending=False)
+        return table.reset_index(drop=True)
+
+    def int_list(value):
+        return [int(item) for item in value.split(',')]
+
+    def float_list(value):
+        return [float(item) for item in value.split(',')]
+
+    def main():
+        parser = argparse.ArgumentParser(description="Backtest a grid of indicator settings")
+        parser.add_argument('mode', choices=['analyze', 'ichimoku'], help='Which script\'s rules to sweep')
+        parser.add_argument('symbol', type=str, help='Trading pair symbol (e.g., BTCUSDT)')
+        parser.add_argument('interval', type=str, help='Kline interval (e.g., 1h)')
+        parser.add_argument('--rule', default='Consensus', choices=['RSI', 'MACD', 'Bollinger Bands', 'Consensus'],
+                            help='analyze.py signal to trade (default: Consensus)')
+        parser.add_argument('--rsi', type=int_list, default=[7, 14, 21])
+        parser.add_argument('--macd-fast', type=int_list, default=[8, 12])
+        parser.add_argument('--macd-slow', type=int_list, default=[21, 26])
+        parser.add_argument('--macd-sign', type=int_list, default=[5, 9])
+        parser.add_argument('--bb-window', type=int_list, default=[20])
+        parser.add_argument('--bb-dev', type=float_list, default=[2.0, 2.5])
+        parser.add_argument('--window1', type=int_list, default=[7, 9, 12])
+        parser.add_argument('--window2', type=int_list, default=[18, 26])
+        parser.add_argument('--window3', type=int_list, default=[24, 52])
+        parser.add_argument('--long-only', action='store_true', help='Go flat instead of short on SHORT signals')
+        parser.add_argument('--workers', type=int, default=None, help='Worker processes (default: all cores)')
+        parser.add_argument('--top', type=int, default=20, help='Number of ranked rows to print')
+        args = parser.parse_args()
+
+        stored, open_candles = sync_klines(args.symbol.upper(), args.interval)
+        df = pd.DataFrame({column: np.asarray(stored[column]) for column in PRICE_COLUMNS})
+
+        if args.mode == 'analyze':
+            grid = [
+                params for params in itertools.product(
+                    args.rsi, args.macd_fast, args.macd_slow, args.macd_sign, args.bb_window, args.bb_dev
+                )
+                if params[1] < params[2]
+            ]
+            evaluate = evaluate_analyze
+        else:
+            grid = list(itertools.product(args.window1, args.window2, args.window3))
+            evaluate = evaluate_ichimoku
+
+        start = time.perf_counter()
+        table = run_sweep(df, evaluate, grid, rule=args.rule, long_only=args.long_only, workers=args.workers)
+        elapsed = time.perf_counter() - start
+
+        print(f"Swept {len(grid)} {args.mode} settings over {len(df)} {args.interval} candles of {args.symbol.upper()} in {elapsed:.2f} s")
+        print(table.head(args.top).to_string(float_format=lambda value: f"{value:.2f}"))
+
+    if __name__ == "__main__":
+        main()
+
+except BinanceAPIException as e:
+    print(f"Binance API Exception: {e}")
+except BinanceRequestException as e:
+    print(f"Binance Request Exception: {e}")
+except IndexError:
+    print("Error: Missing command line arguments.")
+    print_help()
+except Exception as e:
+    print(f"An unexpected error occurred: {e}")
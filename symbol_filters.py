@@ -0,0 +1,223 @@
+"""Cached exchange info and symbol filters for the order scripts.
+
+The parsed trading rules of every symbol are kept in a JSON file next to
+the kline store. A lookup is a dictionary access; when the file is older
+than CACHE_TTL the stale rules are still served while a background thread
+fetches fresh ones, so an order never waits on /api/v3/exchangeInfo unless
+the cache is empty or the symbol is new. Tick and step sizes are exact
+Decimals, and rounding never goes through float.
+"""
+
+import os
+import json
+import time
+import threading
+from decimal import Decimal, ROUND_DOWN
+
+import rest
+
+CACHE_PATH = os.environ.get(
+    'SYMBOL_FILTERS_CACHE',
+    os.path.join(os.path.expanduser('~'), '.cache', 'trading-tools', 'exchange_info.json')
+)
+CACHE_TTL = 6 * 3600  # Seconds before the cached rules are refreshed in the background
+
+
+def quantize_down(value, step):
+    """Round `value` down to a multiple of `step`, keeping the step's decimal places."""
+    value = Decimal(str(value))
+    if step == 0:
+        return value
+    exponent = min(step.normalize().as_tuple().exponent, 0)
+    return ((value / step).to_integral_value(ROUND_DOWN) * step).quantize(Decimal(1).scaleb(exponent))
+
+
+class SymbolFilters:
+    """Trading rules of one symbol: PRICE_FILTER, LOT_SIZE, MARKET_LOT_SIZE and NOTIONAL/MIN_NOTIONAL."""
+
+    def __init__(self, symbol_info):
+        self.symbol = symbol_info['symbol']
+        self.status = symbol_info.get('status')
+        self.base_asset = symbol_info.get('baseAsset')
+        self.quote_asset = symbol_info.get('quoteAsset')
+        filters = {f['filterType']: f for f in symbol_info.get('filters', [])}
+
+        price_filter = filters.get('PRICE_FILTER', {})
+        self.tick_size = Decimal(price_filter.get('tickSize', '0'))
+        self.min_price = Decimal(price_filter.get('minPrice', '0'))
+        self.max_price = Decimal(price_filter.get('maxPrice', '0'))
+
+        if 'LOT_SIZE' not in filters:
+            raise ValueError(f"Could not find LOT_SIZE filter for symbol: {self.symbol}")
+        lot_size = filters['LOT_SIZE']
+        self.step_size = Decimal(lot_size['stepSize'])
+        self.min_qty = Decimal(lot_size['minQty'])
+        self.max_qty = Decimal(lot_size['maxQty'])
+
+        # MARKET_LOT_SIZE may be all zeros, meaning LOT_SIZE applies to market orders too
+        market_lot_size = filters.get('MARKET_LOT_SIZE', {})
+        market_step = Decimal(market_lot_size.get('stepSize', '0'))
+        self.market_step_size = market_step if market_step > 0 else self.step_size
+        self.market_min_qty = Decimal(market_lot_size.get('minQty', '0')) if market_step > 0 else self.min_qty
+        market_max = Decimal(market_lot_size.get('maxQty', '0'))
+        self.market_max_qty = market_max if market_max > 0 else self.max_qty
+
+        notional = filters.get('NOTIONAL') or filters.get('MIN_NOTIONAL') or {}
+        self.min_notional = Decimal(notional.get('minNotional', '0'))
+        self.max_notional = Decimal(notional.get('maxNotional', '0'))
+        self.apply_min_to_market = notional.get('applyMinToMarket', notional.get('applyToMarket', True))
+
+    @property
+    def step_decimals(self):
+        """Decimal places of the LOT_SIZE step, e.g. 3 for 0.00100000."""
+        return max(-self.step_size.normalize().as_tuple().exponent, 0)
+
+    @property
+    def price_decimals(self):
+        return max(-self.tick_size.normalize().as_tuple().exponent, 0)
+
+    def round_price(self, price):
+        """Round a price down to the tick size."""
+        return quantize_down(price, self.tick_size)
+
+    def round_quantity(self, quantity, market=False):
+        """Round a quantity down to the (market) lot step size."""
+        return quantize_down(quantity, self.market_step_size if market else self.step_size)
+
+    def validate(self, quantity, price=None, market=False):
+        """Raise ValueError when an order would be rejected by the symbol's filters.
+
+        For market orders `price` is an estimate (e.g. the average price) used
+        only for the notional check.
+        """
+        quantity = Decimal(str(quantity))
+        step, min_qty, max_qty = (
+            (self.market_step_size, self.market_min_qty, self.market_max_qty) if market
+            else (self.step_size, self.min_qty, self.max_qty)
+        )
+        if quantity < min_qty:
+            raise ValueError(f"Quantity {quantity} is below the minimum {min_qty.normalize():f} for {self.symbol}")
+        if max_qty > 0 and quantity > max_qty:
+            raise ValueError(f"Quantity {quantity} is above the maximum {max_qty.normalize():f} for {self.symbol}")
+        if step > 0 and (quantity - min_qty) % step != 0:
+            raise ValueError(f"Quantity {quantity} is not a multiple of the step size {step.normalize():f} for {self.symbol}")
+
+        if price is None:
+            return
+        price = Decimal(str(price))
+        if not market:
+            if price < self.min_price:
+                raise ValueError(f"Price {price} is below the minimum {self.min_price.normalize():f} for {self.symbol}")
+            if self.max_price > 0 and price > self.max_price:
+                raise ValueError(f"Price {price} is above the maximum {self.max_price.normalize():f} for {self.symbol}")
+            if self.tick_size > 0 and (price - self.min_price) % self.tick_size != 0:
+                raise ValueError(f"Price {price} is not a multiple of the tick size {self.tick_size.normalize():f} for {self.symbol}")
+
+        notional = price * quantity
+        if (not market or self.apply_min_to_market) and notional < self.min_notional:
+            raise ValueError(f"Order value {notional} is below the minimum notional {self.min_notional.normalize():f} for {self.symbol}")
+        if self.max_notional > 0 and notional > self.max_notional:
+            raise ValueError(f"Order value {notional} is above the maximum notional {self.max_notional.normalize():f} for {self.symbol}")
+
+
+def parse_symbols(symbols):
+    """Map symbol -> SymbolFilters for every exchange info symbol with a LOT_SIZE filter."""
+    return {
+        info['symbol']: SymbolFilters(info) for info in symbols
+        if any(f['filterType'] == 'LOT_SIZE' for f in info.get('filters', []))
+    }
+
+
+class ExchangeInfoCache:
+    """Symbol filters for the whole exchange, persisted with a TTL and refreshed in the background."""
+
+    def __init__(self, path=CACHE_PATH, ttl=CACHE_TTL, fetch=None):
+        self.path = path
+        self.ttl = ttl
+        self.fetch = fetch or (lambda: rest.get('/api/v3/exchangeInfo'))
+        self.filters = {}
+        self.fetched_at = 0
+        self._lock = threading.Lock()
+        self._refresh_thread = None
+        self.load()
+
+    def load(self):
+        """Read the persisted rules; a missing or unreadable file leaves the cache empty."""
+        try:
+            with open(self.path) as f:
+                cached = json.load(f)
+            self.filters = parse_symbols(cached['symbols'])
+            self.fetched_at = cached['fetched_at']
+        except (OSError, ValueError, KeyError):
+            self.filters = {}
+            self.fetched_at = 0
+
+    def refresh(self):
+        """Fetch exchange info now, persist it and swap in the parsed rules."""
+        exchange_info = self.fetch()
+        symbols = [
+            {key: info[key] for key in ('symbol', 'status', 'baseAsset', 'quoteAsset', 'filters')}
+            for info in exchange_info['symbols']
+        ]
+        fetched_at = time.time()
+        filters = parse_symbols(symbols)
+
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        tmp_path = f"{self.path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump({'fetched_at': fetched_at, 'symbols': symbols}, f)
+        os.replace(tmp_path, self.path)
+
+        self.filters = filters
+        self.fetched_at = fetched_at
+
+    def refresh_in_background(self):
+        """Start a refresh unless one is already running.
+
+        The thread is not a daemon, so a short-lived script still completes
+        the refresh after its order has gone out.
+        """
+        with self._lock:
+            if self._refresh_thread is not None and self._refresh_thread.is_alive():
+                return
+            self._refresh_thread = threading.Thread(target=self._refresh_quietly, name='exchange-info-refresh')
+            self._refresh_thread.start()
+
+    def _refresh_quietly(self):
+        try:
+            self.refresh()
+        except Exception as e:
+            print(f"Exchange info refresh failed: {e}")
+
+    def get(self, symbol):
+        """Return the SymbolFilters for a symbol."""
+        symbol = symbol.upper()
+        if not self.filters:
+            self.refresh()
+        elif time.time() - self.fetched_at > self.ttl:
+            self.refresh_in_background()
+
+        filters = self.filters.get(symbol)
+        if filters is None and time.time() - self.fetched_at > 60:
+            # Possibly listed after the cache was written
+            self.refresh()
+            filters = self.filters.get(symbol)
+        if filters is None:
+            raise ValueError(f"Could not retrieve symbol info for: {symbol}")
+        return filters
+
+
+_cache = None
+
+
+def get_cache():
+    """Return the process-wide ExchangeInfoCache."""
+    global _cache
+    if _cache is None:
+        _cache = ExchangeInfoCache()
+    return _cache
+
+
+def get_filters(symbol):
+    """Return the SymbolFilters for a symbol from the process-wide cache."""
+    return get_cache().get(symbol)
@@ -0,0 +1,43 @@
+"""IndicatorEngine against the `ta` results calculate_indicators() produces, offline."""
+
+import numpy as np
+import pytest
+
+from indicators import IndicatorEngine, compare_with_ta
+
+TOLERANCE = 1e-8  # Relative to the price level of the closes
+
+
+def random_walk(count, start=30000.0, volatility=0.01, seed=7):
+    rng = np.random.default_rng(seed)
+    return (start * np.cumprod(1 + rng.normal(0, volatility, count))).tolist()
+
+
+@pytest.mark.parametrize('params', [
+    {},
+    {'rsi_window': 14, 'macd_slow': 21, 'macd_fast': 8, 'macd_sign': 5, 'bb_window': 10, 'bb_dev': 2.5},
+])
+def test_engine_matches_ta(params):
+    closes = random_walk(1000)
+    differences = compare_with_ta(closes, **params)
+    assert set(differences) == {'rsi', 'macd', 'macd_signal', 'macd_diff', 'bb_high', 'bb_low', 'bb_middle'}
+    for column, difference in differences.items():
+        scale = 100 if column == 'rsi' else max(closes)
+        assert difference <= TOLERANCE * scale, f"{column} differs from ta by {difference}"
+
+
+def test_engine_matches_ta_on_small_prices():
+    # Satoshi-level prices, as on the BTC-quoted pairs
+    closes = random_walk(600, start=0.0000012, volatility=0.02, seed=11)
+    for column, difference in compare_with_ta(closes).items():
+        scale = 100 if column == 'rsi' else max(closes)
+        assert difference <= TOLERANCE * scale, f"{column} differs from ta by {difference}"
+
+
+def test_open_candle_is_not_committed():
+    closes = random_walk(200)
+    engine = IndicatorEngine().seed(closes[:-1])
+    reference = IndicatorEngine().seed(closes[:-1])
+
+    engine.update(closes[-1] * 1.05, closed=False)
+    assert engine.update(closes[-1]) == reference.update(closes[-1])
@@ -0,0 +1,73 @@
+"""live.py end to end against its kline stream replay server."""
+
+import os
+import json
+import random
+import asyncio
+import runpy
+
+import pandas as pd
+
+from indicators import IndicatorEngine
+from trading_tools.analyze import analyze_data
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+START = 1_700_000_040_000  # A minute boundary
+
+
+async def against_replay(replay, path, follow):
+    """Start `replay` on a free port and run follow(url) against it."""
+    started = asyncio.get_running_loop().create_future()
+    server = asyncio.create_task(replay(path, port=0, on_start=started.set_result))
+    try:
+        port = await asyncio.wait_for(started, 5)
+        await asyncio.wait_for(follow(f"ws://127.0.0.1:{port}"), 10)
+    finally:
+        server.cancel()
+
+
+def kline_message(stream, index, close, closed):
+    open_time = START + index * 60_000
+    return json.dumps({'stream': stream, 'data': {'e': 'kline', 'k': {
+        't': open_time, 'T': open_time + 59_999, 'o': f"{close:.2f}", 'h': f"{close * 1.001:.2f}",
+        'l': f"{close * 0.999:.2f}", 'c': f"{close:.2f}", 'v': '10.0', 'x': closed
+    }}})
+
+
+def test_live_replay_signals(tmp_path):
+    live = runpy.run_path(os.path.join(ROOT, 'live.py'), run_name='live')
+    rng = random.Random(7)
+    closes = [100.0]
+    for _ in range(59):
+        closes.append(round(closes[-1] * (1 + rng.gauss(0, 0.01)), 2))
+
+    messages = []
+    for index, close in enumerate(closes):
+        messages.append(kline_message('btcusdt@kline_1m', index, close * 0.99, False))  # Still open: no signal
+        messages.append(kline_message('btcusdt@kline_1m', index, close, True))
+        messages.append(kline_message('ethusdt@kline_1m', index, close, True))  # Not subscribed
+    messages.insert(30, kline_message('btcusdt@kline_1m', 5, 1.0, True))  # Repeated close of a past candle
+    path = tmp_path / 'klines.jsonl'
+    path.write_text('\n'.join(messages) + '\n')
+
+    stream = live['KlineStream']('BTCUSDT', '1m')
+    emitted = []
+
+    def on_signals(stream, kline, signals):
+        emitted.append((kline['t'], float(kline['c']), signals))
+
+    async def follow(url):
+        await live['follow']({stream.name: stream}, url=url, on_signals=on_signals, seed=False, reconnect=False)
+
+    asyncio.run(against_replay(live['replay'], path, follow))
+
+    assert [(open_time, close) for open_time, close, _ in emitted] == [
+        (START + index * 60_000, close) for index, close in enumerate(closes)
+    ]
+    engine = IndicatorEngine()
+    for close in closes:
+        values = engine.update(close)
+    expected = analyze_data(pd.DataFrame([values]))
+    expected['Ichimoku'] = stream.ichimoku.signal()
+    assert emitted[-1][2] == expected
+    assert set(emitted[0][2]) == {'RSI', 'MACD', 'Bollinger Bands', 'Ichimoku'}
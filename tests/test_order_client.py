@@ -0,0 +1,81 @@
+"""DaemonClient against a stand-in daemon that stalls or answers out of turn."""
+
+import json
+import socket
+import threading
+import time
+
+import pytest
+
+from order_client import DaemonClient, DaemonError
+
+
+class StallingDaemon:
+    """Answers each request with its params; `stall` answers late and `skew` with the wrong id."""
+
+    def __init__(self, path, delay):
+        self.delay = delay
+        self.connections = 0
+        self.server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.server.bind(path)
+        self.server.listen()
+        threading.Thread(target=self.accept, daemon=True).start()
+
+    def accept(self):
+        while True:
+            try:
+                conn, _ = self.server.accept()
+            except OSError:
+                return
+            self.connections += 1
+            threading.Thread(target=self.serve, args=(conn,), daemon=True).start()
+
+    def serve(self, conn):
+        with conn, conn.makefile('r') as reader:
+            for line in reader:
+                request = json.loads(line)
+                answer_id = request['id']
+                if request['method'] == 'stall':
+                    time.sleep(self.delay)
+                elif request['method'] == 'skew':
+                    answer_id -= 1
+                try:
+                    conn.sendall((json.dumps({'id': answer_id, 'result': request['params']}) + '\n').encode())
+                except OSError:
+                    return
+
+    def close(self):
+        self.server.close()
+
+
+@pytest.fixture
+def daemon(tmp_path):
+    path = str(tmp_path / 'orderd.sock')
+    daemon = StallingDaemon(path, delay=0.5)
+    yield path, daemon
+    daemon.close()
+
+
+def test_timed_out_reply_is_not_read_by_the_next_call(daemon):
+    path, server = daemon
+    client = DaemonClient(path, timeout=0.2)
+    with pytest.raises(DaemonError, match='may still have been carried out'):
+        client.stall(symbol='BTCUSDT')
+    time.sleep(0.5)  # The late reply reaches the old connection by now
+
+    assert client.get_order(orderId=2) == {'orderId': 2}
+    assert client.get_order(orderId=3) == {'orderId': 3}
+    assert server.connections == 2
+    client.close()
+
+
+def test_out_of_turn_answer_drops_the_connection(daemon):
+    path, server = daemon
+    client = DaemonClient(path, timeout=0.2)
+    assert client.get_order(orderId=1) == {'orderId': 1}
+    with pytest.raises(DaemonError, match='answered request'):
+        client.skew()
+
+    assert client.get_order(orderId=2) == {'orderId': 2}
+    assert server.connections == 2
+    client.close()
@@ -0,0 +1,48 @@
+"""BalanceTracker end to end against the user data stream replay server."""
+
+import json
+import asyncio
+
+import user_stream
+
+
+async def against_replay(replay, path, follow):
+    """Start `replay` on a free port and run follow(url) against it."""
+    started = asyncio.get_running_loop().create_future()
+    server = asyncio.create_task(replay(path, port=0, on_start=started.set_result))
+    try:
+        port = await asyncio.wait_for(started, 5)
+        await asyncio.wait_for(follow(f"ws://127.0.0.1:{port}"), 10)
+    finally:
+        server.cancel()
+
+
+def test_user_stream_replay_balances(tmp_path):
+    snapshot = tmp_path / 'account.json'
+    snapshot.write_text(json.dumps({'updateTime': 1000, 'balances': [
+        {'asset': 'BTC', 'free': '1.0', 'locked': '0.0'}
+    ]}))
+    events = [
+        # Older than the snapshot: already included there
+        {'e': 'balanceUpdate', 'E': 900, 'a': 'BTC', 'd': '0.5', 'T': 900},
+        # A deposit whose position arrives before its balanceUpdate
+        {'e': 'outboundAccountPosition', 'E': 2000, 'u': 2000, 'B': [{'a': 'BTC', 'f': '2.0', 'l': '0.0'}]},
+        {'e': 'balanceUpdate', 'E': 1999, 'a': 'BTC', 'd': '1.0', 'T': 1999},
+        {'e': 'balanceUpdate', 'E': 2100, 'a': 'USDT', 'd': '100.0', 'T': 2100},
+        {'e': 'outboundAccountPosition', 'E': 2200, 'u': 2200, 'B': [{'a': 'BTC', 'f': '1.5', 'l': '0.5'}]},
+        {'e': 'balanceUpdate', 'E': 2300, 'a': 'BTC', 'd': '0.25', 'T': 2300},
+    ]
+    path = tmp_path / 'events.jsonl'
+    path.write_text(''.join(json.dumps(event) + '\n' for event in events))
+
+    tracker = user_stream.BalanceTracker(user_stream.StandInClient(str(snapshot)))
+    changes = []
+
+    async def follow(url):
+        await tracker.run(lambda tracker, assets: changes.append((assets, dict(tracker.balances))), url=url, reconnect=False)
+
+    asyncio.run(against_replay(user_stream.replay, path, follow))
+
+    assert [assets for assets, _ in changes] == [['BTC'], ['USDT'], ['BTC'], ['BTC']]
+    assert changes[0][1]['BTC'] == [2.0, 0.0]  # The stale deposit delta is not counted twice
+    assert tracker.balances == {'BTC': [1.75, 0.5], 'USDT': [100.0, 0.0]}
@@ -0,0 +1,9 @@
+#!/usr/bin/env python3
+"""Shim for `python -m trading_tools trade-batch`; the code lives in trading_tools/trade_batch.py."""
+
+import sys
+
+from trading_tools.cli import run
+
+if __name__ == "__main__":
+    sys.exit(run('trade-batch', sys.argv[1:]))
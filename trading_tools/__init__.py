@@ -0,0 +1,8 @@
+"""Binance trading tools behind one command-line entry point.
+
+    python -m trading_tools <command> [args]
+
+Importing the package or any command module is cheap and has no side
+effects: python-binance, pandas and ta are imported by the functions that
+need them, and the Binance client is built on first use by get_client().
+"""
@@ -0,0 +1,5 @@
+import sys
+
+from trading_tools.cli import main
+
+sys.exit(main())
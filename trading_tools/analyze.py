@@ -0,0 +1,128 @@
+"""RSI, MACD and Bollinger Band signals for one trading pair or a whole scan."""
+
+
+def print_help():
+    print("Usage: analize.py <trading-pair> <interval>")
+    print("       analize.py scan <interval> <symbol> [<symbol> ...] | --quote <asset>")
+    print("Description: This script performs technical analysis on cryptocurrency trading pairs using RSI, MACD, and Bollinger Bands indicators.")
+
+
+def get_klines(symbol, interval):
+    from klines import load_klines
+
+    # Closed candles come from the local store; only newer ones are downloaded
+    return load_klines(symbol, interval, limit=500)
+
+
+def calculate_indicators(df, rsi_window=7, macd_slow=26, macd_fast=12, macd_sign=9, bb_window=20, bb_dev=2):
+    import ta
+
+    # Calculate RSI
+    df['rsi'] = ta.momentum.RSIIndicator(df['close'], window=rsi_window).rsi()
+
+    # Calculate MACD
+    macd = ta.trend.MACD(df['close'], window_slow=macd_slow, window_fast=macd_fast, window_sign=macd_sign)
+    df['macd'] = macd.macd()
+    df['macd_signal'] = macd.macd_signal()
+    df['macd_diff'] = macd.macd_diff()
+
+    # Calculate Bollinger Bands
+    bollinger = ta.volatility.BollingerBands(df['close'], window=bb_window, window_dev=bb_dev)
+    df['bb_high'] = bollinger.bollinger_hband()
+    df['bb_low'] = bollinger.bollinger_lband()
+    df['bb_middle'] = bollinger.bollinger_mavg()
+
+    return df
+
+
+def analyze_data(df):
+    # Analyze RSI
+    if df['rsi'].iloc[-1] > 80:
+        rsi_signal = "SHORT"
+    elif df['rsi'].iloc[-1] < 20:
+        rsi_signal = "LONG"
+    else:
+        rsi_signal = "NEUTRAL"
+
+    # Analyze MACD
+    if df['macd'].iloc[-1] > df['macd_signal'].iloc[-1]:
+        macd_signal = "LONG"
+    elif df['macd'].iloc[-1] < df['macd_signal'].iloc[-1]:
+        macd_signal = "SHORT"
+    else:
+        macd_signal = "NEUTRAL"
+
+    # Analyze Bollinger Bands
+    if df['close'].iloc[-1] > df['bb_high'].iloc[-1]:
+        bb_signal = "SHORT"
+    elif df['close'].iloc[-1] < df['bb_low'].iloc[-1]:
+        bb_signal = "LONG"
+    else:
+        bb_signal = "NEUTRAL"
+
+    return {
+        'RSI': rsi_signal,
+        'MACD': macd_signal,
+        'Bollinger Bands': bb_signal
+    }
+
+
+def analyze(symbol, interval):
+    df = get_klines(symbol, interval)
+    df = calculate_indicators(df)
+    signals = analyze_data(df)
+
+    # Print the latest data and signals
+    print("Latest Data:")
+    print(df.tail(1).T)
+
+    print("\nSignals:")
+    for indicator, signal in signals.items():
+        print(f"{indicator}: {signal}")
+
+
+def scan(symbols, interval):
+    import pandas as pd
+    from scanner import load_many
+
+    rows = []
+    for symbol, df, error in load_many(symbols, interval):
+        if error is not None:
+            print(f"Skipping {symbol}: {error}")
+            continue
+
+        df = calculate_indicators(df)
+        latest = df.iloc[-1]
+        rows.append({
+            'symbol': symbol,
+            'close': latest['close'],
+            'rsi': latest['rsi'],
+            'macd_diff': latest['macd_diff'],
+            **analyze_data(df)
+        })
+
+    if not rows:
+        print("No symbols could be analyzed.")
+        return
+
+    table = pd.DataFrame(rows).sort_values('symbol')
+    print(table.to_string(index=False))
+
+
+def main(argv):
+    if len(argv) >= 3 and argv[0] == 'scan':
+        from scanner import trading_symbols
+
+        interval = argv[1]
+        if argv[2] == '--quote':
+            symbols = trading_symbols(argv[3])
+        else:
+            symbols = [symbol.upper() for symbol in argv[2:]]
+        scan(symbols, interval)
+    elif len(argv) != 2:
+        print("Usage: python analize.py <trading-pair> <interval>")
+        print("       python analize.py scan <interval> <symbol> [<symbol> ...] | --quote <asset>")
+        print("Example: python analize.py SOLBTC 1d")
+        print("Example: python analize.py scan 1h --quote USDT")
+    else:
+        analyze(argv[0].upper(), argv[1])
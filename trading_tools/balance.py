@@ -0,0 +1,165 @@
+"""Account balances valued in a target currency, sampled history and live updates."""
+
+import time
+from datetime import datetime, timezone
+
+from trading_tools.client import get_client
+
+opening_balance = 0.00130951
+
+
+def print_help():
+    print("Usage: balance.py [<target-currency>]")
+    print("       balance.py sample [<target-currency>] [--interval SECONDS]")
+    print("       balance.py history [<target-currency>] [--days N]")
+    print("       balance.py live [--url URL] [--snapshot FILE] [--record FILE] [--no-reconnect]")
+    print("Description: This script checks the balance of the specified cryptocurrency in your Binance account.")
+
+
+def load_index(target):
+    from valuation import TARGETS, load_index
+
+    return load_index(targets=tuple(set(TARGETS) | {'BTC', target}))
+
+
+def account_holdings():
+    """Return (asset, free, locked) for every non-zero balance."""
+    account_info = get_client().get_account()
+    held = []
+    for balance in account_info['balances']:
+        free = float(balance['free'])
+        locked = float(balance['locked'])
+        if free + locked > 0:
+            held.append((balance['asset'], free, locked))
+    return held
+
+
+def value_holdings(index, held, target):
+    """Value every holding in `target` along its best conversion path at the latest prices."""
+    price_vector = index.price_vector(get_client().get_all_tickers())
+    values = index.value([asset for asset, _, _ in held], [free + locked for _, free, locked in held], price_vector, target)
+    btc_rate = index.value(['BTC'], [1.0], price_vector, target)[0]
+    return values, btc_rate
+
+
+def format_time(time_ms):
+    return datetime.fromtimestamp(time_ms / 1000, tz=timezone.utc).strftime('%Y-%m-%d %H:%M')
+
+
+def report(target):
+    import balance_history
+
+    index = load_index(target)
+    held = account_holdings()
+    values, btc_rate = value_holdings(index, held, target)
+    total_value = values.sum()
+
+    # Print asset balances worth more than a threshold (e.g., 0.0001 BTC)
+    threshold = 0.0001 * btc_rate
+
+    print("--------------------------------------------------------------")
+    print("Asset Balances:")
+    for (asset, free, locked), value in zip(held, values):
+        if value > threshold:
+            print(f"Asset: {asset}, Free: {free}, Locked: {locked}, {target} Value: {value:.8f}")
+
+    print("--------------------------------------------------------------")
+    print(f"Total Balance in {target}: {total_value:.8f}")
+
+    # Calculate percentage change from the first recorded sample, or the fixed opening balance
+    equity = balance_history.read_equity(target)
+    opening = float(equity['total'][0]) if len(equity) else (opening_balance if target == 'BTC' else None)
+    if opening:
+        percentage_change = ((total_value - opening) / opening) * 100
+        print(f"Percentage change from opening balance: {percentage_change:.2f}%")
+
+    print("--------------------------------------------------------------")
+
+
+def sample(target, interval):
+    """Record the account's valuation every `interval` seconds until interrupted."""
+    import requests
+    import balance_history
+    from binance.exceptions import BinanceAPIException, BinanceRequestException
+
+    index = load_index(target)
+    print(f"Sampling balances in {target} every {interval} s into {balance_history.HISTORY_DIR}")
+    while True:
+        try:
+            held = account_holdings()
+            values, _ = value_holdings(index, held, target)
+            now = int(time.time() * 1000)
+            balance_history.append_sample(target, now, [asset for asset, _, _ in held], [free + locked for _, free, locked in held], values)
+            print(f"{format_time(now)} Total Balance in {target}: {values.sum():.8f}")
+        except (BinanceAPIException, BinanceRequestException) as e:
+            print(f"Binance exception occurred, skipping sample: {e}")
+        except requests.RequestException as e:
+            print(f"Request failed, skipping sample: {e}")
+        except ValueError as e:
+            print(f"ValueError, skipping sample: {e}")
+
+        # Sleep to the next interval boundary so samples stay evenly spaced
+        time.sleep(interval - time.time() % interval)
+
+
+def history(target, days=None):
+    """Print change, max drawdown and per-asset contribution over the last `days` (default: all)."""
+    import balance_history
+
+    start = None if days is None else int((time.time() - days * 86400) * 1000)
+    summary = balance_history.change(target, start)
+    if summary is None:
+        print(f"No {target} balance history in {balance_history.HISTORY_DIR}")
+        return
+    drawdown = balance_history.max_drawdown(target, start)
+
+    print("--------------------------------------------------------------")
+    print(f"Balance history in {target}: {format_time(summary['start_time'])} to {format_time(summary['end_time'])} UTC")
+    print(f"Opening: {summary['opening']:.8f}, Closing: {summary['closing']:.8f}")
+    print(f"Change: {summary['change']:.8f} ({summary['change_percent']:.2f}%)")
+    print(f"Max drawdown: {drawdown['drawdown_percent']:.2f}% "
+          f"({format_time(drawdown['peak_time'])} to {format_time(drawdown['trough_time'])})")
+    print("--------------------------------------------------------------")
+    print("Contribution by asset:")
+    for asset, opening, closing, difference in balance_history.contribution(target, start):
+        print(f"Asset: {asset}, Opening: {opening:.8f}, Closing: {closing:.8f}, Change: {difference:+.8f}")
+    print("--------------------------------------------------------------")
+
+
+def print_changes(tracker, assets):
+    for asset in assets:
+        free, locked = tracker.balances[asset]
+        print(f"{format_time(int(tracker.updated * 1000))} Asset: {asset}, Free: {free}, Locked: {locked}", flush=True)
+
+
+def live(url=None, snapshot=None, record=None, reconnect=True):
+    """Follow balance changes from the user data stream instead of polling get_account."""
+    import asyncio
+    from user_stream import STREAM_URL, BalanceTracker, StandInClient
+
+    tracker = BalanceTracker(StandInClient(snapshot) if snapshot else get_client())
+    asyncio.run(tracker.run(print_changes, url=url or STREAM_URL, record=record, reconnect=reconnect))
+
+
+def option(argv, name, default, cast):
+    return cast(argv[argv.index(name) + 1]) if name in argv else default
+
+
+def main(argv):
+    args = [arg for i, arg in enumerate(argv) if not arg.startswith('--') and not (i and argv[i - 1].startswith('--'))]
+    command = args[0] if args and args[0] in ('sample', 'history', 'live') else None
+    if command:
+        args = args[1:]
+
+    # Currency to value the account in (default BTC)
+    target = args[0].upper() if args else 'BTC'
+
+    if command == 'sample':
+        sample(target, option(argv, '--interval', 60, int))
+    elif command == 'history':
+        history(target, option(argv, '--days', None, float))
+    elif command == 'live':
+        live(option(argv, '--url', None, str), option(argv, '--snapshot', None, str),
+             option(argv, '--record', None, str), '--no-reconnect' not in argv)
+    else:
+        report(target)
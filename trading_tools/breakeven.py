@@ -0,0 +1,176 @@
+"""Breakeven price of a position from the synced trade ledger, for one pair or every holding."""
+
+import sys
+from decimal import Decimal, Context, getcontext, localcontext
+from datetime import datetime, timezone
+from concurrent.futures import ThreadPoolExecutor
+
+import ledger
+from trading_tools.client import get_client
+
+BREAKEVEN_CONTEXT = Context(prec=8)  # Decimal precision of the breakeven arithmetic
+TRADING_FEE_PERCENT = Decimal('0.001')  # 0.1% trading fee
+# myTrades costs 20 weight, so 10 concurrent syncs stay far below the 6000/minute limit
+LEDGER_WORKERS = 10
+
+
+def print_help():
+    print("Usage: breakeven.py <trading-pair> [--fifo]")
+    print("       breakeven.py --all [--quote <asset>] [--fifo]")
+    print("Description: This script calculates the breakeven price for your trading positions.")
+
+
+def get_last_trade(symbol):
+    """Get the last trade of a specific trading pair symbol from the synced ledger."""
+    state, new_trades = ledger.sync_trades(get_client(), symbol)
+    return state['last_trade']
+
+
+def position_breakeven(state, method='avg'):
+    """Breakeven price of the open position built from every fill in the ledger."""
+    if method == 'fifo':
+        return ledger.fifo_breakeven(state)
+    return ledger.average_cost_breakeven(state)
+
+
+def calculate_breakeven_price(last_trade, current_price):
+    """Calculate the breakeven price incorporating the trading fee."""
+    with localcontext(BREAKEVEN_CONTEXT):
+        last_trade_price = Decimal(last_trade['price'])
+        last_trade_qty = Decimal(last_trade['qty'])
+        last_trade_side = last_trade['isBuyer']
+
+        if last_trade_side:
+            # Last trade was a BUY
+            cost_basis = last_trade_price * last_trade_qty
+            cost_basis += cost_basis * TRADING_FEE_PERCENT  # Add buy fee
+            breakeven_price = (cost_basis / last_trade_qty) / (1 - TRADING_FEE_PERCENT)
+        else:
+            # Last trade was a SELL
+            revenue_basis = last_trade_price * last_trade_qty
+            revenue_basis -= revenue_basis * TRADING_FEE_PERCENT  # Subtract sell fee
+            breakeven_price = (revenue_basis / last_trade_qty) / (1 + TRADING_FEE_PERCENT)
+
+        return breakeven_price
+
+
+def format_timedelta(delta):
+    """Format a timedelta object into a string with days, hours, minutes, and seconds."""
+    days = delta.days
+    seconds = delta.seconds
+    hours = seconds // 3600
+    minutes = (seconds % 3600) // 60
+    seconds = seconds % 60
+    return f"{days} days, {hours} hours, {minutes} minutes, {seconds} seconds"
+
+
+def held_assets(quote_asset):
+    """Return {asset: quantity} for every non-zero balance other than the quote asset."""
+    account = get_client().get_account()
+    held = {}
+    for balance in account['balances']:
+        quantity = Decimal(balance['free']) + Decimal(balance['locked'])
+        if quantity > 0 and balance['asset'] != quote_asset:
+            held[balance['asset']] = quantity
+    return held
+
+
+def dashboard(quote_asset='USDT', method='avg'):
+    """Print breakeven, distance to breakeven and time since last trade for every held position."""
+    held = held_assets(quote_asset)
+
+    # One bulk ticker request prices every pair
+    prices = {ticker['symbol']: Decimal(ticker['price']) for ticker in get_client().get_all_tickers()}
+    symbols = {asset + quote_asset: asset for asset in held if asset + quote_asset in prices}
+    skipped = sorted(asset for asset in held if asset + quote_asset not in prices)
+
+    with ThreadPoolExecutor(max_workers=LEDGER_WORKERS) as pool:
+        states = dict(zip(symbols, pool.map(lambda symbol: ledger.sync_trades(get_client(), symbol)[0], symbols)))
+
+    current_time = datetime.now(tz=timezone.utc)
+    print(f"{'Symbol':<12}{'Held':>16}{'Price':>16}{'Breakeven':>16}{'Distance':>10}  Since last trade")
+    for symbol, asset in sorted(symbols.items()):
+        state = states[symbol]
+        current_price = prices[symbol]
+        if ledger.position(state) > 0:
+            breakeven_price = position_breakeven(state, method)
+        elif state['last_trade']:
+            breakeven_price = calculate_breakeven_price(state['last_trade'], current_price)
+        else:
+            print(f"{symbol:<12}{held[asset]:>16}{current_price:>16}{'-':>16}{'-':>10}  no trades")
+            continue
+
+        distance = ((current_price - breakeven_price) / breakeven_price) * 100
+        last_trade_time = datetime.fromtimestamp(state['last_trade']['time'] / 1000, tz=timezone.utc)
+        print(
+            f"{symbol:<12}{held[asset]:>16}{current_price:>16}{breakeven_price:>16.8f}"
+            f"{distance:>9.2f}%  {format_timedelta(current_time - last_trade_time)}"
+        )
+
+    if skipped:
+        print(f"No {quote_asset} pair for: {', '.join(skipped)}")
+
+
+def main(argv):
+    # The printed figures keep the precision the script has always used
+    getcontext().prec = BREAKEVEN_CONTEXT.prec
+
+    if '--all' in argv:
+        quote_asset = argv[argv.index('--quote') + 1].upper() if '--quote' in argv else 'USDT'
+        dashboard(quote_asset, 'fifo' if '--fifo' in argv else 'avg')
+        return
+
+    args = [arg for arg in argv if arg != '--fifo']
+    method = 'fifo' if '--fifo' in argv else 'avg'
+    if len(args) != 1:
+        print("Usage: breakeven.py <trading-pair> [--fifo]")
+        print("Example: breakeven.py BTCUSDT")
+        sys.exit(1)
+
+    symbol = args[0].upper()
+
+    # Bring the local trade ledger up to date; after the first run this is one request
+    state, new_trades = ledger.sync_trades(get_client(), symbol)
+    last_trade = state['last_trade']
+    if not last_trade:
+        print("No last trade found for the specified trading pair.")
+        sys.exit(1)
+
+    last_trade_price = Decimal(last_trade['price'])
+    last_trade_qty = Decimal(last_trade['qty'])
+    last_trade_side = last_trade['isBuyer']
+
+    print(f"Last trade price: {last_trade_price} {symbol[3:]}")
+    print(f"Last trade quantity: {last_trade_qty} {symbol[:3]}")
+    print(f"Last trade side: {'BUY' if last_trade_side else 'SELL'}")
+
+    # Get current price of the trading pair
+    avg_price = get_client().get_avg_price(symbol=symbol)
+    current_price = Decimal(avg_price['price'])
+    print(f"Current price: {current_price} {symbol[3:]}")
+
+    # Calculate breakeven price of the whole open position, or of the last trade when flat
+    open_position = ledger.position(state)
+    if open_position > 0:
+        print(f"Open position: {open_position} {symbol[:3]} ({state['trade_count']} trades in ledger)")
+        breakeven_price = position_breakeven(state, method)
+        label = 'FIFO' if method == 'fifo' else 'average cost'
+        print(f"Breakeven price ({label}): {breakeven_price:.8f} {symbol[3:]}")
+    else:
+        breakeven_price = calculate_breakeven_price(last_trade, current_price)
+        print(f"Breakeven price: {breakeven_price} {symbol[3:]}")
+
+    # Calculate percentage difference from current price to breakeven price
+    percentage_difference = ((current_price - breakeven_price) / breakeven_price) * 100
+
+    if open_position > 0 or last_trade_side:
+        print(f"Percentage difference to breakeven (if SELL): {percentage_difference:.2f}%")
+    else:
+        print(f"Percentage difference to breakeven (if BUY): {percentage_difference:.2f}%")
+
+    # Calculate time elapsed since last trade
+    last_trade_time = datetime.fromtimestamp(last_trade['time'] / 1000, tz=timezone.utc)
+    current_time = datetime.now(tz=timezone.utc)
+    time_elapsed = current_time - last_trade_time
+
+    print(f"Time elapsed since last trade: {format_timedelta(time_elapsed)}")
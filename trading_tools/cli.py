@@ -0,0 +1,144 @@
+"""Subcommand dispatch for `python -m trading_tools`.
+
+The commands in COMMANDS live in this package and import only what they
+use, when they use it. The scripts in SCRIPTS have not moved into the
+package yet; they run unchanged from the repository root. `startup` times
+`<command> --help` for every package command against STARTUP_BUDGET_MS and
+lists any heavy module that importing a command pulls in.
+"""
+
+import os
+import sys
+import time
+import importlib
+import subprocess
+
+COMMANDS = {
+    'analyze': 'trading_tools.analyze',
+    'balance': 'trading_tools.balance',
+    'breakeven': 'trading_tools.breakeven',
+    'ichimoku': 'trading_tools.ichimoku',
+    'price': 'trading_tools.price',
+    'trade-batch': 'trading_tools.trade_batch',
+    'trade-limit': 'trading_tools.trade_limit',
+    'trade-market': 'trading_tools.trade_market',
+}
+SCRIPTS = {
+    'backtest': 'backtest.py',
+    'confluence': 'confluence.py',
+    'fills': 'fills.py',
+    'klines': 'klines.py',
+    'live': 'live.py',
+    'orderd': 'orderd.py',
+    'simulate': 'simulate.py',
+    'sweep': 'sweep.py',
+}
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+STARTUP_BUDGET_MS = 100  # Median wall time of `<command> --help`, interpreter start included
+STARTUP_RUNS = 5
+HEAVY_MODULES = ('binance', 'pandas', 'numpy', 'ta', 'requests', 'websockets')
+
+
+def print_help():
+    print("Usage: python -m trading_tools <command> [args]")
+    print("       python -m trading_tools startup [--budget MS] [--runs N]")
+    print(f"Commands: {', '.join(sorted(COMMANDS))}")
+    print(f"Scripts: {', '.join(sorted(SCRIPTS))}")
+    print("Description: Runs one of the trading tools; `<command> --help` describes each one.")
+
+
+def report_error(e):
+    # binance.exceptions is only loaded once a command has talked to Binance
+    exceptions = sys.modules.get('binance.exceptions')
+    if exceptions and isinstance(e, exceptions.BinanceAPIException):
+        print(f"Binance API Exception: {e}")
+    elif exceptions and isinstance(e, exceptions.BinanceRequestException):
+        print(f"Binance Request Exception: {e}")
+    else:
+        print(f"An unexpected error occurred: {e}")
+
+
+def run(command, argv):
+    """Run one package command with the scripts' error reporting; returns the exit status."""
+    module = importlib.import_module(COMMANDS[command])
+    if '-h' in argv or '--help' in argv:
+        module.print_help()
+        return 0
+    try:
+        module.main(argv)
+    except IndexError:
+        print("Error: Missing command line arguments.")
+        module.print_help()
+    except ValueError as e:
+        print(f"ValueError: {e}")
+    except KeyboardInterrupt:
+        print("Stopped.")
+    except Exception as e:
+        report_error(e)
+    else:
+        return 0
+    return 1
+
+
+def run_script(command, argv):
+    """Run a script that still lives at the repository root as if it were started directly."""
+    import runpy
+
+    path = os.path.join(ROOT, SCRIPTS[command])
+    sys.argv = [path] + argv
+    runpy.run_path(path, run_name='__main__')
+    return 0
+
+
+def heavy_imports(module):
+    """Heavy modules that importing `module` loads, checked in a fresh interpreter."""
+    code = (
+        f"import sys, importlib; importlib.import_module({module!r}); "
+        f"print(' '.join(name for name in {HEAVY_MODULES!r} if name in sys.modules))"
+    )
+    result = subprocess.run([sys.executable, '-c', code], cwd=ROOT, capture_output=True, text=True, check=True)
+    return result.stdout.split()
+
+
+def startup_time(command, runs=STARTUP_RUNS):
+    """Median wall time in milliseconds of `python -m trading_tools <command> --help`."""
+    times = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, '-m', 'trading_tools', command, '--help'], cwd=ROOT,
+                       stdout=subprocess.DEVNULL, check=True)
+        times.append((time.perf_counter() - start) * 1000)
+    return sorted(times)[len(times) // 2]
+
+
+def startup(argv):
+    budget = float(argv[argv.index('--budget') + 1]) if '--budget' in argv else STARTUP_BUDGET_MS
+    runs = int(argv[argv.index('--runs') + 1]) if '--runs' in argv else STARTUP_RUNS
+
+    over = []
+    print(f"{'Command':<14}{'Startup':>10}  Heavy imports")
+    for command in sorted(COMMANDS):
+        elapsed = startup_time(command, runs)
+        heavy = heavy_imports(COMMANDS[command])
+        if elapsed > budget or heavy:
+            over.append(command)
+        print(f"{command:<14}{elapsed:>8.1f}ms  {' '.join(heavy) or '-'}")
+    print(f"Budget {budget:.0f} ms: {'all commands within budget' if not over else 'over budget: ' + ', '.join(over)}")
+    return 1 if over else 0
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if not argv or argv[0] in ('-h', '--help'):
+        print_help()
+        return 0
+    command, argv = argv[0], argv[1:]
+    if command == 'startup':
+        return startup(argv)
+    if command in COMMANDS:
+        return run(command, argv)
+    if command in SCRIPTS:
+        return run_script(command, argv)
+    print(f"Unknown command: {command}")
+    print_help()
+    return 1
@@ -0,0 +1,60 @@
+"""Deferred Binance client construction.
+
+Importing python-binance takes about 300 ms, so commands ask get_client()
+for the client when they first talk to Binance instead of building it at
+import time. Help output, argument errors and offline work never pay for it.
+"""
+
+import threading
+
+_client = None
+_client_lock = threading.Lock()
+_local = threading.local()
+
+
+def new_client(daemon=False, pool_maxsize=10):
+    """Build a client of its own, not shared with get_client() callers.
+
+    With daemon=True it is a new connection to orderd.py when the daemon runs.
+    """
+    if daemon:
+        from order_client import connect
+        client = connect()
+        if client is not None:
+            return client
+    from binance.client import Client
+    from keys import API_KEY, API_SECRET
+    from ratelimit import limit_client
+    from rest import use_base_url
+    return limit_client(use_base_url(Client(API_KEY, API_SECRET, ping=False)), pool_maxsize=pool_maxsize)
+
+
+def get_client(daemon=False, pool_maxsize=10):
+    """Return the process-wide client, creating it on first use.
+
+    With daemon=True requests go to the warm orderd.py daemon when it runs.
+    """
+    global _client
+    with _client_lock:
+        if _client is None:
+            _client = new_client(daemon, pool_maxsize)
+    return _client
+
+
+def set_client(client):
+    """Use `client` for every later get_client() call, e.g. a SimulatedExchange."""
+    global _client
+    with _client_lock:
+        _client = client
+
+
+def get_thread_client(pool_maxsize=10):
+    """Return this thread's own orderd.py connection when the daemon runs, else the shared get_client().
+
+    A daemon connection answers one call at a time, so threads placing orders
+    concurrently each need their own; the REST client is safe to share.
+    """
+    if not hasattr(_local, 'client'):
+        from order_client import connect
+        _local.client = connect()
+    return _local.client or get_client(pool_maxsize=pool_maxsize)
@@ -0,0 +1,178 @@
+"""Ichimoku Cloud signal, target and stop loss for one trading pair, or a scan for fresh crosses."""
+
+import argparse
+from functools import partial
+
+
+def print_help():
+    print("Usage: ichimoku.py <trading-pair> <time-span> [<window1> <window2> <window3>]")
+    print("       ichimoku.py scan <time-span> [<symbol> ...] [--quote <asset>] [--windows <w1> <w2> <w3>] [--fresh <bars>]")
+    print("Description: This script calculates and analyzes Ichimoku Cloud indicators for a specified cryptocurrency trading pair.")
+
+
+def fetch_data(trading_pair, interval):
+    from klines import load_klines
+
+    # Closed candles come from the local store; only newer ones are downloaded
+    df = load_klines(trading_pair, interval, limit=1000)
+
+    df.set_index('timestamp', inplace=True)
+    df = df[['open', 'high', 'low', 'close', 'volume']]
+    return df
+
+
+def apply_ichimoku(df, window1, window2, window3):
+    from ichimoku_engine import ichimoku_lines
+
+    triple = (window1, window2, window3)
+    lines = ichimoku_lines(df['high'], df['low'], df['close'], [triple])[triple]
+
+    for column, values in lines.items():
+        df[column] = values
+
+    return df
+
+
+def analyze_ichimoku(df):
+    latest = df.iloc[-1]
+    prior = df.iloc[-2]
+
+    # Basic Ichimoku analysis
+    if latest['close'] > latest['senkou_span_a'] and latest['close'] > latest['senkou_span_b']:
+        if latest['tenkan_sen'] > latest['kijun_sen'] and prior['tenkan_sen'] <= prior['kijun_sen']:
+            return "LONG"
+    elif latest['close'] < latest['senkou_span_a'] and latest['close'] < latest['senkou_span_b']:
+        if latest['tenkan_sen'] < latest['kijun_sen'] and prior['tenkan_sen'] >= prior['kijun_sen']:
+            return "SHORT"
+    return "NEUTRAL"
+
+
+def compute_target_and_stop(signal, price, atr):
+    if signal == "LONG":
+        target = price + 2 * atr
+        stop_loss = price - atr
+    elif signal == "SHORT":
+        target = price - 2 * atr
+        stop_loss = price + atr
+    else:
+        target = None
+        stop_loss = None
+    return target, stop_loss
+
+
+def scan_symbol(symbol, df, windows, fresh):
+    """Return the latest crossover of one symbol if it happened within `fresh` bars."""
+    import numpy as np
+    from ichimoku_engine import ichimoku_signals, average_true_range
+
+    df = df.set_index('timestamp')[['open', 'high', 'low', 'close', 'volume']]
+    df = apply_ichimoku(df, *windows)
+    signals = ichimoku_signals(df)
+
+    recent = np.flatnonzero(signals[-fresh:])
+    if len(recent) == 0:
+        return None
+    bars_ago = min(fresh, len(df)) - 1 - recent[-1]
+    signal = "LONG" if signals[len(df) - 1 - bars_ago] > 0 else "SHORT"
+
+    latest = df.iloc[-1]
+    latest_atr = average_true_range(df['high'], df['low'], df['close'], window=14)[-1]
+    target, stop_loss = compute_target_and_stop(signal, latest['close'], latest_atr)
+    if signal == "LONG":
+        cloud_edge = max(latest['senkou_span_a'], latest['senkou_span_b'])
+    else:
+        cloud_edge = min(latest['senkou_span_a'], latest['senkou_span_b'])
+
+    return {
+        'symbol': symbol,
+        'signal': signal,
+        'bars_ago': bars_ago,
+        'close': latest['close'],
+        'cloud_atr': abs(latest['close'] - cloud_edge) / latest_atr if latest_atr else np.nan,
+        'target': target,
+        'target_%': (target - latest['close']) / latest['close'] * 100,
+        'stop_loss': stop_loss,
+        'stop_loss_%': (stop_loss - latest['close']) / latest['close'] * 100
+    }
+
+
+def scan(argv):
+    import pandas as pd
+    from scanner import load_many, trading_symbols
+
+    parser = argparse.ArgumentParser(prog='ichimoku.py scan', description="Rank fresh Ichimoku crosses across many trading pairs")
+    parser.add_argument('time_span', help='Kline interval (e.g., 4h)')
+    parser.add_argument('symbols', nargs='*', help='Trading pairs to scan (default: every TRADING symbol)')
+    parser.add_argument('--quote', default=None, help='Only symbols quoted in this asset (e.g., USDT)')
+    parser.add_argument('--windows', type=int, nargs=3, default=[9, 18, 24], metavar='W')
+    parser.add_argument('--fresh', type=int, default=1, help='Report crosses from the last N bars (default: 1)')
+    args = parser.parse_args(argv)
+
+    symbols = [symbol.upper() for symbol in args.symbols] or trading_symbols(args.quote)
+    process = partial(scan_symbol, windows=args.windows, fresh=args.fresh)
+
+    rows = []
+    for symbol, row, error in load_many(symbols, args.time_span, limit=1000, process=process):
+        if error is not None:
+            print(f"Skipping {symbol}: {error}")
+        elif row is not None:
+            rows.append(row)
+
+    print(f"Scanned {len(symbols)} symbols on {args.time_span} timeframe: {len(rows)} fresh crosses")
+    if rows:
+        # Newest crosses first, then the ones furthest beyond the cloud in ATRs
+        table = pd.DataFrame(rows).sort_values(['bars_ago', 'cloud_atr', 'symbol'], ascending=[True, False, True])
+        print(table.to_string(index=False, float_format=lambda value: f"{value:.8g}"))
+
+
+def main(argv):
+    from ichimoku_engine import average_true_range
+
+    if len(argv) >= 2 and argv[0] == 'scan':
+        scan(argv[1:])
+        return
+
+    if len(argv) not in [2, 5]:
+        print("Usage: ichimoku.py <trading-pair> <time-span> [<window1> <window2> <window3>]")
+        print("       ichimoku.py scan <time-span> [<symbol> ...] [--quote <asset>] [--windows <w1> <w2> <w3>] [--fresh <bars>]")
+        return
+
+    trading_pair = argv[0].upper()
+    time_span = argv[1]
+
+    if len(argv) == 5:
+        window1 = int(argv[2])
+        window2 = int(argv[3])
+        window3 = int(argv[4])
+    else:
+        window1 = 9
+        window2 = 18
+        window3 = 24
+
+    df = fetch_data(trading_pair, time_span)
+    df = apply_ichimoku(df, window1, window2, window3)
+
+    # Calculate ATR for target and stop-loss levels
+    df['atr'] = average_true_range(df['high'], df['low'], df['close'], window=14)
+
+    signal = analyze_ichimoku(df)
+    latest_close = df.iloc[-1]['close']
+    latest_atr = df.iloc[-1]['atr']
+
+    # Debugging statements
+    print(f"Latest close price: {latest_close}")
+    print(f"Latest ATR: {latest_atr}")
+
+    target, stop_loss = compute_target_and_stop(signal, latest_close, latest_atr)
+
+    if target and stop_loss:
+        target_percent = ((target - latest_close) / latest_close) * 100
+        stop_loss_percent = ((stop_loss - latest_close) / latest_close) * 100
+    else:
+        target_percent = None
+        stop_loss_percent = None
+
+    print(f"Trading Signal for {trading_pair} on {time_span} timeframe: {signal}")
+    if signal in ["LONG", "SHORT"]:
+        print(f"Target: {target:.8f} ({target_percent:.2f}%)")
+        print(f"Stop Loss: {stop_loss:.8f} ({stop_loss_percent:.2f}%)")
@@ -0,0 +1,28 @@
+"""Helpers shared by the order commands."""
+
+from decimal import Decimal, ROUND_DOWN
+
+from trading_tools.client import get_client
+
+
+def get_available_balance(asset):
+    """Get the available balance of a specific asset in the user's spot wallet."""
+    balance = get_client(daemon=True).get_asset_balance(asset=asset)
+    if balance is None:
+        raise ValueError(f"Could not retrieve balance for asset: {asset}")
+    available_balance = float(balance.get('free', 0.0))
+    return available_balance
+
+
+def get_symbol_info(symbol):
+    """Get the cached trading rules (LOT_SIZE, PRICE_FILTER, NOTIONAL) for a specific trading pair symbol."""
+    from symbol_filters import get_filters
+
+    return get_filters(symbol)
+
+
+def round_down(quantity, decimals):
+    """Round down a quantity to the specified number of decimal places."""
+    factor = Decimal(10) ** decimals
+    return (Decimal(str(quantity)) * factor).to_integral_value(ROUND_DOWN) / factor
+
@@ -0,0 +1,193 @@
+"""Validate a ladder or CSV of limit orders, then place them concurrently.
+
+Orders go through get_client(), or one orderd.py connection per worker
+thread when the daemon runs, so they count against the same shared
+ratelimit order budget as every other command.
+"""
+
+import csv
+import sys
+import time
+import argparse
+from collections import defaultdict
+from decimal import Decimal
+
+from trading_tools.client import get_client, get_thread_client
+
+WORKERS = 10  # Orders in flight at once
+
+
+def print_help():
+    print("Usage: trade-batch.py ladder <symbol> <BUY/SELL> <low-price> <high-price> <levels> <total-quantity> [--distribution flat|linear|geometric] [--ratio R] [--dry-run]")
+    print("       trade-batch.py csv <file> [--dry-run]")
+    print("Description: This script validates a ladder or a CSV of limit orders against the symbol filters and one balance check, then places them concurrently and reports each order's result and latency.")
+
+
+def split_symbol(symbol):
+    try:
+        base_asset, quote_asset = symbol.upper().split('/')
+    except ValueError:
+        raise ValueError(f"Invalid symbol format {symbol!r}. Use format BASE/QUOTE (e.g., DOGE/BTC).")
+    return base_asset, quote_asset
+
+
+def make_order(symbol, side, price, quantity):
+    base_asset, quote_asset = split_symbol(symbol)
+    side = side.upper()
+    if side not in ['BUY', 'SELL']:
+        raise ValueError(f"Invalid action {side!r}. Use BUY or SELL.")
+    return {
+        'symbol': base_asset + quote_asset, 'base_asset': base_asset, 'quote_asset': quote_asset,
+        'side': side, 'price': Decimal(str(price)), 'quantity': Decimal(str(quantity))
+    }
+
+
+def ladder_weights(levels, distribution='flat', ratio=1.5):
+    """Relative size of each level, from the level nearest the market outwards."""
+    if distribution == 'flat':
+        return [Decimal(1)] * levels
+    if distribution == 'linear':
+        return [Decimal(i + 1) for i in range(levels)]
+    if distribution == 'geometric':
+        return [Decimal(str(ratio)) ** i for i in range(levels)]
+    raise ValueError(f"Unknown size distribution: {distribution}")
+
+
+def ladder_orders(symbol, side, low, high, levels, total_quantity, distribution='flat', ratio=1.5):
+    """Spread total_quantity over `levels` evenly spaced prices between low and high.
+
+    Sizes grow away from the market: downwards for a BUY ladder, upwards for a SELL ladder.
+    """
+    low, high, total_quantity = Decimal(str(low)), Decimal(str(high)), Decimal(str(total_quantity))
+    if levels < 1 or low > high:
+        raise ValueError("A ladder needs at least one level and low-price <= high-price")
+    step = (high - low) / (levels - 1) if levels > 1 else Decimal(0)
+    prices = [low + step * i for i in range(levels)]
+    if side.upper() == 'BUY':
+        prices.reverse()  # Highest bid first
+
+    weights = ladder_weights(levels, distribution, ratio)
+    total_weight = sum(weights)
+    return [
+        make_order(symbol, side, price, total_quantity * weight / total_weight)
+        for price, weight in zip(prices, weights)
+    ]
+
+
+def read_orders_csv(path):
+    """Read orders from a CSV file with a symbol,side,price,quantity header."""
+    with open(path, newline='') as f:
+        return [make_order(row['symbol'], row['side'], row['price'], row['quantity']) for row in csv.DictReader(f)]
+
+
+def prepare_orders(orders):
+    """Round every order to its symbol's filters and validate it; returns the list of problems."""
+    from symbol_filters import get_filters
+
+    problems = []
+    for number, order in enumerate(orders, 1):
+        filters = get_filters(order['symbol'])
+        order['price'] = filters.round_price(order['price'])
+        order['quantity'] = filters.round_quantity(order['quantity'])
+        try:
+            filters.validate(order['quantity'], order['price'])
+        except ValueError as e:
+            problems.append(f"Order {number}: {e}")
+    return problems
+
+
+def check_balances(orders):
+    """Compare the funds every order needs with one account snapshot; returns the shortfalls."""
+    required = defaultdict(Decimal)
+    for order in orders:
+        if order['side'] == 'BUY':
+            required[order['quote_asset']] += order['price'] * order['quantity']
+        else:
+            required[order['base_asset']] += order['quantity']
+
+    account = get_client(daemon=True, pool_maxsize=WORKERS).get_account()
+    free = {balance['asset']: Decimal(balance['free']) for balance in account['balances']}
+    return [
+        f"Not enough funds. Required: {amount} {asset}, Available: {free.get(asset, Decimal(0))} {asset}"
+        for asset, amount in required.items() if amount > free.get(asset, Decimal(0))
+    ]
+
+
+def submit(order):
+    """Place one limit order and return its result row with the request latency."""
+    start = time.perf_counter()
+    try:
+        response = get_thread_client(WORKERS).order_limit(
+            symbol=order['symbol'], side=order['side'], price=str(order['price']), quantity=str(order['quantity'])
+        )
+        status, order_id, error = response.get('status'), response.get('orderId'), ''
+    except Exception as e:
+        status, order_id, error = 'FAILED', None, str(e)
+    latency = (time.perf_counter() - start) * 1000
+    return {**order, 'status': status, 'order_id': order_id, 'latency_ms': latency, 'error': error}
+
+
+def submit_all(orders, workers=WORKERS):
+    """Place the orders from `workers` threads; the shared ratelimit budget paces them."""
+    from concurrent.futures import ThreadPoolExecutor
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(submit, orders))
+
+
+def print_orders(orders):
+    for order in orders:
+        print(f"{order['side']:<5}{order['quantity']:>18} {order['base_asset']} at {order['price']} {order['quote_asset']}")
+
+
+def print_results(results, elapsed):
+    print(f"{'Side':<5}{'Quantity':>18}{'Price':>18}  {'Status':<10}{'Order ID':>14}{'Latency':>12}")
+    for result in results:
+        print(
+            f"{result['side']:<5}{result['quantity']:>18}{result['price']:>18}  {result['status'] or '':<10}"
+            f"{result['order_id'] or '-':>14}{result['latency_ms']:>10.1f}ms  {result['error']}"
+        )
+    latencies = sorted(result['latency_ms'] for result in results)
+    placed = sum(1 for result in results if not result['error'])
+    print(f"Placed {placed} of {len(results)} orders in {elapsed:.2f} s; "
+          f"latency median {latencies[len(latencies) // 2]:.1f} ms, max {latencies[-1]:.1f} ms")
+
+
+def main(argv):
+    parser = argparse.ArgumentParser(prog='trade-batch.py', description="Batch and ladder limit-order placement")
+    subparsers = parser.add_subparsers(dest='mode', required=True)
+    ladder = subparsers.add_parser('ladder', help='Evenly spaced limit orders between two prices')
+    ladder.add_argument('symbol', help='Trading pair in BASE/QUOTE format (e.g., DOGE/BTC)')
+    ladder.add_argument('side', help='BUY or SELL')
+    ladder.add_argument('low', help='Lowest ladder price')
+    ladder.add_argument('high', help='Highest ladder price')
+    ladder.add_argument('levels', type=int, help='Number of orders')
+    ladder.add_argument('quantity', help='Total quantity over all levels')
+    ladder.add_argument('--distribution', default='flat', choices=['flat', 'linear', 'geometric'])
+    ladder.add_argument('--ratio', type=float, default=1.5, help='Size ratio between levels for geometric')
+    ladder.add_argument('--dry-run', action='store_true', help='Validate and print the orders without placing them')
+    from_csv = subparsers.add_parser('csv', help='Orders from a CSV file with symbol,side,price,quantity columns')
+    from_csv.add_argument('file')
+    from_csv.add_argument('--dry-run', action='store_true', help='Validate and print the orders without placing them')
+    args = parser.parse_args(argv)
+
+    if args.mode == 'ladder':
+        orders = ladder_orders(args.symbol, args.side, args.low, args.high, args.levels, args.quantity,
+                               args.distribution, args.ratio)
+    else:
+        orders = read_orders_csv(args.file)
+
+    problems = prepare_orders(orders) + check_balances(orders)
+    if problems:
+        for problem in problems:
+            print(problem)
+        sys.exit(1)
+
+    if args.dry_run:
+        print_orders(orders)
+        return
+
+    print(f"Placing {len(orders)} limit orders")
+    start = time.perf_counter()
+    results = submit_all(orders)
+    print_results(results, time.perf_counter() - start)
@@ -0,0 +1,128 @@
+"""Place a limit order, optionally following it until it fills."""
+
+import sys
+import argparse
+
+from trading_tools.client import get_client, new_client
+from trading_tools.orders import get_available_balance
+
+
+def print_help():
+    print("Usage: trade-limit.py <symbol> <BUY/SELL> <price> <quantity> [--wait] [--timeout SECONDS [--reprice PRICE]]")
+    print("Description: This script places a limit order for a specified cryptocurrency trading pair on Binance, optionally following it until it fills.")
+
+
+def place_limit_order(symbol, side, price, quantity):
+    """Place a limit order on Binance."""
+    order = get_client(daemon=True).order_limit(
+        symbol=symbol,
+        side=side,
+        price=str(price),
+        quantity=str(quantity)
+    )
+    return order
+
+
+def print_fill(record):
+    print(f"Order {record['order_id']}: {record['status']}, executed {record['executed']} of {record['quantity']} at {record['price']}")
+
+
+async def place_and_track(symbol, side, price, quantity, timeout=None, reprice=None):
+    """Place the order with the user data stream already listening and follow it to a final status."""
+    from fills import FINAL_STATUSES, FillTracker
+
+    tracker = FillTracker(get_client(daemon=True), stream_client=new_client(daemon=True))
+    await tracker.start()
+    try:
+        record = await tracker.place_limit(symbol, side, price, quantity)
+        print_fill(record)
+        record = await tracker.wait(record['order_id'], timeout)
+        if record['status'] not in FINAL_STATUSES:
+            if reprice is not None:
+                print(f"Not filled after {timeout} s, moving the rest to {reprice}")
+                replaced = record
+                record = await tracker.replace(record['order_id'], reprice)
+                tracker.log(replaced)
+                print_fill(record)
+                record = await tracker.wait(record['order_id'])
+            else:
+                print(f"Not filled after {timeout} s, cancelling")
+                record = await tracker.cancel(record['order_id'])
+        print_fill(record)
+        entry = tracker.log(record)
+        if entry['ack_to_fill_ms'] is not None:
+            print(f"Placement to ack {entry['place_to_ack_ms']:.1f} ms, ack to fill {entry['ack_to_fill_ms']:.1f} ms "
+                  f"(seen via {entry['seen_by']})")
+    finally:
+        await tracker.stop()
+
+
+def main(argv):
+    parser = argparse.ArgumentParser(prog='trade-limit.py', description="Place a limit order, optionally following it until it fills")
+    parser.add_argument('symbol', help='Trading pair in BASE/QUOTE format (e.g., DOGE/BTC)')
+    parser.add_argument('action', help='BUY or SELL')
+    parser.add_argument('price', type=float)
+    parser.add_argument('quantity', type=float)
+    parser.add_argument('--wait', action='store_true', help='Follow the order until it is filled')
+    parser.add_argument('--timeout', type=float, default=None, help='Cancel the order if not filled after this many seconds')
+    parser.add_argument('--reprice', type=float, default=None, help='Move the unfilled rest to this price at the timeout instead of cancelling')
+    args = parser.parse_args(argv)
+
+    symbol = args.symbol.upper()
+    action = args.action.upper()
+    price = args.price
+    quantity = args.quantity
+
+    if args.reprice is not None and args.timeout is None:
+        print("--reprice needs --timeout.")
+        sys.exit(1)
+
+    if action not in ['BUY', 'SELL']:
+        print("Invalid action. Use BUY or SELL.")
+        sys.exit(1)
+
+    try:
+        base_asset, quote_asset = symbol.split('/')
+    except ValueError:
+        print("Invalid symbol format. Use format BASE/QUOTE (e.g., DOGE/BTC).")
+        sys.exit(1)
+
+    symbol = base_asset + quote_asset
+
+    from symbol_filters import get_filters
+
+    symbol_info = get_filters(symbol)
+    quantity = symbol_info.round_quantity(quantity)
+    price = symbol_info.round_price(price)
+    symbol_info.validate(quantity, price)
+
+    if action == 'BUY':
+        # Get available funds in the quote asset (e.g., BTC)
+        available_funds = get_available_balance(quote_asset)
+        print(f"Getting funds in {quote_asset} wallet: {available_funds} {quote_asset}")
+
+        total_cost = quantity * price
+        if total_cost > available_funds:
+            print(f"Not enough funds. Required: {total_cost} {quote_asset}, Available: {available_funds} {quote_asset}")
+            sys.exit(1)
+
+    elif action == 'SELL':
+        # Get available funds in the base asset (e.g., DOGE)
+        available_funds = get_available_balance(base_asset)
+        print(f"Getting funds in {base_asset} wallet: {available_funds} {base_asset}")
+
+        if quantity > available_funds:
+            print(f"Not enough funds. Required: {quantity} {base_asset}, Available: {available_funds} {base_asset}")
+            sys.exit(1)
+
+    # Place the limit order
+    print(f"Placing {action} order for {quantity} {base_asset} at {price} {quote_asset} per unit.")
+    side = action  # binance.enums SIDE_BUY and SIDE_SELL are these strings
+    if args.wait or args.timeout is not None:
+        import asyncio
+
+        reprice = None if args.reprice is None else symbol_info.round_price(args.reprice)
+        asyncio.run(place_and_track(symbol, side, price, quantity, args.timeout, reprice))
+        return
+    order = place_limit_order(symbol, side, price, quantity)
+    print("Order details:", order)
@@ -0,0 +1,126 @@
+"""Place a market order, optionally sliced by TWAP or iceberg."""
+
+import sys
+import argparse
+from decimal import Decimal
+
+from trading_tools.client import get_client, set_client
+from trading_tools.orders import get_available_balance
+
+
+def print_help():
+    print("Usage: trade-market.py <symbol> <BUY/SELL> [--twap SLICES --duration SECONDS | --iceberg SLICE-QUANTITY [--pause SECONDS]] [--simulate]")
+    print("Description: This script places a market order for a specified cryptocurrency trading pair on Binance.")
+
+
+def place_order(symbol, side, quantity):
+    """Place a market order on Binance."""
+    order = get_client(daemon=True).order_market(
+        symbol=symbol,
+        side=side,
+        quantity=quantity
+    )
+    return order
+
+
+def print_child(child):
+    if child['error']:
+        print(f"Child {child['child']}: {child['quantity']} failed after {child['latency_ms']:.1f} ms: {child['error']}")
+        return
+    average = f"{child['avg_price']:.8f}" if child['avg_price'] is not None else '-'
+    slippage = f"{child['slippage_bps']:.1f}" if child['slippage_bps'] is not None else '-'
+    print(f"Child {child['child']}: {child['executed']}/{child['quantity']} at {average}, "
+          f"latency {child['latency_ms']:.1f} ms, timer late {child['timer_late_ms']:.1f} ms, slippage {slippage} bps")
+
+
+def execute(symbol_info, side, quantity, args):
+    """Place the whole quantity as one market order, or slice it by TWAP or iceberg."""
+    if not args.twap and not args.iceberg:
+        return place_order(symbol_info.symbol, side, quantity)
+
+    import asyncio
+    from execution import ExecutionScheduler
+
+    scheduler = ExecutionScheduler(get_client(daemon=True), symbol_info, side, quantity)
+    if args.twap:
+        summary = asyncio.run(scheduler.twap(args.twap, args.duration, on_child=print_child))
+    else:
+        summary = asyncio.run(scheduler.iceberg(args.iceberg, args.pause, on_child=print_child))
+    if summary['failed']:
+        print(f"Stopped after child {summary['failed']['child']} failed; executed {summary['executed']}, "
+              f"unfilled {summary['unfilled']}")
+    return summary
+
+
+def main(argv):
+    parser = argparse.ArgumentParser(prog='trade-market.py', description="Place a market order, optionally sliced")
+    parser.add_argument('symbol', help='Trading pair in BASE/QUOTE format (e.g., DOGE/BTC)')
+    parser.add_argument('action', help='BUY or SELL')
+    parser.add_argument('--twap', type=int, default=None, metavar='SLICES', help='Split into this many evenly timed child orders')
+    parser.add_argument('--duration', type=float, default=60.0, help='Seconds over which the TWAP children are spread')
+    parser.add_argument('--iceberg', type=Decimal, default=None, metavar='SLICE-QUANTITY', help='Send child orders of this size one after another')
+    parser.add_argument('--pause', type=float, default=0.0, help='Seconds between iceberg children')
+    parser.add_argument('--simulate', action='store_true', help='Execute against a local simulated exchange')
+    args = parser.parse_args(argv)
+
+    symbol = args.symbol.upper()
+    action = args.action.upper()
+
+    if action not in ['BUY', 'SELL']:
+        print("Invalid action. Use BUY or SELL.")
+        sys.exit(1)
+
+    try:
+        base_asset, quote_asset = symbol.split('/')
+    except ValueError:
+        print("Invalid symbol format. Use format BASE/QUOTE (e.g., DOGE/BTC).")
+        sys.exit(1)
+
+    symbol = base_asset + quote_asset
+
+    if args.simulate:
+        from execution import SimulatedExchange
+
+        exchange = SimulatedExchange(base_asset, quote_asset)
+        set_client(exchange)
+        symbol_info = exchange.symbol_filters()
+    else:
+        from symbol_filters import get_filters
+
+        symbol_info = get_filters(symbol)
+
+    if action == 'BUY':
+        # Get available funds in the quote asset (e.g., BTC)
+        available_funds = get_available_balance(quote_asset)
+        print(f"Getting funds in {quote_asset} wallet: {available_funds} {quote_asset}")
+
+        # Get current price of the trading pair
+        avg_price = get_client(daemon=True).get_avg_price(symbol=symbol)
+        if avg_price is None:
+            raise ValueError(f"Could not retrieve average price for symbol: {symbol}")
+
+        current_price = float(avg_price['price'])
+
+        # Calculate the quantity to buy
+        quantity_to_buy = available_funds / current_price
+        quantity_to_buy = symbol_info.round_quantity(quantity_to_buy, market=True)
+        symbol_info.validate(quantity_to_buy, current_price, market=True)
+
+        # Place the buy order
+        print(f"Placing BUY order for {quantity_to_buy} {base_asset}")
+        order = execute(symbol_info, 'BUY', quantity_to_buy, args)
+        print("Order details:", order)
+
+    elif action == 'SELL':
+        # Get available funds in the base asset (e.g., BNB)
+        available_funds = get_available_balance(base_asset)
+        print(f"Getting funds in {base_asset} wallet: {available_funds} {base_asset}")
+
+        # Round down the available funds to the market lot step size
+        available_funds = symbol_info.round_quantity(available_funds, market=True)
+        symbol_info.validate(available_funds, market=True)
+
+        # Place the sell order
+        print(f"Placing SELL order for {available_funds} {base_asset}")
+        order = execute(symbol_info, 'SELL', available_funds, args)
+        print("Order details:", order)
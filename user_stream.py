@@ -0,0 +1,191 @@
+"""Binance user data stream and live account balances.
+
+follow_user_stream() owns the listen-key lifecycle: it opens a key, renews
+it every KEEPALIVE_INTERVAL, and opens a new one when the stream reports it
+expired or the connection drops. BalanceTracker takes one get_account
+snapshot per connection and then applies outboundAccountPosition and
+balanceUpdate events, so its balances stay current without polling.
+
+The snapshot is taken after the socket is open, while incoming events wait
+in its receive queue; events already reflected in the snapshot are skipped
+by comparing their times with the snapshot's updateTime.
+"""
+
+import json
+import time
+import asyncio
+from functools import partial
+
+import websockets
+
+STREAM_URL = 'wss://stream.binance.com:9443/ws'
+KEEPALIVE_INTERVAL = 30 * 60  # Listen keys expire 60 minutes after the last keepalive
+RECONNECT_DELAY = 5
+
+
+async def keep_alive(client, listen_key, interval=KEEPALIVE_INTERVAL):
+    """Renew a listen key until cancelled."""
+    loop = asyncio.get_running_loop()
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            await loop.run_in_executor(None, partial(client.stream_keepalive, listen_key))
+        except Exception as e:
+            print(f"Listen key keepalive failed: {e}", flush=True)
+
+
+async def follow_user_stream(client, on_connect, on_event, url=STREAM_URL, record=None, reconnect=True):
+    """Follow the account's user data stream and pass every event to on_event(event).
+
+    on_connect() runs in a worker thread once each connection is open and
+    before any of its events are handled.
+    """
+    loop = asyncio.get_running_loop()
+    record_file = open(record, 'a') if record else None
+    try:
+        while True:
+            keepalive = None
+            try:
+                listen_key = await loop.run_in_executor(None, client.stream_get_listen_key)
+                async with websockets.connect(f"{url}/{listen_key}") as websocket:
+                    keepalive = asyncio.create_task(keep_alive(client, listen_key))
+                    await loop.run_in_executor(None, on_connect)
+
+                    async for message in websocket:
+                        if record_file:
+                            record_file.write(message.rstrip('\n') + '\n')
+                        event = json.loads(message)
+                        if event.get('e') == 'listenKeyExpired':
+                            print("Listen key expired, reconnecting", flush=True)
+                            break
+                        on_event(event)
+                if not reconnect:
+                    return
+            except (OSError, websockets.ConnectionClosed) as e:
+                if not reconnect:
+                    raise
+                print(f"User data stream lost ({e}), reconnecting in {RECONNECT_DELAY} s", flush=True)
+                await asyncio.sleep(RECONNECT_DELAY)
+            finally:
+                if keepalive:
+                    keepalive.cancel()
+    finally:
+        if record_file:
+            record_file.close()
+
+
+class BalanceTracker:
+    """Account balances kept current from one snapshot plus user data stream events."""
+
+    def __init__(self, client):
+        self.client = client
+        self.balances = {}  # asset -> [free, locked]
+        self.snapshot_time = 0  # updateTime of the latest get_account snapshot (ms)
+        self.position_times = {}  # asset -> time of its latest absolute balance (ms)
+        self.updated = None  # Local time of the latest change (s)
+
+    def load_snapshot(self, account=None):
+        """Replace the balances with a get_account snapshot."""
+        account = account or self.client.get_account()
+        self.balances = {
+            balance['asset']: [float(balance['free']), float(balance['locked'])]
+            for balance in account['balances']
+            if float(balance['free']) + float(balance['locked']) > 0
+        }
+        self.snapshot_time = account['updateTime']
+        self.position_times = {}
+        self.updated = time.time()
+
+    def position_time(self, asset):
+        return max(self.snapshot_time, self.position_times.get(asset, 0))
+
+    def apply(self, event):
+        """Apply one user data event and return the assets it changed.
+
+        outboundAccountPosition carries absolute balances and is authoritative.
+        A balanceUpdate delta is applied only when it is newer than the last
+        absolute balance of its asset; an older one is already included there.
+        """
+        if event['e'] == 'outboundAccountPosition':
+            changed = []
+            for balance in event['B']:
+                if event['u'] > self.position_time(balance['a']):
+                    self.balances[balance['a']] = [float(balance['f']), float(balance['l'])]
+                    self.position_times[balance['a']] = event['u']
+                    changed.append(balance['a'])
+        elif event['e'] == 'balanceUpdate' and event['T'] > self.position_time(event['a']):
+            free, locked = self.balances.get(event['a'], [0.0, 0.0])
+            self.balances[event['a']] = [free + float(event['d']), locked]
+            changed = [event['a']]
+        else:
+            return []
+        if changed:
+            self.updated = time.time()
+        return changed
+
+    def free(self, asset):
+        return self.balances.get(asset, [0.0, 0.0])[0]
+
+    def total(self, asset):
+        return sum(self.balances.get(asset, [0.0, 0.0]))
+
+    async def run(self, on_change=None, url=STREAM_URL, record=None, reconnect=True):
+        """Keep the balances current until cancelled; on_change(tracker, assets) follows each change."""
+        def on_event(event):
+            changed = self.apply(event)
+            if changed and on_change:
+                on_change(self, changed)
+
+        await follow_user_stream(self.client, self.load_snapshot, on_event, url=url, record=record, reconnect=reconnect)
+
+
+class StandInClient:
+    """Client stand-in for a replayed stream: serves a recorded get_account snapshot."""
+
+    def __init__(self, snapshot_path):
+        with open(snapshot_path) as f:
+            self.account = json.load(f)
+
+    def get_account(self):
+        return self.account
+
+    def stream_get_listen_key(self):
+        return 'stand-in'
+
+    def stream_keepalive(self, listen_key):
+        return {}
+
+
+async def replay(path, host='127.0.0.1', port=8766, delay=0.0, on_start=None):
+    """Serve recorded user data events to each client, a local stand-in for the Binance stream.
+
+    Port 0 picks a free port; on_start(port) is called once the server listens.
+    """
+    with open(path) as f:
+        messages = [line.rstrip('\n') for line in f if line.strip()]
+
+    async def handler(websocket):
+        for message in messages:
+            await websocket.send(message)
+            await asyncio.sleep(delay)
+
+    async with websockets.serve(handler, host, port) as server:
+        port = server.sockets[0].getsockname()[1]
+        print(f"Replaying {len(messages)} user data events from {path} on ws://{host}:{port}", flush=True)
+        if on_start:
+            on_start(port)
+        await asyncio.Future()
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Local stand-in for the Binance user data stream")
+    parser.add_argument('file', help='Recorded events, one JSON object per line')
+    parser.add_argument('--port', type=int, default=8766)
+    parser.add_argument('--delay', type=float, default=0.0, help='Seconds between events')
+    args = parser.parse_args()
+    try:
+        asyncio.run(replay(args.file, port=args.port, delay=args.delay))
+    except KeyboardInterrupt:
+        pass
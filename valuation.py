@@ -0,0 +1,120 @@
+"""Portfolio valuation through the exchange's conversion graph.
+
+Every TRADING symbol is an edge between its base and quote asset. For each
+target currency the shortest conversion path from every asset is worked out
+once, breadth-first from the target, and stored as padded arrays of ticker
+positions and invert flags. Valuing a balance list against a price snapshot
+is then one gather and one product over those arrays; a new snapshot only
+needs its {symbol: price} dictionary rebuilt into the index's price vector.
+The graph comes from the persisted symbol filters cache, which keeps the
+base and quote asset of every symbol, so exchange info is only fetched
+again once that cache is stale.
+"""
+
+import time
+from collections import deque
+
+import numpy as np
+
+import symbol_filters
+
+TARGETS = ('BTC', 'USDT', 'EUR')
+
+
+class ValuationIndex:
+    """Precomputed conversion paths from every asset to each target currency."""
+
+    def __init__(self, pairs, targets=TARGETS):
+        """Build the index from (symbol, base_asset, quote_asset) tuples."""
+        self.symbols = [symbol for symbol, _, _ in pairs]
+        self.assets = sorted({asset for _, base, quote in pairs for asset in (base, quote)} | set(targets))
+        self.asset_index = {asset: i for i, asset in enumerate(self.assets)}
+
+        # Each asset's neighbours: (neighbour, symbol position, invert), the rate
+        # from the asset to the neighbour is the price, or 1 / price when inverted
+        edges = {asset: [] for asset in self.assets}
+        for position, (_, base, quote) in enumerate(pairs):
+            edges[base].append((quote, position, False))
+            edges[quote].append((base, position, True))
+
+        self.paths = {target: self._shortest_paths(edges, target) for target in targets}
+
+    @classmethod
+    def from_symbol_filters(cls, filters, targets=TARGETS):
+        """Build the index from a {symbol: SymbolFilters} mapping such as ExchangeInfoCache.filters."""
+        pairs = [
+            (symbol, f.base_asset, f.quote_asset)
+            for symbol, f in filters.items() if f.status == 'TRADING'
+        ]
+        return cls(pairs, targets)
+
+    @classmethod
+    def from_exchange_info(cls, exchange_info, targets=TARGETS):
+        pairs = [
+            (s['symbol'], s['baseAsset'], s['quoteAsset'])
+            for s in exchange_info['symbols'] if s['status'] == 'TRADING'
+        ]
+        return cls(pairs, targets)
+
+    def _shortest_paths(self, edges, target):
+        """Return (symbol positions, invert flags, reachable) arrays for paths into `target`."""
+        # Breadth-first from the target; next_hop[asset] is the first step towards it
+        next_hop = {target: None}
+        queue = deque([target])
+        while queue:
+            asset = queue.popleft()
+            for neighbour, position, invert in edges[asset]:
+                if neighbour not in next_hop:
+                    # The neighbour reaches `asset` through the same symbol in the other direction
+                    next_hop[neighbour] = (asset, position, not invert)
+                    queue.append(neighbour)
+
+        paths = []
+        for asset in self.assets:
+            path = []
+            while asset in next_hop and next_hop[asset] is not None:
+                asset, position, invert = next_hop[asset]
+                path.append((position, invert))
+            paths.append(path)
+
+        # Padding points one past the last symbol, where the price vector holds 1.0
+        length = max((len(path) for path in paths), default=0)
+        positions = np.full((len(self.assets), length), len(self.symbols), dtype=np.int64)
+        inverts = np.zeros((len(self.assets), length), dtype=bool)
+        for row, path in enumerate(paths):
+            for column, (position, invert) in enumerate(path):
+                positions[row, column] = position
+                inverts[row, column] = invert
+        reachable = np.array([asset in next_hop for asset in self.assets])
+        return positions, inverts, reachable
+
+    def price_vector(self, tickers):
+        """Align a get_all_tickers snapshot with the index; missing prices become NaN."""
+        prices = {ticker['symbol']: float(ticker['price']) for ticker in tickers}
+        vector = np.array([prices.get(symbol, np.nan) for symbol in self.symbols] + [1.0])
+        vector[vector <= 0] = np.nan
+        return vector
+
+    def rates(self, prices, target='BTC'):
+        """Conversion rate from every asset in self.assets to `target` (NaN when unreachable)."""
+        positions, inverts, reachable = self.paths[target]
+        factors = prices[positions]
+        factors = np.where(inverts, 1.0 / factors, factors)
+        rates = factors.prod(axis=1)
+        rates[~reachable] = np.nan
+        return rates
+
+    def value(self, assets, quantities, prices, target='BTC'):
+        """Value each (asset, quantity) in `target`; assets with no priced path are worth 0."""
+        rates = np.append(self.rates(prices, target), np.nan)
+        rows = np.array([self.asset_index.get(asset, len(self.assets)) for asset in assets], dtype=np.int64)
+        values = np.asarray(quantities, dtype=np.float64) * rates[rows]
+        return np.nan_to_num(values, nan=0.0)
+
+
+def load_index(targets=TARGETS):
+    """Build a ValuationIndex from the cached exchange info, refetching it only when empty or stale."""
+    cache = symbol_filters.get_cache()
+    if not cache.filters or time.time() - cache.fetched_at > cache.ttl:
+        cache.refresh()
+    return ValuationIndex.from_symbol_filters(cache.filters, targets)